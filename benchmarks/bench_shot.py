@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Benchmarks of shot scene duplication, shot naming and shot scene catalogues.
+"""
+
+import itertools
+
+import bpy
+
+from spa_sequencer.shot.core import (
+    duplicate_scene,
+    duplicate_scene_bulk,
+    get_valid_shot_scenes,
+)
+from spa_sequencer.shot.naming import ShotNameAllocator, ShotNaming
+
+from harness import benchmark
+from timelines import build_master_timeline
+
+
+# Problem sizes: number of objects in the duplicated layout scene.
+LAYOUT_SIZES = (10, 100, 1000, 3000)
+# Number of objects per collection in generated layout scenes.
+COLLECTION_SIZE = 50
+
+
+def build_layout_scene(object_count: int) -> bpy.types.Scene:
+    """Build a layout scene with `object_count` objects in the active scene.
+
+    Objects are spread in nested collections of `COLLECTION_SIZE` objects:
+      - every 10th object instances the data of the previous one
+      - every 5th object is parented to the previous one
+      - every 20th object is animated
+
+    :param object_count: Number of objects to create, besides the camera.
+    :return: The layout scene.
+    """
+    scene = bpy.context.scene
+    scene.name = "LAYOUT"
+    # Start from an empty scene
+    for col in scene.collection.children[:]:
+        scene.collection.children.unlink(col)
+    for obj in scene.collection.objects[:]:
+        scene.collection.objects.unlink(obj)
+
+    camera = bpy.data.objects.new("LAYOUT_Camera", bpy.data.cameras.new("Camera"))
+    scene.collection.objects.link(camera)
+    scene.camera = camera
+
+    parent_col = scene.collection
+    col = None
+    obj = None
+    for idx in range(object_count):
+        if idx % COLLECTION_SIZE == 0:
+            col = bpy.data.collections.new(f"LAYOUT_Set_{idx // COLLECTION_SIZE:03d}")
+            parent_col.children.link(col)
+            # Nest every other collection in the previous one
+            parent_col = col if idx % (2 * COLLECTION_SIZE) == 0 else scene.collection
+        if obj and idx % 10 == 9:
+            data = obj.data
+        else:
+            data = bpy.data.meshes.new(f"LAYOUT_Mesh_{idx:05d}")
+        new_obj = bpy.data.objects.new(f"LAYOUT_Object_{idx:05d}", data)
+        col.objects.link(new_obj)
+        if obj and idx % 5 == 4:
+            new_obj.parent = obj
+        if idx % 20 == 19:
+            new_obj.keyframe_insert(data_path="location", frame=1)
+        obj = new_obj
+
+    return scene
+
+
+@benchmark(sizes=LAYOUT_SIZES, repeat=3)
+def bench_duplicate_scene(size: int):
+    scene = build_layout_scene(size)
+    context = bpy.context
+    names = (f"SHOT_{idx:04d}" for idx in itertools.count())
+
+    def run():
+        duplicate_scene(context, scene, next(names))
+
+    return run
+
+
+@benchmark(sizes=LAYOUT_SIZES, repeat=3)
+def bench_duplicate_scene_bulk(size: int):
+    scene = build_layout_scene(size)
+    names = (f"SHOT_{idx:04d}" for idx in itertools.count())
+
+    def run():
+        duplicate_scene_bulk(scene, next(names))
+
+    return run
+
+
+def setup_shot_naming(size: int) -> tuple[ShotNaming, bpy.types.SequenceEditor]:
+    """Build a master timeline of `size` strips, named after the shot naming."""
+    naming = ShotNaming()
+    # Leave room for allocating `size` more shot names.
+    naming.number_digits = 5
+    sed = build_master_timeline(size).sequence_editor
+    for idx, strip in enumerate(sed.strips):
+        strip.name = naming.build_shot_name((idx + 1) * naming.number_spacing)
+    return naming, sed
+
+
+@benchmark(sizes=(10, 100, 1000))
+def bench_next_shot_name_from_sequences(size: int):
+    naming, sed = setup_shot_naming(size)
+
+    def run():
+        # Name `size` new shots, scanning the sequence editor for each one.
+        for _ in range(size):
+            naming.next_shot_name_from_sequences(sed)
+
+    return run
+
+
+@benchmark(sizes=(10, 100, 1000))
+def bench_shot_name_allocator(size: int):
+    naming, sed = setup_shot_naming(size)
+
+    def run():
+        # Name `size` new shots from a single scan.
+        shot_names = ShotNameAllocator(naming, sed)
+        for _ in range(size):
+            shot_names.next_name()
+
+    return run
+
+
+@benchmark(sizes=(1000, 10000))
+def bench_parse_many_shot_names(size: int):
+    naming = ShotNaming()
+    naming.number_digits = 5
+    # Mix of valid and invalid shot names.
+    names = [
+        naming.build_shot_name(idx) if idx % 4 else f"SCENE_{idx}"
+        for idx in range(size)
+    ]
+
+    def run():
+        naming.parse_many(names)
+
+    return run
+
+
+@benchmark(sizes=(10, 100, 400), ops_per_run=100)
+def bench_valid_shot_scenes(size: int):
+    build_layout_scene(COLLECTION_SIZE)
+    for idx in range(size):
+        scene = bpy.data.scenes.new(f"SH{idx:04d}")
+        scene.collection.children.link(bpy.data.collections["LAYOUT_Set_000"])
+
+    def run():
+        # Menus and enum callbacks get the valid shot scenes on every redraw.
+        for _ in range(100):
+            get_valid_shot_scenes()
+
+    return run
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Benchmarks of the Timeline Synchronization hot path.
+"""
+
+import bpy
+
+from spa_sequencer.sync.core import (
+    get_master_scene_strip_at_frame,
+    get_scene_strip_at_frame,
+    get_sync_settings,
+    on_load_post,
+    sync_system_update,
+    update_sync_cache_from_current_state,
+)
+
+from harness import benchmark
+from timelines import build_master_timeline, sample_frames
+
+
+# Number of frames visited by one benchmark run.
+FRAME_SAMPLES = 100
+
+
+def setup_synced_timeline(size: int) -> bpy.types.Scene:
+    """Build a master timeline of `size` strips and enable the synchronization."""
+    master_scene = build_master_timeline(size)
+    sync_settings = get_sync_settings()
+    sync_settings.master_scene = master_scene
+    sync_settings.enabled = True
+    return master_scene
+
+
+@benchmark(ops_per_run=FRAME_SAMPLES)
+def bench_get_scene_strip_at_frame(size: int):
+    sed = build_master_timeline(size).sequence_editor
+    frames = sample_frames(sed.id_data, FRAME_SAMPLES)
+
+    def run():
+        for frame in frames:
+            get_scene_strip_at_frame(frame, sed)
+
+    return run
+
+
+@benchmark(ops_per_run=FRAME_SAMPLES)
+def bench_get_master_scene_strip_at_frame(size: int):
+    master_scene = build_master_timeline(size)
+    frames = sample_frames(master_scene, FRAME_SAMPLES)
+
+    def run():
+        for frame in frames:
+            get_master_scene_strip_at_frame(frame, master_scene)
+
+    return run
+
+
+@benchmark(ops_per_run=FRAME_SAMPLES)
+def bench_sync_system_update_forward(size: int):
+    master_scene = setup_synced_timeline(size)
+    frames = sample_frames(master_scene, FRAME_SAMPLES)
+    context = bpy.context
+
+    def run():
+        for frame in frames:
+            # Setting the frame directly does not call frame change handlers.
+            master_scene.frame_current = frame
+            sync_system_update(context)
+
+    return run
+
+
+@benchmark(ops_per_run=FRAME_SAMPLES)
+def bench_sync_system_update_bidirectional(size: int):
+    master_scene = setup_synced_timeline(size)
+    get_sync_settings().bidirectional = True
+    context = bpy.context
+
+    def run():
+        # Step forward in the active shot scene, as when scrubbing a dopesheet.
+        # Updating master time triggers the forward synchronization as well.
+        master_scene.frame_current = master_scene.frame_start
+        sync_system_update(context, force=True)
+        for _ in range(FRAME_SAMPLES):
+            scene = context.window.scene
+            scene.frame_current += 1
+            sync_system_update(context)
+
+    return run
+
+
+@benchmark(ops_per_run=FRAME_SAMPLES)
+def bench_update_sync_cache_from_current_state(size: int):
+    master_scene = setup_synced_timeline(size)
+    frames = sample_frames(master_scene, FRAME_SAMPLES)
+
+    def run():
+        for frame in frames:
+            master_scene.frame_current = frame
+            update_sync_cache_from_current_state()
+
+    return run
+
+
+@benchmark()
+def bench_on_load_post(size: int):
+    build_master_timeline(size)
+
+    def run():
+        on_load_post()
+
+    return run
@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Benchmarks of the reverse usage index.
+"""
+
+import bpy
+
+from spa_sequencer.shared_folders.core import get_scene_sequence_users
+from spa_sequencer.usage import get_usage_index, usage_index_cache
+
+from harness import benchmark
+from timelines import build_master_timeline
+
+
+def setup_shared_prop(size: int) -> tuple[bpy.types.Collection, bpy.types.Scene]:
+    """Build a master timeline of `size` strips, whose scenes share a prop."""
+    master = build_master_timeline(size)
+    collection = bpy.data.collections.new("PROPS")
+    collection.objects.link(bpy.data.objects.new("PROP", None))
+    for strip in master.sequence_editor.strips_all:
+        if isinstance(strip, bpy.types.SceneStrip) and (
+            collection.name not in strip.scene.collection.children
+        ):
+            strip.scene.collection.children.link(collection)
+    return collection, master
+
+
+@benchmark()
+def bench_usage_index_build(size: int):
+    setup_shared_prop(size)
+
+    def run():
+        usage_index_cache.invalidate()
+        get_usage_index()
+
+    return run
+
+
+@benchmark(ops_per_run=100)
+def bench_scene_sequence_users(size: int):
+    collection, master = setup_shared_prop(size)
+
+    def run():
+        # Shared folder panels query the users of each folder on every redraw.
+        for _ in range(100):
+            get_scene_sequence_users(collection, master.sequence_editor)
+
+    return run
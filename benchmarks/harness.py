@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Minimal benchmark harness executed inside Blender.
+
+Benchmarks are functions decorated with `benchmark`, taking a problem size and
+returning the callable to time. Setup work (e.g. building a timeline) happens
+before returning this callable and is not timed.
+"""
+
+import fnmatch
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import bpy
+
+
+# Problem sizes used by default: number of scene strips in the master timeline.
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark."""
+
+    name: str
+    setup: Callable[[int], Callable[[], None]]
+    sizes: tuple[int, ...] = DEFAULT_SIZES
+    # Number of timed runs.
+    repeat: int = 5
+    # Number of operations performed by one run, to report per-operation timings.
+    ops_per_run: int = 1
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of a benchmark for a given problem size."""
+
+    name: str
+    size: int
+    ops_per_run: int
+    # Duration of each run, in seconds.
+    runs: list[float] = field(default_factory=list)
+
+    @property
+    def median_ms(self) -> float:
+        """Median duration of one operation, in milliseconds."""
+        return statistics.median(self.runs) * 1000.0 / self.ops_per_run
+
+    @property
+    def min_ms(self) -> float:
+        """Minimum duration of one operation, in milliseconds."""
+        return min(self.runs) * 1000.0 / self.ops_per_run
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "size": self.size,
+            "ops_per_run": self.ops_per_run,
+            "runs": self.runs,
+            "median_ms": self.median_ms,
+            "min_ms": self.min_ms,
+        }
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(
+    sizes: tuple[int, ...] = DEFAULT_SIZES, repeat: int = 5, ops_per_run: int = 1
+):
+    """Decorator registering a benchmark setup function.
+
+    The benchmark is named after the function, without its `bench_` prefix.
+
+    :param sizes: The problem sizes to run the benchmark with.
+    :param repeat: Number of timed runs.
+    :param ops_per_run: Number of operations performed by one run.
+    """
+
+    def decorator(func: Callable[[int], Callable[[], None]]):
+        name = func.__name__.removeprefix("bench_")
+        BENCHMARKS.append(Benchmark(name, func, sizes, repeat, ops_per_run))
+        return func
+
+    return decorator
+
+
+def reset_file():
+    """Load the default startup file, without any app template."""
+    bpy.ops.wm.read_homefile(app_template="")
+
+
+def run_benchmarks(
+    pattern: Optional[str] = None, sizes: Optional[tuple[int, ...]] = None
+) -> list[BenchmarkResult]:
+    """Run registered benchmarks.
+
+    :param pattern: Only run benchmarks with a name matching this glob pattern.
+    :param sizes: Only run benchmarks with these problem sizes.
+    :return: The benchmark results.
+    """
+    results = []
+    for bench in BENCHMARKS:
+        if pattern and not fnmatch.fnmatch(bench.name, pattern):
+            continue
+        for size in bench.sizes:
+            if sizes and size not in sizes:
+                continue
+            reset_file()
+            run = bench.setup(size)
+            # Warm-up run: fill caches and lazily built data.
+            run()
+            result = BenchmarkResult(bench.name, size, bench.ops_per_run)
+            for _ in range(bench.repeat):
+                start = time.perf_counter()
+                run()
+                result.runs.append(time.perf_counter() - start)
+            print(f"{result.key:<48} {result.median_ms:10.4f} ms/op")
+            results.append(result)
+    return results
+
+
+def compare_results(
+    results: list[BenchmarkResult], baseline: dict, tolerance: float
+) -> list[str]:
+    """Compare `results` with a baseline.
+
+    :param results: The benchmark results.
+    :param baseline: The baseline, as saved from previous results.
+    :param tolerance: Relative slowdown tolerated before reporting a regression.
+    :return: Description of each regression.
+    """
+    baseline_results = {
+        f"{r['name']}[{r['size']}]": r for r in baseline.get("results", [])
+    }
+    regressions = []
+    for result in results:
+        if not (reference := baseline_results.get(result.key)):
+            continue
+        if result.median_ms > reference["median_ms"] * (1.0 + tolerance):
+            regressions.append(
+                f"{result.key}: {result.median_ms:.4f} ms/op "
+                f"(baseline: {reference['median_ms']:.4f} ms/op)"
+            )
+    return regressions
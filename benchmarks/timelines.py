@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Synthetic production-like master timelines for benchmarks.
+"""
+
+import random
+
+import bpy
+
+
+# Channel layout of generated timelines.
+MAIN_CHANNELS = (1, 2)
+ALTERNATE_TAKES_CHANNEL = 3
+META_CHANNEL = 5
+MUTED_CHANNEL = 6
+# Temporary channel for strips moved into meta strips.
+META_CONTENT_CHANNEL = 9
+
+
+def build_master_timeline(
+    strip_count: int, seed: int = 0, scene_pool_size: int = 100
+) -> bpy.types.Scene:
+    """Build a master timeline with `strip_count` scene strips in the active scene.
+
+    The main cut alternates between two channels. On top of it:
+      - every 10th strip is an alternate take on another channel, muted every
+        other time
+      - every 20th strip is on a muted channel
+      - every 50th strip is nested in a meta strip
+
+    Strips use scenes from a pool of shot scenes, to keep the file size reasonable
+    on large timelines.
+
+    :param strip_count: Number of scene strips to create.
+    :param seed: Random seed used for strip durations.
+    :param scene_pool_size: Maximum number of shot scenes.
+    :return: The master scene.
+    """
+    rng = random.Random(seed)
+    master_scene = bpy.context.scene
+    master_scene.name = "MASTER"
+    sed = master_scene.sequence_editor_create()
+    sed.channels[MUTED_CHANNEL].mute = True
+
+    scenes = [
+        bpy.data.scenes.new(f"SHOT_{idx:04d}")
+        for idx in range(min(strip_count, scene_pool_size))
+    ]
+
+    frame = 1
+    shot_start = 1
+    for idx in range(strip_count):
+        scene = scenes[idx % len(scenes)]
+        duration = rng.randint(12, 96)
+        name = f"STRIP_{idx:05d}"
+
+        if idx % 50 == 49:
+            strip = sed.strips.new_scene(
+                name, scene, META_CONTENT_CHANNEL, shot_start
+            )
+            strip.duration = duration
+            meta = sed.strips.new_meta(
+                name=f"META_{idx:05d}", channel=META_CHANNEL, frame_start=shot_start
+            )
+            strip.move_to_meta(meta)
+            meta.right_handle = strip.right_handle
+        elif idx % 20 == 19:
+            strip = sed.strips.new_scene(name, scene, MUTED_CHANNEL, shot_start)
+            strip.duration = duration
+        elif idx % 10 == 9:
+            strip = sed.strips.new_scene(
+                name, scene, ALTERNATE_TAKES_CHANNEL, shot_start
+            )
+            strip.duration = duration
+            strip.mute = idx % 20 == 9
+        else:
+            channel = MAIN_CHANNELS[idx % len(MAIN_CHANNELS)]
+            strip = sed.strips.new_scene(name, scene, channel, frame)
+            strip.duration = duration
+            shot_start = frame
+            frame += duration
+
+    master_scene.frame_start = 1
+    master_scene.frame_end = max(frame - 1, 1)
+    return master_scene
+
+
+def sample_frames(scene: bpy.types.Scene, count: int, seed: int = 0) -> list[int]:
+    """Sample `count` random frames within `scene`'s frame range."""
+    rng = random.Random(seed)
+    return [rng.randint(scene.frame_start, scene.frame_end) for _ in range(count)]
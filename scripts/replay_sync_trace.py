@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Replay a Timeline Synchronization trace inside Blender, and report latencies.
+
+Usage::
+
+    blender -b edit.blend --factory-startup -P scripts/replay_sync_trace.py -- \\
+        TRACE [options]
+
+Options:
+
+    --repeat N              Number of replays (5)
+    --slowest N             Number of slowest events to report (10)
+    --output PATH           Write results to this JSON file
+    --baseline PATH         Compare results with this JSON baseline
+    --tolerance RATIO       Relative slowdown tolerated by the comparison (0.25)
+
+Results use the benchmark results format: they can be compared with the results
+of previous replays, as with ``run_benchmarks.py``.
+The exit code is 1 when a regression is detected against the baseline.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+import bpy
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from run_benchmarks import BENCHMARKS_FOLDER, setup_addon  # noqa: E402
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="replay_sync_trace")
+    parser.add_argument("trace")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--slowest", type=int, default=10)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser.parse_args(args)
+
+
+def main(args: list[str]) -> int:
+    """Replay a trace in the current file and compare it with a baseline."""
+    options = parse_args(args)
+    setup_addon()
+
+    sys.path.insert(0, str(BENCHMARKS_FOLDER))
+    import harness
+    from spa_sequencer.sync.replay import replay_trace
+    from spa_sequencer.sync.trace import load_trace
+
+    trace = load_trace(options.trace)
+    events = len(trace["columns"]["time"])
+    print(
+        f"Replaying {events} events "
+        f"recorded in {trace['blend_file'] or '<unsaved file>'}"
+    )
+
+    name = f"replay_{Path(options.trace).stem}"
+    result = harness.BenchmarkResult(name, events, max(events, 1))
+    for _ in range(options.repeat):
+        replay = replay_trace(bpy.context, trace)
+        result.runs.append(sum(replay.latencies_ms) / 1000.0)
+
+    summary = replay.summary()
+    print(
+        f"Latency: mean {summary.get('mean_ms', 0.0):.3f} ms, "
+        f"p95 {summary.get('p95_ms', 0.0):.3f} ms, "
+        f"max {summary.get('max_ms', 0.0):.3f} ms"
+    )
+    for event in replay.slowest(options.slowest):
+        scene = trace["scenes"][event["scene"]] if event["scene"] >= 0 else ""
+        print(
+            f"  #{event['index']:<6} master frame {event['master_frame']:<6} "
+            f"{scene:<24} {event['latency_ms']:8.3f} ms "
+            f"(recorded: {event['duration_ms']:.3f} ms)"
+        )
+
+    if options.output:
+        data = {
+            "blender": bpy.app.version_string,
+            "platform": platform.platform(),
+            "results": [result.to_dict()],
+            "slowest": replay.slowest(options.slowest),
+        }
+        with open(options.output, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"Results written to {options.output}")
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = harness.compare_results([result], baseline, options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regression detected")
+
+    return 0
+
+
+if __name__ == "__main__":
+    script_args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    sys.exit(main(script_args))
@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Benchmark runner executed inside Blender.
+
+Usage::
+
+    blender -b --factory-startup -P scripts/run_benchmarks.py -- [options]
+
+Options:
+
+    --filter PATTERN        Only run benchmarks matching this glob pattern
+    --sizes N [N ...]       Only run these problem sizes
+    --output PATH           Write results to this JSON file
+    --baseline PATH         Compare results with this JSON baseline
+    --tolerance RATIO       Relative slowdown tolerated by the comparison (0.25)
+
+Results written with ``--output`` can be used as baselines for later runs.
+The exit code is 1 when a regression is detected against the baseline.
+"""
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+from pathlib import Path
+
+import bpy
+import addon_utils
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from run_pytest import REPO_ROOT, setup_extension  # noqa: E402
+
+BENCHMARKS_FOLDER = REPO_ROOT / "benchmarks"
+
+
+def setup_addon():
+    """Register the addon source as a local extension repository and enable it."""
+    setup_extension()
+    module_name = next(
+        m.__name__
+        for m in addon_utils.modules()
+        if m.__name__.endswith("spa_sequencer")
+    )
+    addon_utils.enable(module_name, persistent=True, default_set=True)
+    # Make the addon importable as `spa_sequencer`, as in tests.
+    sys.modules["spa_sequencer"] = importlib.import_module(module_name)
+
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="run_benchmarks")
+    parser.add_argument("--filter", default=None)
+    parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser.parse_args(args)
+
+
+def main(args: list[str]) -> int:
+    """Set up the addon, run benchmarks and compare them with a baseline."""
+    options = parse_args(args)
+    setup_addon()
+
+    sys.path.insert(0, str(BENCHMARKS_FOLDER))
+    import harness
+
+    for path in sorted(BENCHMARKS_FOLDER.glob("bench_*.py")):
+        importlib.import_module(path.stem)
+
+    results = harness.run_benchmarks(
+        options.filter, tuple(options.sizes) if options.sizes else None
+    )
+
+    if options.output:
+        data = {
+            "blender": bpy.app.version_string,
+            "platform": platform.platform(),
+            "results": [result.to_dict() for result in results],
+        }
+        with open(options.output, "w") as f:
+            json.dump(data, f, indent=2)
+        print(f"Results written to {options.output}")
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = harness.compare_results(results, baseline, options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regression detected")
+
+    return 0
+
+
+if __name__ == "__main__":
+    script_args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    sys.exit(main(script_args))
@@ -19,17 +19,6 @@ from pathlib import Path
 import bpy
 import addon_utils
 
-try:
-    import pytest
-except ImportError:
-    print(
-        "ERROR: pytest is not installed in Blender's Python.\n"
-        "Install it into Blender's bundled Python, e.g.:\n"
-        "  blender/5.1/python/bin/python3.13 -m pip install pytest",
-        file=sys.stderr,
-    )
-    sys.exit(1)
-
 REPO_ROOT = Path(__file__).resolve().parent.parent
 TESTS_FOLDER = str(REPO_ROOT / "tests")
 ADDON_DIR = str(REPO_ROOT)
@@ -50,6 +39,18 @@ def setup_extension():
 
 def main(args):
     """Set up extension environment, then run tests."""
+    # Imported here, so that other scripts can reuse `setup_extension` without pytest.
+    try:
+        import pytest
+    except ImportError:
+        print(
+            "ERROR: pytest is not installed in Blender's Python.\n"
+            "Install it into Blender's bundled Python, e.g.:\n"
+            "  blender/5.1/python/bin/python3.13 -m pip install pytest",
+            file=sys.stderr,
+        )
+        return 1
+
     setup_extension()
     return pytest.main([TESTS_FOLDER] + args)
 
@@ -3,6 +3,7 @@
 
 from . import (
     editorial,
+    hierarchy,
     keymaps,
     preferences,
     render,
@@ -10,10 +11,13 @@ from . import (
     shared_folders,
     shot,
     sync,
+    usage,
 )
 
 
 packages = (
+    hierarchy,
+    usage,
     sync,
     shot,
     sequence,
@@ -6,8 +6,8 @@ import re
 import bpy
 
 
-from ..shot.naming import ShotNaming, ShotPrefix
-from ..shot.core import slip_shot_content
+from ..shot.naming import ShotNameAllocator, ShotNaming, ShotPrefix
+from ..shot.core import batch_strip_reload, slip_shot_content
 from ..utils import register_classes, unregister_classes, get_edit_scene
 
 from ..editorial.core import gather_strips_groups_by_regex
@@ -86,6 +86,11 @@ class SEQUENCER_OT_edit_conform_shots_from_panels(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: bpy.types.Context):
+        # Reload created shot strips all at once
+        with batch_strip_reload():
+            return self.conform_shots(context)
+
+    def conform_shots(self, context: bpy.types.Context):
         if self.shot_scene == "NONE":
             self.report({"ERROR"}, "No valid shot Scene")
             return {"CANCELLED"}
@@ -122,9 +127,6 @@ class SEQUENCER_OT_edit_conform_shots_from_panels(bpy.types.Operator):
             # Assign active camera of the scene.
             shot_strip.scene_camera = shot_scene.camera
 
-        # Trigger a sequencer update.
-        bpy.ops.sequencer.reload()
-
         self.report(
             {"INFO"},
             f"Created {len(strips_groups)} shots from {len(ref_strips)} panels",
@@ -196,11 +198,17 @@ class SEQUENCER_OT_edit_conform_shots_from_editorial(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self)
 
     def execute(self, context: bpy.types.Context):
+        # Reload created shot strips all at once
+        with batch_strip_reload():
+            return self.conform_shots(context)
+
+    def conform_shots(self, context: bpy.types.Context):
 
         seq_editor = get_edit_scene(context).sequence_editor
         regex = re.compile(self.shot_id_regex)
 
         shot_naming = ShotNaming()
+        shot_names = ShotNameAllocator(shot_naming, seq_editor)
 
         for strip in seq_editor.strips:
 
@@ -242,12 +250,14 @@ class SEQUENCER_OT_edit_conform_shots_from_editorial(bpy.types.Operator):
                 shot_number = int(res.group(1))
                 shot_name = shot_naming.build_shot_name(shot_number)
             else:
-                shot_name = shot_naming.next_shot_name_from_sequences(seq_editor)
+                shot_name = shot_names.next_name()
 
             # Create a new scene strip using extracted information.
             shot_strip = seq_editor.strips.new_scene(
                 shot_name, scene, self.target_channel, strip.left_handle
             )
+            # Allocate next shot names after the names extracted from strips.
+            shot_names.add(shot_strip.name)
             shot_strip.scene_camera = camera
             # Adjust timing.
             shot_strip.duration = strip.duration
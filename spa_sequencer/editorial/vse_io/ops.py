@@ -5,10 +5,12 @@ from pathlib import Path
 
 import bpy
 from bpy_extras.io_utils import ExportHelper, ImportHelper
+import numpy as np
 
 import opentimelineio as otio
 from opentimelineio.opentime import TimeRange, RationalTime
 
+from ...timeline import TimelineSnapshot
 from ...utils import register_classes, unregister_classes, get_edit_scene
 
 from .core import (
@@ -274,20 +276,21 @@ class EXPORT_OT_otio(bpy.types.Operator, ExportHelper):
         timeline = otio.schema.Timeline(name=scene.name)
         timeline.global_start_time = RationalTime(scene.frame_start, fps)
 
-        # Build a map of strips per channels.
-        tracks = {}
-        for strip in seq_editor.strips:
-            if strip.channel not in tracks:
-                tracks[strip.channel] = []
-            tracks[strip.channel].append(strip)
+        # Group strips per channel, sorted by start frame.
+        snapshot = TimelineSnapshot(seq_editor.strips)
+        order = snapshot.channel_order()
+        channels, group_starts = np.unique(snapshot.channel[order], return_index=True)
+        groups = np.split(order, group_starts[1:])
+        # Keep tracks in order of first appearance of their channel.
+        _, first_indices = np.unique(snapshot.channel, return_index=True)
 
         # Transcribe VSE channels to OTIO tracks.
-        for track_id, strips in tracks.items():
+        for group_idx in np.argsort(first_indices):
             self.add_track(
                 timeline,
-                seq_editor.channels[track_id].name,
+                seq_editor.channels[int(channels[group_idx])].name,
                 scene.frame_start,
-                strips,
+                snapshot.strips(groups[group_idx]),
                 fps,
             )
 
@@ -0,0 +1,300 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Central router for Blender application handlers.
+
+Each `bpy.app.handlers` list gets a single dispatcher, registered while at least
+one subscriber listens to this event. Subscribers can:
+  - filter events on the scene that fired them
+  - drop consecutive duplicate frame changes within the same event loop tick
+  - skip events fired while they are already running (re-entrant events)
+
+The time spent in each subscriber is recorded, to find the handlers slowing down
+frame changes or depsgraph updates.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import bpy
+
+
+@dataclass
+class EventSubscriber:
+    """A subscriber to an application handler event."""
+
+    event: str
+    callback: Callable
+    name: str
+    # Only dispatch events fired by scenes matching this filter.
+    scene_filter: Optional[Callable[[bpy.types.Scene], bool]] = None
+    # Drop consecutive duplicate frame changes within the same event loop tick.
+    coalesce: bool = False
+    # Dispatch events fired while the subscriber is already running.
+    reentrant: bool = True
+    # Keep the subscription when loading a file.
+    persistent: bool = True
+
+    # Runtime state and statistics
+    running: bool = False
+    last_event_key: Optional[tuple] = None
+    calls: int = 0
+    filtered: int = 0
+    coalesced: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def reset_stats(self):
+        self.calls = 0
+        self.filtered = 0
+        self.coalesced = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+
+class EventRouter:
+    """Dispatch application handler events to subscribers."""
+
+    def __init__(self):
+        self.subscribers: dict[str, list[EventSubscriber]] = {}
+        self._dispatchers: dict[str, Callable] = {}
+
+    def subscribe(
+        self,
+        event: str,
+        callback: Callable,
+        name: Optional[str] = None,
+        scene_filter: Optional[Callable[[bpy.types.Scene], bool]] = None,
+        coalesce: bool = False,
+        reentrant: bool = True,
+        persistent: bool = True,
+    ) -> EventSubscriber:
+        """Subscribe `callback` to the application handler `event`.
+
+        :param event: The name of the `bpy.app.handlers` list (e.g. "load_post").
+        :param callback: The function called with the handler arguments.
+        :param name: The subscriber name, used in statistics.
+        :param scene_filter: Only dispatch events fired by scenes matching it.
+        :param coalesce: Drop a frame change event identical to the last one
+            dispatched to this subscriber in the same event loop tick, i.e. with
+            the same scene and current frame.
+        :param reentrant: Dispatch events fired by the subscriber itself.
+        :param persistent: Keep the subscription when loading a file.
+        :returns: The subscriber.
+        """
+        subscriber = EventSubscriber(
+            event,
+            callback,
+            name or f"{callback.__module__}.{callback.__qualname__}",
+            scene_filter,
+            coalesce,
+            reentrant,
+            persistent,
+        )
+        self.subscribers.setdefault(event, []).append(subscriber)
+        if event not in self._dispatchers:
+            dispatcher = self._make_dispatcher(event)
+            getattr(bpy.app.handlers, event).append(dispatcher)
+            self._dispatchers[event] = dispatcher
+        return subscriber
+
+    def unsubscribe(self, event: str, callback: Callable):
+        """Unsubscribe `callback` from `event`.
+
+        The dispatcher of `event` is unregistered with its last subscriber.
+        """
+        self.subscribers[event] = [
+            s for s in self.subscribers.get(event, []) if s.callback != callback
+        ]
+        if not self.subscribers[event]:
+            self._unregister_dispatcher(event)
+
+    def _unregister_dispatcher(self, event: str):
+        del self.subscribers[event]
+        if dispatcher := self._dispatchers.pop(event, None):
+            handlers = getattr(bpy.app.handlers, event)
+            if dispatcher in handlers:
+                handlers.remove(dispatcher)
+
+    def _make_dispatcher(self, event: str) -> Callable:
+        @bpy.app.handlers.persistent
+        def dispatcher(*args):
+            self.dispatch(event, *args)
+            # Blender drops non-persistent handlers when loading a file, and a
+            # pending tick reset timer may not survive it either.
+            if event in ("load_pre", "load_post"):
+                self.reset_tick()
+            if event == "load_pre":
+                self.drop_non_persistent()
+
+        return dispatcher
+
+    def dispatch(self, event: str, *args):
+        """Call the subscribers of `event` with the handler arguments `args`."""
+        scene = args[0] if args and isinstance(args[0], bpy.types.Scene) else None
+        event_key = None
+        # Only frame changes are coalesced. Event loop ticks are not processed in
+        # background mode: disable coalescing.
+        if scene and event.startswith("frame_change") and not bpy.app.background:
+            event_key = (scene.session_uid, scene.frame_current)
+
+        # Iterate over a copy: subscribers may (un)subscribe while dispatching.
+        for subscriber in tuple(self.subscribers.get(event, ())):
+            if subscriber.running and not subscriber.reentrant:
+                subscriber.filtered += 1
+                continue
+            scene_filter = subscriber.scene_filter
+            if scene and scene_filter and not scene_filter(scene):
+                subscriber.filtered += 1
+                continue
+            if subscriber.coalesce and event_key:
+                if subscriber.last_event_key == event_key:
+                    subscriber.coalesced += 1
+                    continue
+                if subscriber.last_event_key is None:
+                    self._schedule_tick_reset()
+                subscriber.last_event_key = event_key
+
+            subscriber.running = True
+            start = time.perf_counter()
+            try:
+                subscriber.callback(*args)
+            finally:
+                duration = time.perf_counter() - start
+                subscriber.running = False
+                subscriber.calls += 1
+                subscriber.total_time += duration
+                subscriber.max_time = max(subscriber.max_time, duration)
+
+    def _schedule_tick_reset(self):
+        if not bpy.app.timers.is_registered(reset_event_tick):
+            bpy.app.timers.register(
+                reset_event_tick, first_interval=0.0, persistent=True
+            )
+
+    def reset_tick(self):
+        """Forget the events dispatched in the current event loop tick."""
+        for subscribers in self.subscribers.values():
+            for subscriber in subscribers:
+                subscriber.last_event_key = None
+
+    def drop_non_persistent(self):
+        """Remove non-persistent subscribers."""
+        for event in tuple(self.subscribers):
+            self.subscribers[event] = [
+                s for s in self.subscribers[event] if s.persistent
+            ]
+            if not self.subscribers[event]:
+                self._unregister_dispatcher(event)
+
+    def stats(self) -> list[dict]:
+        """Get the statistics of each subscriber, slowest first."""
+        stats = [
+            {
+                "event": s.event,
+                "name": s.name,
+                "calls": s.calls,
+                "filtered": s.filtered,
+                "coalesced": s.coalesced,
+                "total_ms": s.total_time * 1000.0,
+                "mean_ms": s.total_time * 1000.0 / s.calls if s.calls else 0.0,
+                "max_ms": s.max_time * 1000.0,
+            }
+            for subscribers in self.subscribers.values()
+            for s in subscribers
+        ]
+        return sorted(stats, key=lambda s: s["total_ms"], reverse=True)
+
+    def reset_stats(self):
+        """Reset the statistics of all subscribers."""
+        for subscribers in self.subscribers.values():
+            for subscriber in subscribers:
+                subscriber.reset_stats()
+
+
+event_router = EventRouter()
+
+
+def reset_event_tick() -> None:
+    """Timer callback run on the next event loop tick."""
+    event_router.reset_tick()
+    return None
+
+
+def updated_sequence_editors(
+    depsgraph: bpy.types.Depsgraph,
+) -> dict[int, bpy.types.SequenceEditor]:
+    """Get the sequence editors of the scenes updated in `depsgraph`.
+
+    :param depsgraph: The depsgraph passed to a depsgraph update handler.
+    :return: The sequence editors, by pointer.
+    """
+    if not depsgraph.id_type_updated("SCENE"):
+        return {}
+    seds = {}
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Scene) and (
+            sed := update.id.original.sequence_editor
+        ):
+            seds[sed.as_pointer()] = sed
+    return seds
+
+
+class DataCache:
+    """Base class of caches of data derived from the file's datablocks.
+
+    The cache is invalidated when a datablock of one of `id_types` is updated, and
+    after undo/redo and file loading. Subclasses can override
+    `on_depsgraph_update` to filter updates further.
+
+    Validity keys of cached entries also include cheap counts (e.g. the number of
+    strips of a sequence editor), catching datablocks added or removed by scripts
+    before any depsgraph update.
+    """
+
+    # Types of the datablocks whose depsgraph updates invalidate the cache.
+    id_types: tuple[str, ...] = ()
+
+    def __init__(self):
+        # Counter bumped whenever the cached data may be outdated, usable in
+        # validity keys.
+        self.generation: int = 0
+        # Number of builds, exposed for profiling purposes.
+        self.build_count: int = 0
+
+    def invalidate(self):
+        """Flag the cached data as outdated."""
+        self.generation += 1
+
+    def on_depsgraph_update(
+        self, scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
+    ):
+        if any(depsgraph.id_type_updated(id_type) for id_type in self.id_types):
+            self.invalidate()
+
+    def on_data_reloaded(self, *args):
+        self.invalidate()
+
+    def register(self):
+        """Subscribe the cache to data change events."""
+        name = f"{type(self).__module__}.{type(self).__qualname__}"
+        event_router.subscribe(
+            "depsgraph_update_post",
+            self.on_depsgraph_update,
+            name=f"{name}.on_depsgraph_update",
+        )
+        # Invalidate on `load_pre`, so that no handler of the new file can get
+        # data cached from the previous one.
+        for event in ("undo_post", "redo_post", "load_pre"):
+            event_router.subscribe(
+                event, self.on_data_reloaded, name=f"{name}.on_data_reloaded"
+            )
+
+    def unregister(self):
+        """Unsubscribe the cache from data change events."""
+        event_router.unsubscribe("depsgraph_update_post", self.on_depsgraph_update)
+        for event in ("undo_post", "redo_post", "load_pre"):
+            event_router.unsubscribe(event, self.on_data_reloaded)
+        self.invalidate()
@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Cached, flattened view of the meta strip hierarchy of sequence editors.
+
+`Strip.parent_meta()` is a linear search over the sequence editor's strips, and
+resolving the audition group of a strip walks up the whole meta chain.
+The hierarchy maps each strip to its parent meta strip and its audition group,
+and each audition group to its active take, in a single pass over the strips.
+
+Hierarchies are cached per sequence editor, and rebuilt after sequencer edits.
+Strips are identified by pointer, so that cached data survives strip renaming.
+"""
+
+from typing import Optional, Union
+
+import bpy
+
+from .events import DataCache, updated_sequence_editors
+from .timeline import sequencer_fingerprint
+
+
+class MetaHierarchy:
+    """Parent meta strips and audition groups of a sequence editor's strips."""
+
+    def __init__(self, sed: bpy.types.SequenceEditor):
+        """
+        :param sed: The sequence editor.
+        """
+        self.strips: dict[int, bpy.types.Strip] = {}
+        self.parents: dict[int, Optional[bpy.types.MetaStrip]] = {}
+        self.children: dict[int, list[bpy.types.Strip]] = {}
+        # Closest audition group of each strip, including itself.
+        self.auditions: dict[int, Optional[bpy.types.MetaStrip]] = {}
+        self.active_takes: dict[int, Optional[bpy.types.Strip]] = {}
+        self._add_strips(sed.strips, None, None)
+
+    def _add_strips(
+        self,
+        strips: bpy.types.bpy_prop_collection,
+        parent: Optional[bpy.types.MetaStrip],
+        audition: Optional[bpy.types.MetaStrip],
+    ):
+        for strip in strips:
+            ptr = strip.as_pointer()
+            self.strips[ptr] = strip
+            self.parents[ptr] = parent
+            strip_audition = audition
+            if isinstance(strip, bpy.types.MetaStrip):
+                if strip.audition.is_audition:
+                    strip_audition = strip
+                    self.active_takes[ptr] = strip.strips.get(strip.audition.active)
+                self.children[ptr] = list(strip.strips)
+                self._add_strips(strip.strips, strip, strip_audition)
+            self.auditions[ptr] = strip_audition
+
+    def __contains__(self, strip: bpy.types.Strip) -> bool:
+        return strip.as_pointer() in self.strips
+
+    def parent(self, strip: bpy.types.Strip) -> Optional[bpy.types.MetaStrip]:
+        """Get the meta strip containing `strip`, if any."""
+        return self.parents.get(strip.as_pointer())
+
+    def parent_chain(self, strip: bpy.types.Strip) -> list[bpy.types.MetaStrip]:
+        """Get the meta strips containing `strip`, from the innermost one."""
+        chain = []
+        while parent := self.parent(strip):
+            chain.append(parent)
+            strip = parent
+        return chain
+
+    def audition(self, strip: bpy.types.Strip) -> Optional[bpy.types.MetaStrip]:
+        """Get the audition group of `strip`: either itself or its closest parent."""
+        return self.auditions.get(strip.as_pointer())
+
+    def active_take(self, audition: bpy.types.MetaStrip) -> Optional[bpy.types.Strip]:
+        """Get the active take of the `audition` group."""
+        return self.active_takes.get(audition.as_pointer())
+
+    def set_active_take(self, audition: bpy.types.MetaStrip, take: bpy.types.Strip):
+        """Update the active take of the `audition` group."""
+        self.active_takes[audition.as_pointer()] = take
+
+    def meta_strips(self, meta: bpy.types.MetaStrip) -> list[bpy.types.Strip]:
+        """Get the strips directly contained in `meta`."""
+        return self.children.get(meta.as_pointer(), [])
+
+
+class MetaHierarchyCache(DataCache):
+    """Cache of the meta hierarchy of each sequence editor."""
+
+    def __init__(self):
+        super().__init__()
+        # {sequence editor pointer: (validity key, strips digest, hierarchy)}
+        self.entries: dict[int, tuple[tuple, bytes, MetaHierarchy]] = {}
+
+    def get(
+        self,
+        sed: bpy.types.SequenceEditor,
+        strip: Optional[bpy.types.Strip] = None,
+    ) -> MetaHierarchy:
+        """Get the meta hierarchy of `sed`, rebuilding it if outdated.
+
+        :param sed: The sequence editor.
+        :param strip: A strip expected to be in the hierarchy. If it is not,
+            the hierarchy is rebuilt (e.g. after a scripted edit).
+        :return: The meta hierarchy.
+        """
+        ptr = sed.as_pointer()
+        key = (self.generation, len(sed.strips_all))
+        entry = self.entries.get(ptr)
+        if entry and entry[0] == key and (strip is None or strip in entry[2]):
+            return entry[2]
+        hierarchy = MetaHierarchy(sed)
+        self.entries[ptr] = (key, sequencer_fingerprint(sed), hierarchy)
+        self.build_count += 1
+        return hierarchy
+
+    def invalidate(self):
+        """Flag all cached hierarchies as outdated."""
+        super().invalidate()
+        self.entries.clear()
+
+    def on_depsgraph_update(
+        self, scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
+    ):
+        """Drop the hierarchies of the updated sequence editors whose strips changed.
+
+        Frame, camera or active strip changes do not affect hierarchies.
+        """
+        for ptr, sed in updated_sequence_editors(depsgraph).items():
+            entry = self.entries.get(ptr)
+            if entry and entry[1] != sequencer_fingerprint(sed):
+                del self.entries[ptr]
+
+
+meta_hierarchy_cache = MetaHierarchyCache()
+
+
+def get_meta_hierarchy(
+    strip_or_sed: Union[bpy.types.Strip, bpy.types.SequenceEditor],
+) -> MetaHierarchy:
+    """Get the cached meta hierarchy of a sequence editor, or of a strip's one.
+
+    :param strip_or_sed: The sequence editor, or a strip of this sequence editor.
+    :return: The meta hierarchy.
+    """
+    if isinstance(strip_or_sed, bpy.types.SequenceEditor):
+        return meta_hierarchy_cache.get(strip_or_sed)
+    return meta_hierarchy_cache.get(strip_or_sed.id_data.sequence_editor, strip_or_sed)
+
+
+def register():
+    meta_hierarchy_cache.register()
+
+
+def unregister():
+    meta_hierarchy_cache.unregister()
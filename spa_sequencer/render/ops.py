@@ -6,6 +6,7 @@ from typing import Optional
 import traceback
 
 import bpy
+import numpy as np
 
 from .tasks import (
     BaseRenderTask,
@@ -19,6 +20,7 @@ from .tasks import (
 )
 
 from ..sync.core import get_sync_settings
+from ..timeline import TimelineSnapshot
 from ..utils import register_classes, unregister_classes, get_edit_scene
 
 
@@ -85,16 +87,13 @@ class SEQUENCER_OT_batch_render(bpy.types.Operator):
         render_op_invoke = self.options.is_invoke
 
         # Select scene sequence strips to render
-        seqs = [
-            seq
-            for seq in self.scene.sequence_editor.strips_all
-            if isinstance(seq, bpy.types.SceneStrip)
-            and (seq.select or not self.render_options.selection_only)
-            and not seq.mute
-        ]
+        snapshot = TimelineSnapshot(self.scene.sequence_editor.strips_all)
+        mask = snapshot.mask(bpy.types.SceneStrip, skip_muted=True)
+        if self.render_options.selection_only:
+            mask &= snapshot.column("select", bool)
 
         # Create render tasks
-        for seq in sorted(seqs, key=lambda x: x.left_handle):
+        for seq in snapshot.strips(snapshot.sorted_by_start(np.flatnonzero(mask))):
             self.tasks.append(StripRenderTask(strip=seq, is_modal=render_op_invoke))
 
         # Early return if output scene is not set.
@@ -103,14 +102,12 @@ class SEQUENCER_OT_batch_render(bpy.types.Operator):
 
         # List sound strips if they need to be copied over output scene.
         if self.render_options.output_copy_sound_strips:
-            sound_strips = [
-                seq
-                for seq in self.scene.sequence_editor.strips
-                if isinstance(seq, bpy.types.SoundStrip)
-                and (seq.select or not self.render_options.selection_only)
-            ]
-            self.output_sound_strips = sorted(
-                sound_strips, key=lambda x: x.left_handle
+            snapshot = TimelineSnapshot(self.scene.sequence_editor.strips)
+            mask = snapshot.mask(bpy.types.SoundStrip)
+            if self.render_options.selection_only:
+                mask &= snapshot.column("select", bool)
+            self.output_sound_strips = snapshot.strips(
+                snapshot.sorted_by_start(np.flatnonzero(mask))
             )
             if self.output_sound_strips:
                 self.tasks.append(
@@ -130,7 +127,9 @@ class SEQUENCER_OT_batch_render(bpy.types.Operator):
 
             # Compute channel offset in output scene based on existing content
             if self.render_options.output_auto_offset_channels and sed.strips:
-                self.output_channel_offset = max([s.channel for s in sed.strips])
+                self.output_channel_offset = int(
+                    TimelineSnapshot(sed.strips).channel.max()
+                )
         else:
             # Ensure sequence editor is created in output scene.
             output_scene.sequence_editor_create()
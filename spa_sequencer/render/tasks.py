@@ -7,6 +7,7 @@ import math
 import os
 from typing import Any, Callable, Optional
 import bpy
+from ..events import event_router
 from ..render.props import MEDIA_TYPES_FORMATS, BatchRenderOptions
 from ..sync.core import get_sync_settings
 from ..sync.core import remap_frame_value
@@ -104,8 +105,12 @@ class BaseRenderTask(BaseTask):
 
     def register_render_handlers(self):
         """Register render handlers callbacks."""
-        bpy.app.handlers.render_cancel.append(self.on_render_cancelled)
-        bpy.app.handlers.render_complete.append(self.on_render_completed)
+        event_router.subscribe(
+            "render_cancel", self.on_render_cancelled, persistent=False
+        )
+        event_router.subscribe(
+            "render_complete", self.on_render_completed, persistent=False
+        )
         self.handlers_registered = True
 
     def unregister_app_handlers(self):
@@ -113,8 +118,8 @@ class BaseRenderTask(BaseTask):
         if not self.handlers_registered:
             return
 
-        bpy.app.handlers.render_cancel.remove(self.on_render_cancelled)
-        bpy.app.handlers.render_complete.remove(self.on_render_completed)
+        event_router.unsubscribe("render_cancel", self.on_render_cancelled)
+        event_router.unsubscribe("render_complete", self.on_render_completed)
         self.handlers_registered = False
 
     @staticmethod
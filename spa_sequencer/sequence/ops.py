@@ -3,6 +3,7 @@
 
 import bpy
 
+from ..usage import get_usage_index
 from ..utils import register_classes, unregister_classes
 from ..sync.core import (
     get_sync_master_strip,
@@ -156,22 +157,25 @@ class SEQUENCE_OT_check_obj_users_scene(bpy.types.Operator):
         return context.active_object and get_sync_master_strip(use_cache=True)[0]
 
     def build_obj_user_scene_report(self, obj):
-        info_msg = ""
         master_scene = get_sync_settings().master_scene
-        strips = [
-            strip
-            for strip in master_scene.sequence_editor.strips_all
-            if strip.type == "SCENE"
+        usage = get_usage_index()
+        scenes_strips = [
+            (scene, strips)
+            for scene in usage.scene_users(obj)
+            if (strips := usage.scene_strips(scene, master_scene.sequence_editor))
         ]
+        if not scenes_strips:
+            return f"Object '{obj.name}' is not used in '{master_scene.name}'"
 
-        for strip in sorted(strips, key=lambda f: f.left_handle):
-            scene_msg = f" - Scene '{strip.scene.name}' from strips:\n"
-            if scene_msg not in info_msg:
-                info_msg += scene_msg
-            info_msg += (
-                f"   - {strip.name} "
-                f"[{strip.left_handle}, {strip.right_handle}]\n"
-            )
+        info_msg = ""
+        # List scenes by order of appearance in the edit.
+        for scene, strips in sorted(scenes_strips, key=lambda x: x[1][0].left_handle):
+            info_msg += f" - Scene '{scene.name}' from strips:\n"
+            for strip in strips:
+                info_msg += (
+                    f"   - {strip.name} "
+                    f"[{strip.left_handle}, {strip.right_handle}]\n"
+                )
 
         report = f"Object '{obj.name}' is used in '{master_scene.name}' by:\n{info_msg}"
         return report
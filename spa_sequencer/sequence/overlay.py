@@ -4,6 +4,7 @@
 import bpy
 import blf
 import mathutils
+import numpy as np
 
 from ..sync.core import (
     get_sync_master_strip,
@@ -12,6 +13,7 @@ from ..sync.core import (
 )
 
 from ..gpu_utils import Vec4f, OverlayDrawer
+from ..timeline import TimelineSnapshot
 from ..utils import register_classes, unregister_classes
 
 
@@ -143,12 +145,13 @@ def draw_sequence_overlay_cb(drawer: OverlayDrawer):
     )
 
     # List strips using the currently active scene in the master sequence timeline
+    snapshot = TimelineSnapshot(sync_settings.master_scene.sequence_editor.strips)
     scene_strips = [
         s
-        for s in sync_settings.master_scene.sequence_editor.strips
-        if isinstance(s, bpy.types.SceneStrip)
-        and s.scene == context.scene
-        and s != master_strip
+        for s in snapshot.strips(
+            np.flatnonzero(snapshot.type_mask(bpy.types.SceneStrip))
+        )
+        if s.scene == context.scene and s != master_strip
     ]
 
     # Draw those strips
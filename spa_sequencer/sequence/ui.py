@@ -2,6 +2,7 @@
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
 import bpy
+import numpy as np
 
 from ..shot.core import (
     get_scene_cameras,
@@ -13,6 +14,7 @@ from ..sync.core import (
     get_sync_settings,
 )
 
+from ..timeline import TimelineSnapshot
 from ..utils import register_classes, unregister_classes
 
 
@@ -96,25 +98,20 @@ class SEQUENCE_UL_shot(bpy.types.UIList):
         sub.label(text=item.scene.name, icon=icon)
 
     def filter_items(self, context, data, propname):
-        objects = getattr(data, propname)
-        helper_funcs = bpy.types.UI_UL_list
+        snapshot = TimelineSnapshot(getattr(data, propname))
 
         # Keep only scene strips.
-        flt_flags = [
-            (
-                self.bitflag_filter_item
-                if isinstance(obj, bpy.types.SceneStrip) and not obj.mute
-                else 0
-            )
-            for obj in objects
-        ]
-        flt_neworder = []
+        flt_flags = np.where(
+            snapshot.mask(bpy.types.SceneStrip, skip_muted=True),
+            self.bitflag_filter_item,
+            0,
+        )
 
-        # Prepare data for sorting and perform sort
-        sort_data = [(idx, obj.left_handle) for idx, obj in enumerate(objects)]
-        flt_neworder = helper_funcs.sort_items_helper(sort_data, key=lambda obj: obj[1])
+        # Sort by start frame: new order maps each item to its sorted position.
+        flt_neworder = np.empty(len(snapshot), dtype=np.int32)
+        flt_neworder[snapshot.sorted_by_start()] = np.arange(len(snapshot))
 
-        return flt_flags, flt_neworder
+        return flt_flags.tolist(), flt_neworder.tolist()
 
 
 class VIEW3D_PT_sequence(bpy.types.Panel):
@@ -5,6 +5,8 @@ from typing import Union
 
 import bpy
 
+from ..usage import get_usage_index, usage_index_cache
+
 
 # Name of the collection holding the shared folders collections
 SHARED_FOLDERS_ROOT_NAME = ".SHARED_FOLDERS"
@@ -114,6 +116,7 @@ def link_shared_folder(collection: bpy.types.Collection, scenes: list[bpy.types.
         if collection.name not in scene.collection.children:
             scene.collection.children.link(collection)
             linked_scenes.append(scene)
+    usage_index_cache.invalidate()
     return linked_scenes
 
 
@@ -134,6 +137,7 @@ def unlink_shared_folder(
         if collection.name in scene.collection.children:
             scene.collection.children.unlink(collection)
             unlinked_scenes.append(scene)
+    usage_index_cache.invalidate()
     return unlinked_scenes
 
 
@@ -156,11 +160,7 @@ def get_scene_users(collection: bpy.types.Collection) -> list[bpy.types.Scene]:
 
     :param collection: The shared folder.
     """
-    return [
-        user
-        for user in bpy.data.user_map(subset=[collection])[collection]
-        if isinstance(user, bpy.types.Scene)
-    ]
+    return get_usage_index().scene_users(collection, direct=True)
 
 
 def get_scene_sequence_users(
@@ -171,12 +171,7 @@ def get_scene_sequence_users(
     :param collection: The shared folder.
     :param sed: The sequence editor containing the scene sequences.
     """
-    scene_users = get_scene_users(collection)
-    return [
-        s
-        for s in sed.strips
-        if isinstance(s, bpy.types.SceneStrip) and s.scene in scene_users
-    ]
+    return get_usage_index().strip_users(collection, sed, direct=True, nested=False)
 
 
 def get_active_shared_folder(
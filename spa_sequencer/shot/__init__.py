@@ -2,6 +2,7 @@
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
 from . import (
+    catalogue,
     core,
     naming,
     ops,
@@ -10,6 +11,7 @@ from . import (
 
 
 def register():
+    catalogue.register()
     core.register()
     naming.register()
     ops.register()
@@ -17,6 +19,7 @@ def register():
 
 
 def unregister():
+    catalogue.unregister()
     core.unregister()
     naming.unregister()
     ops.unregister()
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Cached catalogues of the scenes usable by shot strips, and of scene cameras.
+
+Menus and enum properties listing these re-evaluate them on every redraw, and
+finding out whether a scene is empty goes through all of its collections.
+Catalogues are built on first use and served from the cache until a scene,
+collection or object changes, or after undo/redo and file loading.
+
+Enum item lists are kept alive until their callback returns a new list, as
+Blender does not keep a reference to their strings (see
+https://developer.blender.org/T97243).
+"""
+
+from typing import Callable, Hashable
+
+import bpy
+
+from ..events import DataCache
+from ..preferences import get_addon_prefs
+from ..sync.core import get_sync_settings
+
+
+def _collection_links() -> int:
+    """Count the objects and child collections linked to the file's collections,
+    including scenes' master collections.
+    """
+    collections = (*bpy.data.collections, *(s.collection for s in bpy.data.scenes))
+    return sum(len(col.objects) + len(col.children) for col in collections)
+
+
+class ShotCatalogue(DataCache):
+    """Cache of the valid shot scenes and of the cameras of each scene."""
+
+    id_types = ("SCENE", "COLLECTION", "OBJECT")
+
+    def __init__(self):
+        super().__init__()
+        # (validity key, valid shot scenes)
+        self.shot_scenes: tuple[tuple, list[bpy.types.Scene]] = ((), [])
+        # {scene pointer: (validity key, cameras)}
+        self.cameras: dict[int, tuple[tuple, list[bpy.types.Object]]] = {}
+        # {enum name: (validity key, enum items)}
+        self.enum_items: dict[str, tuple[Hashable, list[tuple]]] = {}
+
+    def scenes_key(self) -> tuple:
+        """Get the validity key of the catalogues depending on the file's scenes."""
+        prefs = get_addon_prefs()
+        master_scene = get_sync_settings().master_scene
+        return (
+            self.generation,
+            # Scenes added, removed or renamed by scripts do not trigger depsgraph
+            # updates, neither do objects linked to scenes not being evaluated.
+            tuple((scene.session_uid, scene.name) for scene in bpy.data.scenes),
+            _collection_links(),
+            prefs.shot_template_prefix,
+            master_scene.as_pointer() if master_scene else 0,
+        )
+
+    def valid_shot_scenes(self) -> list[bpy.types.Scene]:
+        """Get the scenes usable by a shot strip, rebuilding the list if outdated."""
+        key = self.scenes_key()
+        if self.shot_scenes[0] != key:
+            prefs = get_addon_prefs()
+            master_scene = get_sync_settings().master_scene
+            scenes = [
+                scene
+                for scene in bpy.data.scenes
+                if (
+                    # Discard template scenes.
+                    not scene.name.startswith(prefs.shot_template_prefix)
+                    # Discard master sync scene.
+                    and scene != master_scene
+                    # Discard empty scenes.
+                    and len(scene.collection.all_objects)
+                )
+            ]
+            self.shot_scenes = (key, scenes)
+            self.build_count += 1
+        return self.shot_scenes[1]
+
+    def scene_cameras(self, scene: bpy.types.Scene) -> list[bpy.types.Object]:
+        """Get the cameras of `scene` sorted by name, rebuilding the list if outdated.
+
+        :param scene: The scene.
+        :return: The cameras of the scene.
+        """
+        ptr = scene.as_pointer()
+        key = (self.generation, scene.session_uid, len(scene.objects))
+        entry = self.cameras.get(ptr)
+        if entry and entry[0] == key:
+            return entry[1]
+        cameras = sorted(
+            (obj for obj in scene.objects if obj.type == "CAMERA"),
+            key=lambda x: x.name,
+        )
+        self.cameras[ptr] = (key, cameras)
+        self.build_count += 1
+        return cameras
+
+    def get_enum_items(
+        self, name: str, key: Hashable, build: Callable[[], list[tuple]]
+    ) -> list[tuple]:
+        """Get the items of the enum `name`, building them if `key` changed.
+
+        :param name: The name identifying the enum.
+        :param key: The validity key of the items.
+        :param build: The function building the items.
+        :return: The enum items.
+        """
+        entry = self.enum_items.get(name)
+        if entry and entry[0] == key:
+            return entry[1]
+        items = build()
+        self.enum_items[name] = (key, items)
+        return items
+
+    def invalidate(self):
+        """Flag all catalogues as outdated."""
+        super().invalidate()
+        self.cameras.clear()
+        # Enum items are kept alive until they are rebuilt.
+
+
+shot_catalogue = ShotCatalogue()
+
+
+def register():
+    shot_catalogue.register()
+
+
+def unregister():
+    shot_catalogue.unregister()
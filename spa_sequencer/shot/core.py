@@ -1,18 +1,20 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
-from typing import Callable, List
+import contextlib
+from typing import Callable, List, Optional
 
 import bpy
 
+from ..hierarchy import get_meta_hierarchy, meta_hierarchy_cache
 from ..utils import is_grease_pencil_instance
-from ..preferences import get_addon_prefs
 from ..sync.core import (
-    get_sync_settings,
     remap_frame_value,
     sync_system_update
 )
 from ..utils import register_classes, unregister_classes
+from .catalogue import shot_catalogue
+from .ripple import RippleEdit
 
 
 # Data structure to map source-to-duplicated datablock
@@ -165,6 +167,41 @@ def replace_in_datablock_name(
         datablock.name = preprocess(datablock.name).replace(old_substr, new_substr)
 
 
+# Cache of pointer properties to datablocks, by RNA type
+pointer_properties_cache: dict[str, tuple[str, ...]] = {}
+
+
+def is_id_type(struct: bpy.types.Struct) -> bool:
+    """Return whether the RNA type `struct` is a datablock type."""
+    while struct:
+        if struct.identifier == "ID":
+            return True
+        struct = struct.base
+    return False
+
+
+def get_pointer_properties(item: bpy.types.bpy_struct) -> tuple[str, ...]:
+    """Get the names of the editable pointer properties to datablocks of `item`.
+
+    Pointer properties only depend on the RNA type of `item`: they are computed
+    once per type, and cached.
+
+    :param item: The RNA item (e.g. constraint, modifier)
+    :return: The names of the pointer properties
+    """
+    bl_rna = item.bl_rna
+    if (prop_names := pointer_properties_cache.get(bl_rna.identifier)) is None:
+        prop_names = tuple(
+            prop.identifier
+            for prop in bl_rna.properties
+            if isinstance(prop, bpy.types.PointerProperty)
+            and not prop.is_readonly
+            and is_id_type(prop.fixed_type)
+        )
+        pointer_properties_cache[bl_rna.identifier] = prop_names
+    return prop_names
+
+
 def remap_relations(manifest: DuplicationManifest):
     """Remap relations for duplicated datablocks.
 
@@ -190,20 +227,12 @@ def remap_relations(manifest: DuplicationManifest):
         new_object.matrix_parent_inverse = src_datablock.matrix_parent_inverse.copy()
         return True
 
-    def _get_pointer_properties(datablock: bpy.types.ID) -> list[str]:
-        """Get the names of pointer properties in `datablock`."""
-        return [
-            prop.identifier
-            for prop in datablock.bl_rna.properties
-            if isinstance(prop, bpy.types.PointerProperty)
-        ]
-
     def _remap_pointer_properties(datablocks: list[bpy.types.ID]):
         """
         Remap all pointer properties of `datablocks` referencing a duplicated datablock.
         """
         for datablock in datablocks:
-            for prop_name in _get_pointer_properties(datablock):
+            for prop_name in get_pointer_properties(datablock):
                 if (value := getattr(datablock, prop_name)) in manifest:
                     setattr(datablock, prop_name, manifest[value])
 
@@ -215,19 +244,20 @@ def remap_relations(manifest: DuplicationManifest):
         """Remap `new_object`'s modifiers properties."""
         _remap_pointer_properties(new_object.modifiers)
         if is_grease_pencil_instance(new_object.data):
-            _remap_pointer_properties(new_object.modifiers)
             _remap_pointer_properties(new_object.shader_effects)
 
-    def _remap_drivers(new_datablock: bpy.types.ID):
-        """Remap `new_datablock`'s drivers targets."""
+    def _index_driver_targets(new_datablock: bpy.types.ID):
+        """Index `new_datablock`'s drivers targets by target datablock."""
         if not (anim_data := getattr(new_datablock, "animation_data", None)):
             return
-        # Iterate over drivers and remap targets if applicable
         for fcurve in anim_data.drivers:
             for var in fcurve.driver.variables:
                 for target in var.targets:
-                    if target.id in manifest:
-                        target.id = manifest[target.id]
+                    if target.id:
+                        driver_targets.setdefault(target.id, []).append(target)
+
+    # Drivers targets of duplicated datablocks, by target datablock
+    driver_targets: dict[bpy.types.ID, list[bpy.types.DriverTarget]] = {}
 
     # Remap relationships and references to datablocks in duplicated elements
     for src_datablock, new_datablock in manifest.items():
@@ -235,8 +265,13 @@ def remap_relations(manifest: DuplicationManifest):
             _reparent(src_datablock, new_datablock)
             _remap_constraints(new_datablock)
             _remap_modifiers(new_datablock)
-        # Remap animation drivers targets
-        _remap_drivers(new_datablock)
+        _index_driver_targets(new_datablock)
+
+    # Remap animation drivers targets
+    for target_id, targets in driver_targets.items():
+        if new_target_id := manifest.get(target_id):
+            for target in targets:
+                target.id = new_target_id
 
 
 def duplicate_scene(
@@ -323,6 +358,132 @@ def duplicate_scene(
     return new_scene
 
 
+def get_scene_duplication_closure(scene: bpy.types.Scene) -> list[bpy.types.ID]:
+    """Get the datablocks to copy to duplicate the content of `scene`.
+
+    Collections with multiple users are shared with the duplicated scene rather
+    than copied: neither them nor their content are part of the closure.
+
+    :param scene: The scene to duplicate
+    :return: The collections, objects, object data and actions to copy, once each
+    """
+    # Use a dict as an insertion-ordered set
+    closure: dict[bpy.types.ID, None] = {}
+
+    def _add_datablock(datablock: bpy.types.ID):
+        if not datablock or datablock in closure:
+            return
+        closure[datablock] = None
+        anim_data = getattr(datablock, "animation_data", None)
+        if anim_data and anim_data.action:
+            closure[anim_data.action] = None
+
+    def _add_objects(objs: list[bpy.types.Object]):
+        for obj in objs:
+            if obj in closure:
+                continue
+            _add_datablock(obj)
+            _add_datablock(obj.data)
+
+    def _add_collections(cols: list[bpy.types.Collection]):
+        for col in cols:
+            if col.users > 1 or col in closure:
+                continue
+            closure[col] = None
+            _add_objects(col.objects)
+            _add_collections(col.children)
+
+    _add_collections(scene.collection.children)
+    _add_objects(scene.collection.objects)
+    return list(closure)
+
+
+def duplicate_scene_bulk(
+    scene: bpy.types.Scene,
+    name: str,
+    manifest: DuplicationManifest = None,
+) -> bpy.types.Scene:
+    """Duplicates `scene` as a new scene named `name`, without using operators.
+
+    Unlike `duplicate_scene`, the window's scene is left untouched, which avoids
+    evaluating both scenes in the UI and makes this function usable in background.
+    The datablocks to copy are collected first and copied once each, so data and
+    actions shared by several objects remain shared between their copies.
+
+    :param scene: The Scene to duplicate
+    :param name: The name of the new scene
+    :param manifest: The duplication manifest mapping source-to-duplicated datablocks
+    :returns: The new created scene
+    """
+    if name in bpy.data.scenes:
+        raise ValueError(f"Scene '{name}' already exists")
+
+    if manifest is None:
+        manifest = DuplicationManifest()
+
+    # Copy the scene to keep its settings (render, units, tool settings...), then
+    # drop the content it shares with the source scene.
+    new_scene = scene.copy()
+    new_scene.name = name
+    for col in new_scene.collection.children[:]:
+        new_scene.collection.children.unlink(col)
+    for obj in new_scene.collection.objects[:]:
+        new_scene.collection.objects.unlink(obj)
+    new_scene.sequence_editor_clear()
+    new_scene.timeline_markers.clear()
+    new_scene.animation_data_clear()
+    manifest[scene] = new_scene
+
+    # Copy the dependency closure of the scene's content
+    closure = get_scene_duplication_closure(scene)
+    for datablock in closure:
+        if isinstance(datablock, bpy.types.Collection):
+            # Collections are re-created empty, their content is linked below
+            manifest[datablock] = bpy.data.collections.new(datablock.name)
+        else:
+            manifest[datablock] = datablock.copy()
+
+    # Rebuild relations between the copies, starting from the deepest collections
+    # for them to be linked into the new scene only once complete.
+    for datablock in reversed(closure):
+        new_datablock = manifest[datablock]
+        if isinstance(datablock, bpy.types.Collection):
+            for obj in datablock.objects:
+                new_datablock.objects.link(manifest[obj])
+            for child in datablock.children:
+                new_datablock.children.link(manifest.get(child, child))
+            continue
+        if isinstance(datablock, bpy.types.Object) and datablock.data:
+            new_datablock.data = manifest[datablock.data]
+        anim_data = getattr(new_datablock, "animation_data", None)
+        if anim_data and anim_data.action in manifest:
+            anim_data.action = manifest[anim_data.action]
+
+    for col in scene.collection.children:
+        new_scene.collection.children.link(manifest.get(col, col))
+    for obj in scene.collection.objects:
+        new_scene.collection.objects.link(manifest[obj])
+
+    # Remap relationships between duplicated objects
+    remap_relations(manifest)
+
+    new_scene.camera = manifest.get(scene.camera)
+    new_scene.view_layers[0].objects.active = manifest.get(
+        scene.view_layers[0].objects.active
+    )
+
+    # Rename the duplicated datablocks
+    for datablock in closure:
+        replace_in_datablock_name(
+            manifest[datablock],
+            scene.name,
+            name,
+            preprocess=lambda x: x.rsplit(".", 1)[0],
+        )
+
+    return new_scene
+
+
 def rename_all_datablocks_from_collection(
     col: bpy.types.Collection, old_substr: str, new_substr: str
 ):
@@ -397,112 +558,224 @@ def delete_datablock_if_orphan(datablock: bpy.types.ID) -> int:
     :param datablock: The datablock to delete
     :returns: The total number of datablocks deleted by this operation
     """
-    # Do not try to delete linked or non orphan datablocks
-    if datablock.library or not is_orphan(datablock):
-        return 0
-
-    # Get and copy children list if any
-    children = getattr(datablock, "children", [])[:]
-    # Get data if any
-    data = getattr(datablock, "data", None)
-    # Get action if any
-    action = getattr(getattr(datablock, "animation_data", None), "action", None)
-
-    # Remove the datablock
-    bpy.data.batch_remove([datablock])
-    del_count = 1
-
-    # Recursively clean up related datablocks:
-    # - children (applicable for: objects, collections)
-    for c in children:
-        del_count += delete_datablock_if_orphan(c)
-    # - data (applicable for: objects)
-    if data:
-        del_count += delete_datablock_if_orphan(data)
-    # - action (applicable for: objects, data)
-    if action:
-        del_count += delete_datablock_if_orphan(action)
+    return delete_orphan_datablocks([datablock])
 
-    return del_count
 
+def delete_orphan_datablocks(datablocks: list[bpy.types.ID]) -> int:
+    """
+    Delete local orphan datablocks in `datablocks`, as well as their attached
+    datablocks (children, data, animation action) becoming orphan, recursively.
+
+    Datablocks are processed in order, and in the same way as successive calls to
+    `delete_datablock_if_orphan` would. Orphans are however resolved in memory from
+    a single user map, and all deleted at once.
 
-def delete_scene(scene: bpy.types.Scene, purge_orphan_datablocks: bool) -> int:
+    :param datablocks: The datablocks to delete
+    :returns: The total number of datablocks deleted by this operation
     """
-    Delete `scene` and optionally delete datablock that were only used in this context.
+    # Children of each object, in `Object.children` order
+    object_children: dict[bpy.types.Object, list[bpy.types.Object]] = {}
+    for obj in bpy.data.objects:
+        if obj.parent:
+            object_children.setdefault(obj.parent, []).append(obj)
+
+    # Attached datablocks to process after each candidate: children, data, action
+    attached: dict[bpy.types.ID, list[bpy.types.ID]] = {}
+    # Datablocks whose users count each candidate holds
+    used: dict[bpy.types.ID, list[bpy.types.ID]] = {}
+
+    stack = list(datablocks)
+    while stack:
+        datablock = stack.pop()
+        if datablock in attached:
+            continue
+        if isinstance(datablock, bpy.types.Object):
+            attached[datablock] = object_children.get(datablock, [])[:]
+            used[datablock] = [datablock.instance_collection]
+        else:
+            attached[datablock] = getattr(datablock, "children", [])[:]
+            used[datablock] = []
+        if isinstance(datablock, bpy.types.Collection):
+            used[datablock] += datablock.objects[:] + datablock.children[:]
+        if data := getattr(datablock, "data", None):
+            attached[datablock].append(data)
+            used[datablock].append(data)
+        anim_data = getattr(datablock, "animation_data", None)
+        if anim_data and anim_data.action:
+            attached[datablock].append(anim_data.action)
+            used[datablock].append(anim_data.action)
+        stack.extend(attached[datablock])
+
+    # Simulate deletions, keeping track of users counts (see `is_orphan`)
+    user_map = bpy.data.user_map(subset=list(attached))
+    users = {datablock: datablock.users for datablock in attached}
+    deleted: dict[bpy.types.ID, None] = {}
+
+    def _is_orphan(datablock: bpy.types.ID) -> bool:
+        if users[datablock] == 1:
+            return not any(
+                db not in deleted and getattr(db, "parent", None) != datablock
+                for db in user_map[datablock]
+            )
+        return users[datablock] == 0
+
+    def _delete_if_orphan(datablock: bpy.types.ID):
+        if datablock in deleted or datablock.library or not _is_orphan(datablock):
+            return
+        deleted[datablock] = None
+        for db in used[datablock]:
+            if db in users:
+                users[db] -= 1
+        for db in attached[datablock]:
+            _delete_if_orphan(db)
 
-    :param scene: The scene to delete
-    :param purge_orphan_datablocks: Whether to delete orphan datablocks after scene deletion
+    for datablock in datablocks:
+        _delete_if_orphan(datablock)
+
+    if deleted:
+        bpy.data.batch_remove(list(deleted))
+    return len(deleted)
+
+
+def delete_scenes(scenes: list[bpy.types.Scene], purge_orphan_datablocks: bool) -> int:
+    """
+    Delete `scenes` and optionally delete datablock that were only used in them.
+
+    :param scenes: The scenes to delete
+    :param purge_orphan_datablocks: Whether to delete orphan datablocks after scenes
+        deletion
     :returns: The number of datablocks deleted by this operation
     """
     potentially_orphan_datablocks: list[bpy.types.ID] = []
 
     if purge_orphan_datablocks:
-        # Store top-level datablocks linked to this scene before its deletion.
-        # We want to delete datablocks in a hierarchical way for user counts to be
-        # relevant for detecting orphans.
-        # Collections containing collections and objects, they should be deleted first.
-        potentially_orphan_datablocks += scene.collection.children[:]
-        # Then, all objects without parents should be considered.
-        potentially_orphan_datablocks += [
-            obj for obj in scene.collection.all_objects if not obj.parent
-        ]
-
-    # Delete the scene
-    bpy.data.scenes.remove(scene)
-
-    del_count = 1
+        for scene in scenes:
+            # Store top-level datablocks linked to this scene before its deletion.
+            # We want to delete datablocks in a hierarchical way for user counts to
+            # be relevant for detecting orphans.
+            # Collections containing collections and objects, they should be
+            # deleted first.
+            potentially_orphan_datablocks += scene.collection.children[:]
+            # Then, all objects without parents should be considered.
+            potentially_orphan_datablocks += [
+                obj for obj in scene.collection.all_objects if not obj.parent
+            ]
+
+    # Delete the scenes
+    for scene in scenes:
+        bpy.data.scenes.remove(scene)
+
+    del_count = len(scenes)
 
     if purge_orphan_datablocks:
         # Datablocks are deleted from top to bottom recursively, dealing with
         # all collections first, and hierarchies of objects afterwards.
-        for datablock in potentially_orphan_datablocks:
-            del_count += delete_datablock_if_orphan(datablock)
+        del_count += delete_orphan_datablocks(potentially_orphan_datablocks)
 
     return del_count
 
 
+def delete_scene(scene: bpy.types.Scene, purge_orphan_datablocks: bool) -> int:
+    """
+    Delete `scene` and optionally delete datablock that were only used in this context.
+
+    :param scene: The scene to delete
+    :param purge_orphan_datablocks: Whether to delete orphan datablocks after scene deletion
+    :returns: The number of datablocks deleted by this operation
+    """
+    return delete_scenes([scene], purge_orphan_datablocks)
+
+
+# Strips to reload when exiting `batch_strip_reload` blocks, by strip pointer
+strip_reload_batches: list[dict[int, bpy.types.Strip]] = []
+
+
+@contextlib.contextmanager
+def batch_strip_reload():
+    """
+    Context manager deferring strip reloads: strips reloaded within this context
+    are reloaded all at once when exiting the outermost `batch_strip_reload` block.
+    """
+    strip_reload_batches.append({})
+    try:
+        yield
+    finally:
+        batch = strip_reload_batches.pop()
+        if strip_reload_batches:
+            strip_reload_batches[-1].update(batch)
+        else:
+            reload_strips(list(batch.values()))
+
+
 def reload_strip(strip: bpy.types.Strip):
-    """Re-evaluate content length and update `strip` display in the sequencer."""
-    # For the strip to re-evaluate its internal scene duration, we need
-    # to call the sequencer.reload operator, which runs on selected strips.
-    # Adjust sequence editor selection for this to work properly.
-    scene = strip.id_data
-    # Store sequence editor selection
-    selected_strips = [
-        (s, s.select_left_handle, s.select_right_handle)
-        for s in scene.sequence_editor.strips
-        if s.select
-    ]
-
-    with bpy.context.temp_override(scene=scene, sequencer_scene=scene):
-        # Deselect everything but our strip
-        bpy.ops.sequencer.select_all(action="DESELECT")
-        strip.select = True
-        # Force re-evaluation of strip scene's internal range and update strip display
-        bpy.ops.sequencer.reload()
-        # Restore sequence editor selection
-        bpy.ops.sequencer.select_all(action="DESELECT")
-        for strip, left, right in selected_strips:
-            strip.select = True
-            strip.select_left_handle = left
-            strip.select_right_handle = right
-
-
-def adapt_scene_range(strip: bpy.types.SceneStrip):
-    """Ensure `strip`'s internel range is fully contained in the scene its using."""
+    """Re-evaluate content length and update `strip` display in the sequencer.
+
+    Within a `batch_strip_reload` block, the reload is deferred until the end of
+    the block.
+    """
+    if strip_reload_batches:
+        strip_reload_batches[-1][strip.as_pointer()] = strip
+        return
+    reload_strips([strip])
+
+
+def reload_strips(strips: list[bpy.types.Strip]):
+    """Re-evaluate content length and update `strips` display in the sequencer."""
+    # Group strips by sequence editor
+    strips_by_scene: dict[bpy.types.Scene, list[bpy.types.Strip]] = {}
+    for strip in strips:
+        strips_by_scene.setdefault(strip.id_data, []).append(strip)
+
+    for scene, scene_strips in strips_by_scene.items():
+        # For strips to re-evaluate their internal scene duration, we need
+        # to call the sequencer.reload operator, which runs on selected strips.
+        # Adjust sequence editor selection for this to work properly.
+        selected_strips = [
+            (s, s.select_left_handle, s.select_right_handle)
+            for s in scene.sequence_editor.strips
+            if s.select
+        ]
+
+        with bpy.context.temp_override(scene=scene, sequencer_scene=scene):
+            # Deselect everything but our strips
+            for s, _, _ in selected_strips:
+                s.select = False
+            for s in scene_strips:
+                s.select = True
+            # Force re-evaluation of strips scene's internal range and update display
+            bpy.ops.sequencer.reload()
+            # Restore sequence editor selection
+            for s in scene_strips:
+                s.select = False
+            for s, left, right in selected_strips:
+                s.select = True
+                s.select_left_handle = left
+                s.select_right_handle = right
+
+
+def adapt_scene_range(strip: bpy.types.SceneStrip, reload: bool = True):
+    """Ensure `strip`'s internel range is fully contained in the scene its using.
+
+    :param strip: The shot strip to consider.
+    :param reload: Whether to reload the strip if its scene range was extended.
+        Interactive edits defer this until they are confirmed (see `reload_strip`).
+    """
     # Update internal scene's end frame if exceeding the original one
     new_frame_end = remap_frame_value(strip.right_handle - 1, strip)
     if new_frame_end <= strip.scene.frame_end:
         return
 
     strip.scene.frame_end = new_frame_end
-    reload_strip(strip)
+    if reload:
+        reload_strip(strip)
 
 
 def adjust_shot_duration(
     strip: bpy.types.Strip,
     handle_offset: int,
     from_frame_start: bool = False,
+    ripple: Optional[RippleEdit] = None,
+    reload: bool = True,
 ) -> bool:
     """
     Adjust the duration of `strip` and its underlying scene (if available) by offsetting either its end
@@ -516,6 +789,9 @@ def adjust_shot_duration(
     :param strip: The strip to adjust the duration of.
     :param handle_offset: The frame offset to apply.
     :param from_frame_start: Whether to offset shot's inner start frame rather than its end frame. (strip must be ``bpy.types.SceneStrip``.)
+    :param ripple: The ripple edit of the strips following `strip`, to reuse it
+        across successive adjustments (e.g. in interactive edits).
+    :param reload: Whether to reload the strip if its scene range was extended.
     :return: Whether the function modified the duration of `strip`.
     """
 
@@ -543,68 +819,45 @@ def adjust_shot_duration(
     if new_handle_offset == 0:
         return False
 
-    # Get sequence editor and scene from strip
-    sed_scene: bpy.types.Scene = strip.id_data
-    sed: bpy.types.SequenceEditor = sed_scene.sequence_editor
-
-    # Identify the other strips that must be shifted to adjust to this duration change
-    impacted_strips = sorted(
-        (
-            s
-            for s in sed.strips
-            if s.left_handle > strip.left_handle
-            and s.channel == strip.channel
-        ),
-        key=lambda s: s.left_handle,
-    )
-    # Shift all impacted strips by offset.
-    # Note: we adjust order of execution based on offset's sign to avoid
+    # The strips following `strip` on its channel are shifted to adjust to this
+    # duration change: from frame start, strip's final start is maintained and
+    # content is shifted, from frame end, strip's final end is shifted.
+    if ripple is None:
+        ripple = RippleEdit(strip)
+    shift = -new_handle_offset if from_frame_start else new_handle_offset
+
+    # Note: we adjust order of execution based on the shift direction to avoid
     #       overlaps at all time and strips automatically changing channels.
+    # Shifting to the right: move impacted strips first.
+    if shift > 0:
+        ripple.shift(ripple.offset + shift)
 
-    # Frame start: shift content by offset value and change duration while maintaining
-    #              strip's frame final start.
     if from_frame_start:
         # Positive offset: increase frame start => decrease strip duration
         if new_handle_offset > 0:
-            # 1. Adjust strip values
             strip.left_handle_offset += new_handle_offset
             strip.content_start -= new_handle_offset
-            # 2. Move impacted strips to the left
-            for s in impacted_strips:
-                s.content_start -= new_handle_offset
         # Negative offset: decrease frame start => increase strip duration
         else:
-            # 1. Move impacted strips to the right (reversed order)
-            for s in reversed(impacted_strips):
-                s.content_start -= new_handle_offset
-            # 2. Adjust strip values
             strip.content_start -= new_handle_offset
             strip.left_handle_offset += new_handle_offset
-
-    # Frame end: shift scene and strip's final frame by offset.
     else:
-        # Positive offset: increase frame end => increase duration
-        if new_handle_offset > 0:
-            # 1. Move impacted strips to the right (reversed order)
-            for s in reversed(impacted_strips):
-                s.content_start += new_handle_offset
-            # 2. Adjust strip's duration
-            strip.right_handle += new_handle_offset
-        # Negative offset: decrease frame end => decrease duration
-        else:
-            # 1. Adjust strip's duration
-            strip.right_handle += new_handle_offset
-            # 2. Move impacted strips to the left
-            for s in impacted_strips:
-                s.content_start += new_handle_offset
+        strip.right_handle += new_handle_offset
+
+    # Shifting to the left: move impacted strips last.
+    if shift < 0:
+        ripple.shift(ripple.offset + shift)
 
     if isinstance(strip, bpy.types.SceneStrip):
-        adapt_scene_range(strip)
+        adapt_scene_range(strip, reload)
     return True
 
 
 def slip_shot_content(
-    strip: bpy.types.SceneStrip, handle_offset: int, clamp_start: bool = False
+    strip: bpy.types.SceneStrip,
+    handle_offset: int,
+    clamp_start: bool = False,
+    reload: bool = True,
 ):
     """
     Slip `strip` content by `handle_offset`.
@@ -613,6 +866,7 @@ def slip_shot_content(
     :param strip: The shot strip to consider.
     :param handle_offset: The frame offset to apply.
     :param clamp_start: Whether to clamp to scene's frame start.
+    :param reload: Whether to reload the strip if its scene range was extended.
     """
     if clamp_start:
         # Clamp offset to never go beyond internal scene's frame start.
@@ -638,32 +892,17 @@ def slip_shot_content(
     # Ensure channel and duration are preserved
     strip.channel = channel
     strip.duration = duration
-    adapt_scene_range(strip)
+    adapt_scene_range(strip, reload)
 
 
 def get_valid_shot_scenes() -> list[bpy.types.Scene]:
     """Return the list of scenes considered as usable by a shot strip."""
-    prefs = get_addon_prefs()
-    return [
-        scene
-        for scene in bpy.data.scenes
-        if (
-            # Discard template scenes.
-            not scene.name.startswith(prefs.shot_template_prefix)
-            # Discard master sync scene.
-            and scene != get_sync_settings().master_scene
-            # Discard empty scenes.
-            and len(scene.collection.all_objects)
-        )
-    ]
+    return shot_catalogue.valid_shot_scenes()
 
 
 def get_scene_cameras(scene: bpy.types.Scene) -> list[bpy.types.Object]:
     """Return the list of cameras available in `scene`."""
-    return sorted(
-        (obj for obj in scene.objects if obj.type == "CAMERA"),
-        key=lambda x: x.name,
-    )
+    return shot_catalogue.scene_cameras(scene)
 
 def get_strip_container(sequence_editor:bpy.types.SequenceEditor) ->bpy.types.SequenceEditor|bpy.types.MetaStrip:
     """Returns either the current sequence editor or the current metastrip
@@ -698,6 +937,7 @@ def new_audition_strip(context:bpy.types, strips: List[bpy.types.SceneStrip]):
     meta_strip = make_meta_strip(strips, active_strip.name, active_strip.left_handle, active_strip.channel)
     meta_strip.right_handle = active_strip.right_handle
     meta_strip.audition.is_audition = True
+    meta_hierarchy_cache.invalidate()
     set_active_audition(context, meta_strip, active_strip)
 
 def get_audition_strip(strip:bpy.types.Strip) -> bpy.types.MetaStrip|None:
@@ -706,16 +946,14 @@ def get_audition_strip(strip:bpy.types.Strip) -> bpy.types.MetaStrip|None:
     if strip is None:
         return
 
-    if isinstance(strip, bpy.types.MetaStrip) and strip.audition.is_audition:
-        return strip
-
-    parent_strip = get_audition_strip(strip.parent_meta())
-    if parent_strip:
-        return parent_strip
+    return get_meta_hierarchy(strip).audition(strip)
 
 
 def set_active_audition(
-    context:bpy.types.Context, audition_strip: bpy.types.MetaStrip, active_strip: bpy.types.SceneStrip
+    context:bpy.types.Context,
+    audition_strip: bpy.types.MetaStrip,
+    active_strip: bpy.types.SceneStrip,
+    sync_update: bool = True,
 ):
     """Set the name of the active audition strip and adjust timeline accordingly"""
     for strip in audition_strip.strips:
@@ -729,7 +967,9 @@ def set_active_audition(
         adjust_shot_duration(audition_strip, offset)
     audition_strip.audition.active = active_strip.name
     audition_strip.name = f"Active: {active_strip.name}"
-    sync_system_update(context, force=True)
+    get_meta_hierarchy(audition_strip).set_active_take(audition_strip, active_strip)
+    if sync_update:
+        sync_system_update(context, force=True)
 
 
 class AuditionStripProperties(bpy.types.PropertyGroup):
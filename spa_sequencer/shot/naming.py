@@ -4,7 +4,7 @@
 from enum import Enum
 import re
 import string
-from typing import NamedTuple, Optional, Union
+from typing import Iterable, NamedTuple, Optional, Union
 
 import bpy
 
@@ -47,6 +47,9 @@ class ShotNaming:
     # Shot "no-take" value
     _take_none: str = ""
 
+    # Compiled shot regex, with the configuration it was built from.
+    _compiled_regex: Optional[tuple[tuple, re.Pattern]] = None
+
     @property
     def prefix_default(self):
         """Get default prefix (first item in prefixes)."""
@@ -108,6 +111,23 @@ class ShotNaming:
             rf"$"
         )
 
+    def compiled_shot_regex(self) -> re.Pattern:
+        """Get the compiled shot regex, rebuilt when the configuration changed.
+
+        :return: The compiled regex.
+        """
+        # Attributes can be changed on the class or the instance, and prefixes can
+        # be changed in place: compare the configuration rather than tracking it.
+        key = (
+            tuple(self.prefixes),
+            self.number_digits,
+            self.takes_count,
+            self.separator,
+        )
+        if self._compiled_regex is None or self._compiled_regex[0] != key:
+            self._compiled_regex = (key, re.compile(self.shot_regex()))
+        return self._compiled_regex[1]
+
     def build_shot_name(
         self, number: int, prefix: Optional[str] = None, take: Optional[str] = None
     ) -> str:
@@ -139,7 +159,34 @@ class ShotNaming:
         :param name: The name to consider.
         :return: The Match object on success, None otherwise.
         """
-        return re.fullmatch(self.shot_regex(), name)
+        return self.compiled_shot_regex().fullmatch(name)
+
+    def parse_many(self, names: Iterable[str]) -> list[Optional[ShotNameData]]:
+        """Extract shot name data components from each name of `names`.
+
+        :param names: The names to extract data from.
+        :return: The extracted shot name data of each name, None for names that
+            do not match the shot naming convention.
+        """
+        fullmatch = self.compiled_shot_regex().fullmatch
+        shots_data = []
+        for name in names:
+            match = fullmatch(name)
+            if match:
+                prefix, number, take = match.group("prefix", "number", "take")
+                shots_data.append(ShotNameData(prefix, int(number), take))
+            else:
+                shots_data.append(None)
+        return shots_data
+
+    def validate_many(self, names: Iterable[str]) -> list[bool]:
+        """Check whether each name of `names` matches the shot naming convention.
+
+        :param names: The names to check.
+        :return: Whether each name is a valid shot name.
+        """
+        fullmatch = self.compiled_shot_regex().fullmatch
+        return [fullmatch(name) is not None for name in names]
 
     def shot_data_from_name(self, name: str, strict: bool = True) -> ShotNameData:
         """Extract shot name data components from `name`.
@@ -184,7 +231,7 @@ class ShotNaming:
     ) -> str:
         """Get the next shot name from `shot_name`."""
         shot_data = self.shot_data_from_name(shot_name)
-        number = self.shot_data_from_name(shot_name).number
+        number = shot_data.number
         if custom_increment:
             number += custom_increment
         else:
@@ -198,7 +245,8 @@ class ShotNaming:
 
         :return: The list of scenes.
         """
-        return [s for s in bpy.data.scenes if self.match_name(s.name)]
+        fullmatch = self.compiled_shot_regex().fullmatch
+        return [s for s in bpy.data.scenes if fullmatch(s.name)]
 
     def next_shot_name_from_scenes(self, custom_increment: Optional[int] = None) -> str:
         """
@@ -221,10 +269,11 @@ class ShotNaming:
         :param sed: The sequence editor.
         :return: The list of Scene strips.
         """
+        fullmatch = self.compiled_shot_regex().fullmatch
         return [
             s
             for s in sed.strips
-            if isinstance(s, bpy.types.SceneStrip) and self.match_name(s.name)
+            if isinstance(s, bpy.types.SceneStrip) and fullmatch(s.name)
         ]
 
     def next_shot_name_from_sequences(
@@ -264,6 +313,58 @@ class ShotNaming:
         )
 
 
+class ShotNameAllocator:
+    """
+    Allocate successive shot names following the shots of a sequence editor.
+
+    The sequence editor is scanned once: successive names are the ones that
+    `ShotNaming.next_shot_name_from_sequences` would return if each allocated name
+    was used by a new shot strip in between.
+    """
+
+    def __init__(
+        self,
+        naming: ShotNaming,
+        sed: bpy.types.SequenceEditor,
+        custom_increment: Optional[int] = None,
+    ):
+        """
+        :param naming: The shot naming convention.
+        :param sed: The sequence editor (or meta strip) containing the shots.
+        :param custom_increment: Optional custom increment.
+        """
+        self.naming = naming
+        self.custom_increment = custom_increment
+        # Shot names are compared as strings, as when sorting them.
+        self.last_name: Optional[str] = max(
+            (s.name for s in naming.get_all_shot_strips(sed)), default=None
+        )
+
+    def add(self, name: str):
+        """Register the name of a shot strip created by other means.
+
+        :param name: The name of the shot strip.
+        """
+        if self.naming.match_name(name) and (
+            self.last_name is None or name > self.last_name
+        ):
+            self.last_name = name
+
+    def next_name(self) -> str:
+        """Allocate the next shot name.
+
+        :return: The next shot name.
+        """
+        if self.last_name is None:
+            name = self.naming.default_shot_name()
+        else:
+            name = self.naming.next_shot_name_from_name(
+                self.last_name, self.custom_increment
+            )
+        self.last_name = name
+        return name
+
+
 # Global ShotNaming instance
 shot_naming = ShotNaming()
 
@@ -4,20 +4,25 @@
 from typing import Optional, List
 
 import bpy
+from ..hierarchy import get_meta_hierarchy
 from ..preferences import get_addon_prefs
 from .core import (
     adjust_shot_duration,
-    delete_scene,
-    duplicate_scene,
+    batch_strip_reload,
+    delete_scenes,
+    duplicate_scene_bulk,
     get_valid_shot_scenes,
     rename_scene,
     slip_shot_content,
     new_audition_strip,
     get_audition_strip,
     set_active_audition,
-    get_strip_container
+    get_strip_container,
+    reload_strip,
 )
-from .naming import shot_naming, ShotNamingProperty
+from .catalogue import shot_catalogue
+from .naming import shot_naming, ShotNameAllocator, ShotNamingProperty
+from .ripple import RippleEdit
 from ..sync.core import (
     get_sync_master_strip,
     get_sync_settings,
@@ -88,37 +93,40 @@ class SEQUENCER_OT_shot_new(bpy.types.Operator):
     )
     bl_options = {"REGISTER", "UNDO"}
 
-    template_names = []
-
     def get_template_scenes(self, context):
         """Get the scenes matching template naming rule defined in preferences."""
         prefs = get_addon_prefs()
         prefix = prefs.shot_template_prefix
+        edit_scene = get_edit_scene(context)
 
-        shot_scenes = get_valid_shot_scenes()
-
-        def matches_mode(scene):
-            match self.scene_mode:
-                case "EXISTING":
-                    # Do not consider templates when using an existing scene.
-                    return scene in shot_scenes
-                case "TEMPLATE":
-                    # Only show template scenes in this case.
-                    return scene.name.startswith(prefix)
-                case "NEW":
-                    # No need for source scene in NEW mode
-                    return False
-                case _:
-                    return True
-
-        # Keep this enum values list alive (see https://developer.blender.org/T97243).
-        SEQUENCER_OT_shot_new.template_names = [
-            (s.name, s.name, "")
-            for s in bpy.data.scenes
-            if s != get_edit_scene(context) and matches_mode(s)
-        ]
-
-        return SEQUENCER_OT_shot_new.template_names
+        def build_items():
+            shot_scenes = set(get_valid_shot_scenes())
+
+            def matches_mode(scene):
+                match self.scene_mode:
+                    case "EXISTING":
+                        # Do not consider templates when using an existing scene.
+                        return scene in shot_scenes
+                    case "TEMPLATE":
+                        # Only show template scenes in this case.
+                        return scene.name.startswith(prefix)
+                    case "NEW":
+                        # No need for source scene in NEW mode
+                        return False
+                    case _:
+                        return True
+
+            return [
+                (s.name, s.name, "")
+                for s in bpy.data.scenes
+                if s != edit_scene and matches_mode(s)
+            ]
+
+        # The catalogue keeps this enum values list alive.
+        key = (shot_catalogue.scenes_key(), self.scene_mode, edit_scene.as_pointer())
+        return shot_catalogue.get_enum_items(
+            "SEQUENCER_OT_shot_new.source_scene", key, build_items
+        )
 
     def update_default_source_scene(self, context):
         if self.scene_mode == "EXISTING" and (
@@ -280,7 +288,7 @@ class SEQUENCER_OT_shot_new(bpy.types.Operator):
             left_handle_offset = 0  # No offset for a new scene
         else:
             # Duplicate source scene.
-            shot_scene = duplicate_scene(context, source_scene, self.name)
+            shot_scene = duplicate_scene_bulk(source_scene, self.name)
             # Set new scene's frame_end based on duration.
             # Note: the end frame must be last 'useful' frame, hence the -1.
             shot_scene.frame_end = shot_scene.frame_start + self.duration - 1
@@ -339,7 +347,7 @@ class SEQUENCER_OT_shot_duplicate(bpy.types.Operator):
     ) -> bpy.types.SceneStrip:
         strip_container = get_strip_container(strip.id_data.sequence_editor)
         if duplicate_scene:
-            shot_scene = duplicate_scene(context, strip.scene, name)
+            shot_scene = duplicate_scene_bulk(strip.scene, name)
         else:
             shot_scene = strip.scene
 
@@ -368,10 +376,15 @@ class SEQUENCER_OT_shot_duplicate(bpy.types.Operator):
         strip_container = get_strip_container(edit_scene.sequence_editor)
 
         new_strips = []
-        for strip in get_selected_scene_sequences(strip_container.strips):
-            name = shot_naming.next_shot_name_from_sequences(strip_container)
-            new_strip = self.duplicate_shot(context, strip, name, self.duplicate_scene)
-            new_strips.append(new_strip)
+        shot_names = ShotNameAllocator(shot_naming, strip_container)
+        # Reload duplicated strips all at once
+        with batch_strip_reload():
+            for strip in get_selected_scene_sequences(strip_container.strips):
+                name = shot_names.next_name()
+                new_strip = self.duplicate_shot(
+                    context, strip, name, self.duplicate_scene
+                )
+                new_strips.append(new_strip)
 
         if not new_strips:
             return {"CANCELLED"}
@@ -467,8 +480,7 @@ class SEQUENCER_OT_shot_delete(bpy.types.Operator):
             edit_scene.sequence_editor.strips.remove(strip)
 
         # Delete the scenes
-        for scene in scenes:
-            deleted_datablocks += delete_scene(scene, self.delete_orphan_scene_data)
+        deleted_datablocks += delete_scenes(list(scenes), self.delete_orphan_scene_data)
 
         context.area.tag_redraw()
         self.report(
@@ -553,6 +565,9 @@ class SEQUENCER_OT_shot_timing_adjust(bpy.types.Operator):
         self.original_strip_scene_end = self.strip.scene.frame_end
         self.original_strip_offset_start = self.strip.left_handle_offset
         self.original_edit_frame_end = get_sync_settings().master_scene.frame_end
+        # Strips following the active strip, shifted from their original position
+        # on each update.
+        self.ripple = RippleEdit(self.strip)
 
         context.window_manager.modal_handler_add(self)
         return {"RUNNING_MODAL"}
@@ -577,6 +592,9 @@ class SEQUENCER_OT_shot_timing_adjust(bpy.types.Operator):
             if self.offset == 0:
                 self.cancel(context)
                 return {"CANCELLED"}
+            # Reload the strip once, if its scene range was extended
+            if self.strip.scene.frame_end > self.original_strip_scene_end:
+                reload_strip(self.strip)
             self.restore_ui(context)
             return {"FINISHED"}
         # Update
@@ -605,13 +623,23 @@ class SEQUENCER_OT_shot_timing_adjust(bpy.types.Operator):
         #  - SHRINKS the strip if using left handle (from frame start)
         #  - EXTENDS the strip otherwise (from frame end)
         offset = -self.offset if from_frame_start else self.offset
+        # Interactive updates defer strip reloading until confirmation.
+        reload = not self.options.is_invoke
         # Compute current absolute offset from original duration
         if self.mode == "SLIP":
             delta = self.strip.left_handle_offset - self.original_strip_offset_start
-            slip_shot_content(self.strip, offset - delta, clamp_start=True)
+            slip_shot_content(
+                self.strip, offset - delta, clamp_start=True, reload=reload
+            )
         else:
             delta = self.strip.duration - self.original_strip_duration
-            adjust_shot_duration(self.strip, offset - delta, from_frame_start)
+            adjust_shot_duration(
+                self.strip,
+                offset - delta,
+                from_frame_start,
+                ripple=getattr(self, "ripple", None),
+                reload=reload,
+            )
 
         edit_scene = get_sync_settings().master_scene
         if from_frame_start or self.mode == "SLIP":
@@ -802,9 +830,10 @@ class SEQUENCER_OT_shot_chronological_numbering(bpy.types.Operator):
         return context.window_manager.invoke_props_dialog(self, width=350)
 
     def execute(self, context: bpy.types.Context):
+        sequence_editor = get_edit_scene(context).sequence_editor
         scene_strips = [
             strip
-            for strip in get_edit_scene(context).sequence_editor.strips
+            for strip in sequence_editor.strips
             if isinstance(strip, bpy.types.SceneStrip)
             or isinstance(strip, bpy.types.MetaStrip)
         ]
@@ -812,6 +841,9 @@ class SEQUENCER_OT_shot_chronological_numbering(bpy.types.Operator):
         if not scene_strips:
             return {"CANCELLED"}
 
+        # Strips are identified by pointer in the hierarchy: it stays valid while
+        # renaming strips.
+        hierarchy = get_meta_hierarchy(sequence_editor)
         tmp_suffix = ".tmp.rename"
         current_name = ""
         scenes_to_rename = set()
@@ -828,7 +860,11 @@ class SEQUENCER_OT_shot_chronological_numbering(bpy.types.Operator):
                 current_name = shot_naming.next_shot_name_from_name(current_name)
 
             if isinstance(strip, bpy.types.MetaStrip):
-                inner_scene_strips = [s for s in strip.strips if isinstance(s, bpy.types.SceneStrip)]
+                inner_scene_strips = [
+                    s
+                    for s in hierarchy.meta_strips(strip)
+                    if isinstance(s, bpy.types.SceneStrip)
+                ]
                 shot_data = shot_naming.shot_data_from_name(current_name, strict=False)
                 take_values = shot_naming.take_values[1:]  # skip empty (no-take) value
                 if len(inner_scene_strips) > len(take_values):
@@ -881,7 +917,7 @@ class SEQUENCER_OT_shot_chronological_numbering(bpy.types.Operator):
         for strip, (new_name, do_rename_scene) in items_to_rename.items():
 
             # Special Case for Audition strips 
-            audition_strip = get_audition_strip(strip)
+            audition_strip = hierarchy.audition(strip)
             if audition_strip == strip: # Don't rename the audition directly, use set_active_audition()
                 continue
             if audition_strip and audition_strip.audition.active + tmp_suffix == strip.name:
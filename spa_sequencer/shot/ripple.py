@@ -0,0 +1,90 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Ripple edits: shifting the strips following a strip on its channel.
+
+Strips of a container are indexed by channel, then by start frame, so that the
+strips following a given strip are a contiguous range of the index.
+A `RippleEdit` keeps track of the original position of these strips, computes
+their new positions in a single vectorised step, and only writes them in an
+order that never makes strips overlap (which would make Blender move them to
+another channel).
+"""
+
+from typing import Union
+
+import bpy
+import numpy as np
+
+from ..hierarchy import get_meta_hierarchy
+from ..timeline import TimelineSnapshot
+
+
+class ChannelIndex:
+    """Strips of a strip container, sorted by channel, then by start frame."""
+
+    def __init__(
+        self,
+        container: Union[bpy.types.SequenceEditor, bpy.types.MetaStrip],
+    ):
+        """
+        :param container: The sequence editor or meta strip containing the strips.
+        """
+        snapshot = TimelineSnapshot(container.strips)
+        order = snapshot.channel_order()
+        self.strips: list[bpy.types.Strip] = snapshot.strips(order)
+        self.channel: np.ndarray = snapshot.channel[order]
+        self.left: np.ndarray = snapshot.left[order]
+        # Read start frames as stored (single precision), but shift them in double
+        # precision so that sub-frame starts of far away strips are preserved.
+        content_start = snapshot.column("content_start", np.float32)
+        self.content_start: np.ndarray = content_start[order].astype(np.float64)
+
+    def following(self, strip: bpy.types.Strip) -> np.ndarray:
+        """Get the positions in the index of the strips starting after `strip` on
+        the same channel, sorted by start frame.
+
+        :param strip: The strip to consider.
+        :return: The positions in the index.
+        """
+        first, last = np.searchsorted(self.channel, [strip.channel, strip.channel + 1])
+        start = first + np.searchsorted(
+            self.left[first:last], strip.left_handle, side="right"
+        )
+        return np.arange(start, last)
+
+
+class RippleEdit:
+    """Shift of the strips following a strip on its channel."""
+
+    def __init__(self, strip: bpy.types.Strip):
+        """
+        :param strip: The strip whose following strips are shifted.
+        """
+        hierarchy = get_meta_hierarchy(strip)
+        container = hierarchy.parent(strip) or strip.id_data.sequence_editor
+        index = ChannelIndex(container)
+        positions = index.following(strip)
+        self.strips: list[bpy.types.Strip] = [index.strips[pos] for pos in positions]
+        self.original_content_start: np.ndarray = index.content_start[positions]
+        # Current shift of the strips from their original position.
+        self.offset = 0
+
+    def shift(self, offset: int):
+        """Shift the strips by `offset` frames from their original position.
+
+        :param offset: The offset from the original position, in frames.
+        """
+        delta = offset - self.offset
+        if delta == 0:
+            return
+        content_start = (self.original_content_start + offset).tolist()
+        # Move the strips in the direction of the shift first, so that strips
+        # never overlap.
+        order = range(len(self.strips))
+        if delta > 0:
+            order = reversed(order)
+        for idx in order:
+            self.strips[idx].content_start = content_start[idx]
+        self.offset = offset
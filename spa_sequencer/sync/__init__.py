@@ -7,18 +7,24 @@ Timeline Synchronization package.
 
 from ..sync import (
     core,
+    index,
     ops,
+    prefetch,
     ui,
 )
 
 
 def register():
+    index.register()
     core.register()
+    prefetch.register()
     ops.register()
     ui.register()
 
 
 def unregister():
+    index.unregister()
     core.unregister()
+    prefetch.unregister()
     ops.unregister()
     ui.unregister()
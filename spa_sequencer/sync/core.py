@@ -4,11 +4,18 @@
 from contextlib import contextmanager
 from typing import Any, Callable, Optional, Union, Type
 import ctypes
+import time
 
 import bpy
 
+from ..events import EventSubscriber, event_router
+from ..hierarchy import get_meta_hierarchy
 from ..utils import is_grease_pencil_instance
 from ..utils import register_classes, unregister_classes
+from ..timeline import TimelineSnapshot
+from .index import master_strip_index
+from .profiler import sync_profiler
+from .trace import sync_trace_recorder
 
 
 StripType = Type[bpy.types.Strip]
@@ -17,10 +24,17 @@ StripType = Type[bpy.types.Strip]
 class TimelineSyncSettings(bpy.types.PropertyGroup):
     """Timeline Synchronization Settings."""
 
+    def enabled_update_callback(self, context):
+        # Configure workspaces once when the system gets enabled, instead of on
+        # every synchronization update.
+        if self.enabled:
+            disable_workspaces_time_sync(context.window_manager)
+
     enabled: bpy.props.BoolProperty(
         name="Enabled",
         description="Status of Timeline Synchronization system",
         default=False,
+        update=enabled_update_callback,
     )
 
     master_scene: bpy.props.PointerProperty(
@@ -113,6 +127,217 @@ class TimelineSyncSettings(bpy.types.PropertyGroup):
         update=use_preview_range_update_callback,
     )
 
+    low_latency_playback: bpy.props.BoolProperty(
+        name="Low-Latency Playback",
+        description=(
+            "During playback, only switch scenes and cameras: defer preview range "
+            "and active strip updates until playback stops"
+        ),
+        default=False,
+    )
+
+    prefetch_next_scene: bpy.props.BoolProperty(
+        name="Prefetch Next Scenes",
+        description=(
+            "During playback, evaluate the scenes of upcoming strips ahead of time "
+            "to avoid hitches when switching to them"
+        ),
+        default=False,
+    )
+
+    prefetch_frames: bpy.props.IntProperty(
+        name="Look-Ahead",
+        description="Number of frames to look ahead for upcoming strips",
+        default=24,
+        min=1,
+        soft_max=250,
+    )
+
+    prefetch_max_scenes: bpy.props.IntProperty(
+        name="Max Warm Scenes",
+        description=(
+            "Maximum number of upcoming scenes kept evaluated ahead of time, "
+            "limiting the memory used by prefetching"
+        ),
+        default=2,
+        min=1,
+        soft_max=8,
+    )
+
+    coalesce_scrubbing: bpy.props.BoolProperty(
+        name="Coalesce Scrubbing",
+        description=(
+            "While scrubbing, only switch scenes once the playhead settles, "
+            "instead of switching to every intermediate shot"
+        ),
+        default=False,
+    )
+
+    scrub_switch_delay: bpy.props.FloatProperty(
+        name="Switch Delay",
+        description=(
+            "Idle time (in seconds) after which the scene switch is applied "
+            "while scrubbing"
+        ),
+        default=0.15,
+        min=0.0,
+        soft_max=1.0,
+    )
+
+    lazy_scrub_evaluation: bpy.props.BoolProperty(
+        name="Lazy Scrub Evaluation",
+        description=(
+            "While scrubbing fast, defer setting shot scenes' current frame, which "
+            "evaluates them, until scrubbing slows down"
+        ),
+        default=False,
+    )
+
+    lazy_scrub_rate: bpy.props.FloatProperty(
+        name="Event Rate Threshold",
+        description=(
+            "Rate of frame changes (per second) above which scene evaluation "
+            "is skipped while scrubbing"
+        ),
+        default=24.0,
+        min=1.0,
+        soft_max=120.0,
+    )
+
+    def get_profiling(self) -> bool:
+        return sync_profiler.enabled
+
+    def set_profiling(self, value: bool):
+        sync_profiler.enabled = value
+
+    profiling: bpy.props.BoolProperty(
+        name="Profiling",
+        description=(
+            "Record timings of Timeline Synchronization updates for analysis. "
+            "This adds a small overhead to each update"
+        ),
+        get=get_profiling,
+        set=set_profiling,
+    )
+
+
+class PlaybackSyncState:
+    """Bookkeeping of the Timeline Synchronization during animation playback."""
+
+    def __init__(self):
+        # Names of the updates deferred until playback stops.
+        self.pending_updates: set[str] = set()
+        # Statistics of the current (or last) playback.
+        self.frames: int = 0
+        self.dropped_frames: int = 0
+
+    def reset_stats(self):
+        """Reset playback statistics."""
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def record_frame(self, offset: int):
+        """Record a master frame change of `offset` frames during playback.
+
+        :param offset: Frame offset with the previously synchronized master frame.
+        """
+        self.frames += 1
+        # Frames skipped to keep up with the scene framerate.
+        # Negative offsets come from playback looping back to the start.
+        if offset > 1:
+            self.dropped_frames += offset - 1
+
+
+playback_state = PlaybackSyncState()
+
+
+class ScrubSyncState:
+    """Bookkeeping of scene switches coalesced while scrubbing."""
+
+    def __init__(self):
+        # Window to synchronize once the playhead settles.
+        self.window: Optional[bpy.types.Window] = None
+        # Number of scene switches coalesced, exposed for profiling purposes.
+        self.coalesced_switches: int = 0
+
+    def defer_switch(self, window: bpy.types.Window, delay: float):
+        """(Re)start the countdown to synchronize `window` after `delay` seconds.
+
+        :param window: The window to synchronize.
+        :param delay: Idle time in seconds.
+        """
+        self.window = window
+        self.coalesced_switches += 1
+        if bpy.app.timers.is_registered(flush_coalesced_scrub):
+            bpy.app.timers.unregister(flush_coalesced_scrub)
+        bpy.app.timers.register(flush_coalesced_scrub, first_interval=delay)
+
+    def cancel(self):
+        """Cancel the pending synchronization, if any."""
+        self.window = None
+        if bpy.app.timers.is_registered(flush_coalesced_scrub):
+            bpy.app.timers.unregister(flush_coalesced_scrub)
+
+
+scrub_state = ScrubSyncState()
+
+
+class LazyEvaluationState:
+    """Bookkeeping of scene evaluations skipped while scrubbing fast."""
+
+    # Smoothing factor of the event rate moving average.
+    RATE_SMOOTHING = 0.5
+
+    def __init__(self):
+        self.last_event_time: Optional[float] = None
+        # Smoothed rate of frame change events, per second.
+        self.rate: float = 0.0
+        # Name of the scene to evaluate once scrubbing slows down, and its frame.
+        self.pending_scene: str = ""
+        self.pending_frame: int = 0
+        # Number of skipped evaluations, exposed for profiling purposes.
+        self.skipped_evaluations: int = 0
+
+    def record_event(self) -> float:
+        """Record a frame change event and return the updated event rate."""
+        now = time.perf_counter()
+        if self.last_event_time is not None and now > self.last_event_time:
+            rate = 1.0 / (now - self.last_event_time)
+            self.rate += self.RATE_SMOOTHING * (rate - self.rate)
+        else:
+            self.rate = 0.0
+        self.last_event_time = now
+        return self.rate
+
+    def reset(self):
+        """Reset the event rate, e.g. when scrubbing stops."""
+        self.last_event_time = None
+        self.rate = 0.0
+
+    def defer_evaluation(self, scene: bpy.types.Scene, frame: int, max_rate: float):
+        """Set the frame of `scene`, evaluating it, once no event happened during
+        1 / `max_rate` seconds.
+
+        :param scene: The scene to evaluate.
+        :param frame: The frame to evaluate the scene at.
+        :param max_rate: The event rate threshold.
+        """
+        self.pending_scene = scene.name
+        self.pending_frame = frame
+        self.skipped_evaluations += 1
+        if bpy.app.timers.is_registered(flush_lazy_evaluation):
+            bpy.app.timers.unregister(flush_lazy_evaluation)
+        bpy.app.timers.register(flush_lazy_evaluation, first_interval=1.0 / max_rate)
+
+    def cancel(self):
+        """Cancel the pending evaluation, if any."""
+        self.pending_scene = ""
+        if bpy.app.timers.is_registered(flush_lazy_evaluation):
+            bpy.app.timers.unregister(flush_lazy_evaluation)
+
+
+lazy_eval_state = LazyEvaluationState()
+
 
 def get_sync_settings() -> TimelineSyncSettings:
     """Return the TimelineSyncSettings instance."""
@@ -172,7 +397,7 @@ def remap_frame_value(frame: int, scene_strip: bpy.types.SceneStrip) -> int:
 
 def get_strips_at_frame(
     frame: int,
-    strips: list[bpy.types.Strip],
+    strips: Union[bpy.types.bpy_prop_collection, list[bpy.types.Strip]],
     type_filter: Union[StripType, tuple[StripType, ...]] = None,
     skip_muted: bool = True,
 ) -> list[bpy.types.Strip]:
@@ -185,15 +410,8 @@ def get_strips_at_frame(
     :param skip_muted: Whether to skip muted strips
     :returns: The subset of strips matching the given parameters
     """
-    return [
-        s
-        for s in strips
-        if (
-            (not type_filter or isinstance(s, type_filter))
-            and (not skip_muted or not s.mute)
-            and (frame >= s.left_handle and frame < s.right_handle)
-        )
-    ]
+    snapshot = TimelineSnapshot(strips)
+    return snapshot.strips(snapshot.at_frame(frame, type_filter, skip_muted))
 
 
 def get_scene_strip_at_frame(
@@ -211,28 +429,37 @@ def get_scene_strip_at_frame(
     :returns: The scene strip (or None) and the frame in underlying scene's reference
     """
 
-    strips = sequence_container.strips
+    snapshot = TimelineSnapshot(sequence_container.strips)
     channels = sequence_container.channels
 
+    muted_channels = None
     if skip_muted:
         # Exclude strips from muted channels
         muted_channels = [idx for idx, channel in enumerate(channels) if channel.mute]
-        strips = [strip for strip in strips if not strip.channel in muted_channels]
 
-    strips = get_strips_at_frame(
-        frame, strips, (bpy.types.SceneStrip, bpy.types.MetaStrip), skip_muted
+    indices = snapshot.at_frame(
+        frame,
+        (bpy.types.SceneStrip, bpy.types.MetaStrip),
+        skip_muted,
+        muted_channels,
     )
 
-    if not strips:
+    if not len(indices):
         return None, frame
-    # Sort strips by channel
-    strip = sorted(strips, key=lambda x: x.channel)[-1]
+    # Pick the strip with the highest channel
+    strip = snapshot.items[indices[snapshot.channel[indices].argmax()]]
 
     if isinstance(strip, bpy.types.MetaStrip):
-        # Drop the frame value, inner metastrip timing matches outer timeline
-        strip, _ = get_scene_strip_at_frame(frame, strip, skip_muted)
-        if not strip:
-            return None, frame
+        # Audition groups resolve to their active take when the other takes are
+        # muted, without looking up the meta strip's strips.
+        take = get_audition_take_at_frame(frame, strip) if skip_muted else None
+        if take:
+            strip = take
+        else:
+            # Drop the frame value, inner metastrip timing matches outer timeline
+            strip, _ = get_scene_strip_at_frame(frame, strip, skip_muted)
+            if not strip:
+                return None, frame
 
     # Help type checking: strip can only be a SceneStrip here
     assert isinstance(strip, bpy.types.SceneStrip)
@@ -245,75 +472,222 @@ def get_scene_strip_at_frame(
     return strip, remap_frame_value(frame, strip)
 
 
-@contextmanager
-def scene_change_manager(context: bpy.types.Context):
+def get_audition_take_at_frame(
+    frame: int, meta_strip: bpy.types.MetaStrip
+) -> Optional[bpy.types.SceneStrip]:
     """
-    A context manager for saving/restoring states when changing a window's active Scene.
+    Get the active take of the audition group `meta_strip` if it is the only unmuted
+    strip at `frame`, which makes it the strip resolved by `get_scene_strip_at_frame`.
 
-    :param context: The current context
+    :param frame: The frame value
+    :param meta_strip: The meta strip
+    :returns: The active take, or None if it has to be resolved from all strips
     """
-    sync_settings = get_sync_settings()
-    tool_settings = context.window.scene.tool_settings
+    if not meta_strip.audition.is_audition:
+        return None
+    hierarchy = get_meta_hierarchy(meta_strip)
+    take = hierarchy.active_take(meta_strip)
+    if (
+        not isinstance(take, bpy.types.SceneStrip)
+        or take.mute
+        or not take.left_handle <= frame < take.right_handle
+        or meta_strip.channels[take.channel].mute
+    ):
+        return None
+    if any(not s.mute for s in hierarchy.meta_strips(meta_strip) if s != take):
+        return None
+    return take
+
+
+def get_master_scene_strip_at_frame(
+    frame: int,
+    master_scene: bpy.types.Scene,
+) -> tuple[Union[bpy.types.SceneStrip, None], int]:
+    """
+    Get the scene strip at `frame` in `master_scene`'s sequence editor, using the
+    persistent master timeline index.
+
+    This is equivalent to `get_scene_strip_at_frame` on the master sequence editor.
 
-    def get_attrs(obj: object, names: list[str]) -> dict[str, Any]:
+    :param frame: The frame value
+    :param master_scene: The master scene of the Timeline Synchronization
+    :returns: The scene strip (or None) and the frame in underlying scene's reference
+    """
+    build_count = master_strip_index.build_count
+    strip = master_strip_index.lookup(master_scene.sequence_editor, frame)
+    sync_profiler.count_cache(
+        "strip_index", master_strip_index.build_count == build_count
+    )
+    if not strip:
+        return None, frame
+    return strip, remap_frame_value(frame, strip)
+
+
+class GPToolSettingsSnapshot:
+    """Grease Pencil tool settings kept while navigating between shot scenes.
+
+    The snapshot is captured from the active scene before a scene switch, and
+    applied to the new scene after it. It is then reused for the next switches,
+    until the user edits tool settings (reported by the message bus) or the window
+    shows another scene than the one it was applied to.
+    Settings that are not available in a scene (e.g. no Grease Pencil paint
+    settings) are kept from previous captures.
+    """
+
+    PAINT_ATTRS = ("brush", "color_mode", "palette")
+    SCULPT_ATTRS = ("brush",)
+    EDIT_ATTRS = ("gpencil_selectmode_edit",)
+    # Grease Pencil paint options set by SPA 2D animation addon.
+    SCENE_ATTRS = ("mode", "vertex_color_style")
+
+    def __init__(self):
+        self.paint_settings: dict[str, Any] = {}
+        self.sculpt_settings: dict[str, Any] = {}
+        self.edit_settings: dict[str, Any] = {}
+        self.scene_settings: dict[str, Any] = {}
+        self.gp_material = ""
+        # Session uid of the scene the snapshot is up to date with.
+        self.scene_uid: Optional[int] = None
+        self.dirty = True
+
+    def mark_dirty(self):
+        """Capture the snapshot again on the next scene switch."""
+        self.dirty = True
+
+    def is_valid(self, scene: bpy.types.Scene) -> bool:
+        """Whether the snapshot matches `scene`'s current settings.
+
+        :param scene: The scene displayed in the window before switching.
+        """
+        # Message bus notifications are not dispatched in background mode.
+        return (
+            not self.dirty
+            and not bpy.app.background
+            and self.scene_uid == scene.session_uid
+        )
+
+    @staticmethod
+    def _get_attrs(obj: object, names: tuple[str, ...], previous: dict) -> dict:
         """Get several named attributes from an object as a {name: value} dict."""
-        return {name: getattr(obj, name) for name in names} if obj else {}
+        return {name: getattr(obj, name) for name in names} if obj else previous
+
+    def capture(self, context: bpy.types.Context):
+        """Capture the tool settings of the window's scene.
+
+        :param context: The current context.
+        """
+        sync_settings = get_sync_settings()
+        scene = context.window.scene
+        tool_settings = scene.tool_settings
+        self.paint_settings = self._get_attrs(
+            tool_settings.gpencil_paint, self.PAINT_ATTRS, self.paint_settings
+        )
+        self.sculpt_settings = self._get_attrs(
+            tool_settings.gpencil_sculpt_paint, self.SCULPT_ATTRS, self.sculpt_settings
+        )
+        self.edit_settings = self._get_attrs(
+            tool_settings, self.EDIT_ATTRS, self.edit_settings
+        )
+        self.scene_settings = self._get_attrs(
+            getattr(scene, "gp_paint_color", None),
+            self.SCENE_ATTRS,
+            self.scene_settings,
+        )
+
+        # Store the active GP material and mode if any
+        active_object = context.active_object
+        if active_object and is_grease_pencil_instance(active_object.data):
+            material = active_object.active_material
+            self.gp_material = material.name if material else ""
+            sync_settings.last_gp_mode = active_object.mode
+
+        self.scene_uid = scene.session_uid
+        self.dirty = False
+        sync_profiler.count("gp_snapshot_captures")
+
+    def apply(self, context: bpy.types.Context):
+        """Apply the snapshot to the window's scene, only writing changed values.
+
+        :param context: The current context.
+        """
+        scene = context.window.scene
+        tool_settings = scene.tool_settings
+        self._set_attrs(context, tool_settings.gpencil_paint, self.paint_settings)
+        self._set_attrs(
+            context, tool_settings.gpencil_sculpt_paint, self.sculpt_settings
+        )
+        self._set_attrs(context, tool_settings, self.edit_settings)
+        self._set_attrs(
+            context, getattr(scene, "gp_paint_color", None), self.scene_settings
+        )
 
-    def set_attrs(obj: object, attrs: dict[str, Any]):
-        """Set several named attributes on an object."""
+        # If the new active object is a GP, restore the previously stored
+        # material as active if also assigned.
+        if (gpencil := context.active_object) and is_grease_pencil_instance(
+            gpencil.data
+        ):
+            if self.gp_material:
+                material_idx = gpencil.data.materials.find(self.gp_material)
+                if material_idx >= 0 and gpencil.active_material_index != material_idx:
+                    gpencil.active_material_index = material_idx
+
+            gp_mode = get_sync_settings().last_gp_mode
+            if gp_mode and gpencil.mode != gp_mode:
+                sync_profiler.count("gp_mode_sets")
+                set_gpencil_mode_safe(context, gpencil, gp_mode)
+            elif gp_mode:
+                sync_profiler.count("gp_mode_sets_skipped")
+
+        self.scene_uid = scene.session_uid
+
+    @staticmethod
+    def _set_attrs(context: bpy.types.Context, obj: object, attrs: dict[str, Any]):
+        """Set several named attributes on an object, if their value differ."""
         if not obj:
             return
         for key, value in attrs.items():
+            if getattr(obj, key, None) == value:
+                sync_profiler.count("gp_settings_writes_skipped")
+                continue
+            sync_profiler.count("gp_settings_writes")
             if key == "brush":
                 set_grease_pencil_brush(context, value)
-                continue
-                
-            if getattr(obj, key, None) != value:
+            else:
                 setattr(obj, key, value)
 
-    # Store settings
-    if sync_settings.keep_gpencil_tool_settings:
-        paint_settings = get_attrs(
-            tool_settings.gpencil_paint, ("brush", "color_mode", "palette")
-        )
-        sculpt_settings = get_attrs(tool_settings.gpencil_sculpt_paint, ("brush",))
-        edit_settings = get_attrs(tool_settings, ("gpencil_selectmode_edit",))
 
-        # Safely get GP paint option set by SPA 2D animation addon.
-        if hasattr(context.window.scene, "gp_paint_color"):
-            scene_settings = get_attrs(
-                context.window.scene.gp_paint_color, ("mode", "vertex_color_style")
-            )
+# Grease Pencil tool settings kept between scenes.
+gp_tool_settings = GPToolSettingsSnapshot()
 
-        # Store the active GP material and mode if any
-        gp_material = None
 
-        if context.active_object and is_grease_pencil_instance(context.active_object.data):
-            gp_material = context.active_object.active_material
-            sync_settings.last_gp_mode = context.active_object.mode
+def on_gp_tool_settings_changed():
+    """Message bus callback for Grease Pencil tool settings edits."""
+    gp_tool_settings.mark_dirty()
+
+
+@contextmanager
+def scene_change_manager(context: bpy.types.Context):
+    """
+    A context manager for saving/restoring states when changing a window's active Scene.
+
+    :param context: The current context
+    """
+    keep_settings = get_sync_settings().keep_gpencil_tool_settings
+
+    # Store settings, unless they did not change since the last scene switch.
+    if keep_settings:
+        if gp_tool_settings.is_valid(context.window.scene):
+            sync_profiler.count("gp_snapshot_reuses")
+        else:
+            gp_tool_settings.capture(context)
 
     yield
 
     # Apply settings
-    if sync_settings.keep_gpencil_tool_settings:
-        tool_settings = context.window.scene.tool_settings
-        set_attrs(tool_settings.gpencil_paint, paint_settings)
-        set_attrs(tool_settings.gpencil_sculpt_paint, sculpt_settings)
-        set_attrs(tool_settings, edit_settings)
-        if hasattr(context.window.scene, "gp_paint_color"):
-            set_attrs(context.window.scene.gp_paint_color, scene_settings)
-
-        # If the new active object is a GP, restore the previously stored material
-        # as active if also assigned.
-        if (gpencil := context.active_object) and is_grease_pencil_instance(gpencil.data):
-            if gp_material:
-                material_idx = gpencil.data.materials.find(gp_material.name)
-                if material_idx >= 0:
-                    gpencil.active_material_index = material_idx
+    if keep_settings:
+        with sync_profiler.phase("gp_restore"):
+            gp_tool_settings.apply(context)
 
-            gp_mode = sync_settings.last_gp_mode
-            if gp_mode and gpencil.mode != gp_mode:
-                set_gpencil_mode_safe(context, gpencil, gp_mode)
 
 def set_grease_pencil_brush(context: bpy.types.Context, brush: bpy.types.Brush):
     # TODO  Remove temporary workaround for https://projects.blender.org/blender/blender/issues/152862
@@ -367,6 +741,92 @@ def set_gpencil_mode_safe(
         bpy.ops.object.mode_set(mode=mode)
 
 
+class MasterStripCache:
+    """Cache of the strip resolved from the last synchronization update's name.
+
+    The strip is resolved again only when the master scene, the cached strip name
+    or the master timeline changed.
+    """
+
+    def __init__(self):
+        self.key: Optional[tuple[int, str, int]] = None
+        self.strip: Optional[bpy.types.SceneStrip] = None
+
+    def get(self, settings: TimelineSyncSettings) -> Optional[bpy.types.SceneStrip]:
+        """Get the strip named `settings.last_master_strip` in the master scene.
+
+        :param settings: The synchronization settings.
+        :returns: The strip if any, None otherwise.
+        """
+        master_scene = settings.master_scene
+        key = (
+            master_scene.session_uid,
+            settings.last_master_strip,
+            master_strip_index.generation,
+        )
+        if key == self.key:
+            sync_profiler.count_cache("master_strip", True)
+            return self.strip
+        sync_profiler.count_cache("master_strip", False)
+        self.strip = master_scene.sequence_editor.strips_all.get(key[1])
+        self.key = key
+        return self.strip
+
+    def clear(self):
+        """Drop the cached strip."""
+        self.key = None
+        self.strip = None
+
+
+master_strip_cache = MasterStripCache()
+
+
+class WindowSyncState:
+    """Synchronization state last applied to each window.
+
+    Windows still showing the state applied by a previous update are skipped.
+    """
+
+    def __init__(self):
+        # {window pointer: (strip name, scene session uid, camera session uid)}
+        self.states: dict[int, tuple[str, int, int]] = {}
+
+    @staticmethod
+    def make_state(strip: bpy.types.SceneStrip) -> tuple[str, int, int]:
+        """Get the state applied to windows by the synchronization of `strip`."""
+        camera = strip.scene_camera
+        return (
+            strip.name,
+            strip.scene.session_uid,
+            camera.session_uid if camera else 0,
+        )
+
+    def is_synced(
+        self, window: bpy.types.Window, window_scene: bpy.types.Scene, state: tuple
+    ) -> bool:
+        """Whether `state` is the last one applied to `window`, still showing it.
+
+        :param window: The window.
+        :param window_scene: The scene currently displayed in `window`.
+        :param state: The target state, as returned by `make_state`.
+        """
+        return (
+            self.states.get(window.as_pointer()) == state
+            and window_scene.session_uid == state[1]
+        )
+
+    def store(self, window: bpy.types.Window, state: tuple):
+        """Store `state` as the last state applied to `window`."""
+        self.states[window.as_pointer()] = state
+
+    def clear(self):
+        """Forget the state of all windows."""
+        self.states.clear()
+
+
+window_sync_state = WindowSyncState()
+
+
 def get_sync_master_strip(
     use_cache: bool = False,
 ) -> tuple[Union[bpy.types.SceneStrip, None], int]:
@@ -381,15 +841,9 @@ def get_sync_master_strip(
         return None, -1
 
     if use_cache:
-        return (
-            master_scene.sequence_editor.strips_all.get(settings.last_master_strip),
-            settings.last_strip_scene_frame,
-        )
+        return master_strip_cache.get(settings), settings.last_strip_scene_frame
 
-    return get_scene_strip_at_frame(
-        master_scene.frame_current,
-        master_scene.sequence_editor,
-    )
+    return get_master_scene_strip_at_frame(master_scene.frame_current, master_scene)
 
 
 def update_preview_range(scene_strip: bpy.types.SceneStrip):
@@ -416,11 +870,97 @@ def update_preview_range(scene_strip: bpy.types.SceneStrip):
         scene_strip.scene.frame_preview_end = end
 
 
-def sync_system_update(context: bpy.types.Context, force: bool = False):
+def disable_workspaces_time_sync(window_manager: bpy.types.WindowManager):
+    """Disable scene time synchronization in the workspaces of all windows.
+
+    This is applied when the system gets enabled and when a window's workspace
+    changes, not on synchronization updates.
+
+    :param window_manager: The window manager.
+    """
+    if bpy.app.version >= (5, 0, 0):
+        for window in window_manager.windows:
+            if window.workspace.use_scene_time_sync:
+                window.workspace.use_scene_time_sync = False
+
+
+# Owner of the message bus subscriptions of the Timeline Synchronization.
+msgbus_owner = object()
+
+
+def on_window_workspace_changed():
+    """Message bus callback for window workspace changes."""
+    if get_sync_settings().enabled:
+        disable_workspaces_time_sync(bpy.context.window_manager)
+
+
+def get_gp_tool_settings_msgbus_keys() -> list[tuple[Type, str]]:
+    """Get the message bus keys of the properties kept by `GPToolSettingsSnapshot`,
+    and of the active object's material and mode.
+    """
+
+    def struct_type(owner: Type, prop_name: str) -> Optional[Type]:
+        """Get the type of the pointer property `prop_name` of `owner`."""
+        if prop := owner.bl_rna.properties.get(prop_name):
+            return getattr(bpy.types, prop.fixed_type.identifier, None)
+        return None
+
+    keys = [
+        (bpy.types.ToolSettings, name) for name in GPToolSettingsSnapshot.EDIT_ATTRS
+    ]
+    for owner, prop_name, attrs in (
+        (bpy.types.ToolSettings, "gpencil_paint", GPToolSettingsSnapshot.PAINT_ATTRS),
+        (
+            bpy.types.ToolSettings,
+            "gpencil_sculpt_paint",
+            GPToolSettingsSnapshot.SCULPT_ATTRS,
+        ),
+        (bpy.types.Scene, "gp_paint_color", GPToolSettingsSnapshot.SCENE_ATTRS),
+    ):
+        if settings_type := struct_type(owner, prop_name):
+            keys.extend((settings_type, name) for name in attrs)
+    keys.extend(
+        (
+            (bpy.types.Object, "active_material_index"),
+            (bpy.types.Object, "mode"),
+            (bpy.types.LayerObjects, "active"),
+        )
+    )
+    return keys
+
+
+def subscribe_to_rna_changes():
+    """Subscribe to window workspace changes and Grease Pencil tool settings edits.
+
+    Subscriptions are cleared when loading a file and need to be restored after.
+    """
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    if bpy.app.version >= (5, 0, 0):
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.Window, "workspace"),
+            owner=msgbus_owner,
+            args=(),
+            notify=on_window_workspace_changed,
+        )
+    for key in get_gp_tool_settings_msgbus_keys():
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=msgbus_owner,
+            args=(),
+            notify=on_gp_tool_settings_changed,
+        )
+
+
+@sync_profiler.profiled
+def sync_system_update(
+    context: bpy.types.Context, force: bool = False, immediate: bool = False
+):
     """Perform the synchronization system update.
 
     :param context: The active context.
     :param force: Whether to force the update, even if time did not change.
+    :param immediate: Whether to apply all updates now, ignoring scrubbing
+        optimizations.
     """
 
     # Discard windows without scene (may happen during render)
@@ -438,11 +978,11 @@ def sync_system_update(context: bpy.types.Context, force: bool = False):
         or not master_scene.sequence_editor
     ):
         return
-    
-    # Disable sync_scene_time in active workspaces.
-    if bpy.app.version >= (5, 0, 0):
-        for window in context.window_manager.windows:
-            window.workspace.use_scene_time_sync = False
+
+    is_playing = bool(context.screen and context.screen.is_animation_playing)
+    # In low-latency playback mode, only apply scene and camera switches while
+    # playing: other updates are deferred until playback stops.
+    defer_updates = is_playing and sync_settings.low_latency_playback
 
     # In order to evaluate if the master scene's current frame has changed,
     # we current have to rely on a system that stores the last frame values
@@ -478,10 +1018,10 @@ def sync_system_update(context: bpy.types.Context, force: bool = False):
         offset = win_scene.frame_current - sync_settings.last_strip_scene_frame
 
         # Evaluate strip in master scene when applying this offset
-        new_strip, _ = get_scene_strip_at_frame(
-            master_scene.frame_current + offset,
-            master_scene.sequence_editor,
-        )
+        with sync_profiler.phase("strip_lookup"):
+            new_strip, _ = get_master_scene_strip_at_frame(
+                master_scene.frame_current + offset, master_scene
+            )
 
         # No strip is available: stop here.
         if not new_strip:
@@ -528,14 +1068,31 @@ def sync_system_update(context: bpy.types.Context, force: bool = False):
         scene_frame_set(context, master_scene, master_scene.frame_current + offset)
         return
 
+    if is_playing and not force:
+        playback_state.record_frame(
+            master_scene.frame_current - sync_settings.last_master_frame
+        )
+
+    # Evaluate scenes lazily when frame changes come in faster than the threshold.
+    lazy_evaluation = False
+    if context.screen and context.screen.is_scrubbing:
+        rate = lazy_eval_state.record_event()
+        lazy_evaluation = (
+            not immediate
+            and sync_settings.lazy_scrub_evaluation
+            and rate > sync_settings.lazy_scrub_rate
+        )
+    elif lazy_eval_state.last_event_time is not None:
+        lazy_eval_state.reset()
+
     # Update cached frame cache value
     sync_settings.last_master_frame = master_scene.frame_current
 
     # Get scene strip at current frame
-    strip, inner_frame = get_scene_strip_at_frame(
-        master_scene.frame_current,
-        master_scene.sequence_editor,
-    )
+    with sync_profiler.phase("strip_lookup"):
+        strip, inner_frame = get_master_scene_strip_at_frame(
+            master_scene.frame_current, master_scene
+        )
     # Discard update if no such strip exists
     if not strip:
         sync_settings.last_master_strip = ""
@@ -551,46 +1108,206 @@ def sync_system_update(context: bpy.types.Context, force: bool = False):
     sync_settings.last_strip_scene_frame = inner_frame
     sync_settings.last_strip_scene_frame_out_of_range = False
 
+    target_windows = (
+        context.window_manager.windows
+        if sync_settings.sync_all_windows
+        else [context.window]
+    )
+
+    # While scrubbing, defer scene switches until the playhead settles: only keep
+    # the target scene's time up to date, without evaluating it.
+    if (
+        not immediate
+        and sync_settings.coalesce_scrubbing
+        and context.screen
+        and context.screen.is_scrubbing
+        and any(w.scene not in (strip.scene, master_scene) for w in target_windows)
+    ):
+        if strip.scene.frame_current != inner_frame:
+            strip.scene.frame_current = inner_frame
+        scrub_state.defer_switch(context.window, sync_settings.scrub_switch_delay)
+        sync_profiler.count("coalesced_scene_switches")
+        return
+
+    # The synchronization is up to date: drop any pending coalesced update.
+    if scrub_state.window:
+        scrub_state.cancel()
+
     # Update strip's underlying scene frame before making it active in context's window
     # to avoid unwanted updates in case bidirectional sync is enabled.
-    if strip.scene.frame_current != inner_frame:
-        scene_frame_set(context, strip.scene, inner_frame)
+    if lazy_evaluation and strip.scene.frame_current != inner_frame:
+        # Writing the frame evaluates the scene: defer it until scrubbing slows down.
+        lazy_eval_state.defer_evaluation(
+            strip.scene, inner_frame, sync_settings.lazy_scrub_rate
+        )
+        sync_profiler.count("skipped_evaluations")
+    else:
+        # A deferred evaluation is outdated by this update.
+        if lazy_eval_state.pending_scene:
+            lazy_eval_state.cancel()
+        if strip.scene.frame_current != inner_frame:
+            with sync_profiler.phase("inner_frame_set"):
+                scene_frame_set(context, strip.scene, inner_frame)
 
     if sync_settings.use_preview_range:
         # Update scene's preview range.
-        update_preview_range(strip)
+        if defer_updates:
+            playback_state.pending_updates.add("preview_range")
+        else:
+            with sync_profiler.phase("preview_range"):
+                update_preview_range(strip)
 
     # Synchronize target windows
-    for window in (
-        context.window_manager.windows
-        if sync_settings.sync_all_windows
-        else [context.window]
-    ):
+    target_scene = strip.scene
+    target_state = window_sync_state.make_state(strip)
+    has_synced_windows = False
+    updated_windows = []
+    switched_windows = []
+    for window in target_windows:
+        window_scene = window.scene
         # If window's scene is explicitly set to master scene, don't update it.
-        if not bpy.app.background and window.scene == master_scene:
+        if not bpy.app.background and window_scene == master_scene:
             continue
-        # Open strip's scene in window at the remapped frame
-        if window.scene != strip.scene:
-            # Use scene_change_manager to optionnaly keep tool settings between scenes
-            with scene_change_manager(context):
-                window.scene = strip.scene
-        # Use strip camera if specified
-        if strip.scene_camera and window.scene.camera != strip.scene_camera:
-            window.scene.camera = strip.scene_camera
+        has_synced_windows = True
+        # Skip windows already showing the target state.
+        if window_sync_state.is_synced(window, window_scene, target_state):
+            sync_profiler.count("skipped_windows")
+            continue
+        if window_scene != target_scene:
+            switched_windows.append(window)
+        updated_windows.append(window)
+
+    # Open strip's scene in windows at the remapped frame
+    if switched_windows:
+        sync_profiler.count("scene_switches", len(switched_windows))
+        # Use scene_change_manager to optionnaly keep tool settings between scenes.
+        # Settings are captured and restored once for all windows.
+        with scene_change_manager(context):
+            with sync_profiler.phase("scene_switch"):
+                for window in switched_windows:
+                    window.scene = target_scene
+
+    # Use strip camera if specified.
+    # Checked once for all windows, since they now share the strip's scene, and
+    # on every update since camera markers may have changed the scene's camera.
+    # NOTE: This is never deferred, since it defines what is being played back.
+    if has_synced_windows and strip.scene_camera:
+        if target_scene.camera != strip.scene_camera:
+            sync_profiler.count("camera_switches")
+            with sync_profiler.phase("camera"):
+                target_scene.camera = strip.scene_camera
+
+    for window in updated_windows:
+        window_sync_state.store(window, target_state)
 
     if sync_settings.active_follows_playhead:
+        if defer_updates:
+            playback_state.pending_updates.add("active_strip")
+        elif master_scene.sequence_editor.active_strip != strip:
+            master_scene.sequence_editor.active_strip = strip
+
+
+def flush_coalesced_scrub() -> None:
+    """Timer callback applying the scene switch coalesced while scrubbing."""
+    window = scrub_state.window
+    scrub_state.window = None
+    context = bpy.context
+    # Ensure the window still exists.
+    if not window or not any(w == window for w in context.window_manager.windows):
+        return None
+    # Timers run without window context: override it.
+    with context.temp_override(window=window, screen=window.screen):
+        sync_system_update(bpy.context, force=True, immediate=True)
+    return None
+
+
+def flush_lazy_evaluation() -> None:
+    """Timer callback evaluating the scene whose evaluation was deferred."""
+    scene = bpy.data.scenes.get(lazy_eval_state.pending_scene)
+    lazy_eval_state.pending_scene = ""
+    if scene:
+        scene.frame_set(lazy_eval_state.pending_frame)
+    return None
+
+
+def flush_deferred_sync_updates(context: bpy.types.Context):
+    """Apply the synchronization updates deferred during low-latency playback.
+
+    :param context: The active context.
+    """
+    pending = playback_state.pending_updates
+    if not pending:
+        return
+    playback_state.pending_updates = set()
+
+    sync_settings = get_sync_settings()
+    master_scene = sync_settings.master_scene
+    if (
+        not sync_settings.enabled
+        or not master_scene
+        or not master_scene.sequence_editor
+    ):
+        return
+
+    strip = master_scene.sequence_editor.strips_all.get(sync_settings.last_master_strip)
+    if not strip:
+        return
+
+    if "preview_range" in pending and sync_settings.use_preview_range:
+        update_preview_range(strip)
+
+    if "active_strip" in pending and sync_settings.active_follows_playhead:
         if master_scene.sequence_editor.active_strip != strip:
             master_scene.sequence_editor.active_strip = strip
 
 
-@bpy.app.handlers.persistent
+def is_sync_event_scene(scene: bpy.types.Scene) -> bool:
+    """Whether frame changes of `scene` may trigger a synchronization update.
+
+    These are frame changes of the master scene and, with bidirectional sync, of
+    windows' scene. The latter are discarded when triggered by the synchronization
+    update itself, while setting the strip scene's frame.
+
+    :param scene: The scene whose frame changed.
+    """
+    sync_settings = get_sync_settings()
+    if not sync_settings.enabled:
+        return False
+    if scene == sync_settings.master_scene:
+        return True
+    return (
+        sync_settings.bidirectional
+        and not frame_change_subscriber.running
+        and isinstance(bpy.context, bpy.types.Context)
+        and bpy.context.window is not None
+        and bpy.context.window.scene == scene
+    )
+
+
 def on_frame_changed(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
     # Early return when context is still a restricted context
     if not isinstance(bpy.context, bpy.types.Context):
         return
 
     # Update Timeline Synchronization system
-    sync_system_update(bpy.context)
+    if sync_trace_recorder.recording:
+        with sync_trace_recorder.record(bpy.context, scene):
+            sync_system_update(bpy.context)
+    else:
+        sync_system_update(bpy.context)
+
+
+def on_playback_started(*args):
+    """Animation playback pre handler callback."""
+    playback_state.reset_stats()
+
+
+def on_playback_stopped(*args):
+    """Animation playback post handler callback."""
+    # Early return when context is still a restricted context
+    if not isinstance(bpy.context, bpy.types.Context):
+        return
+    flush_deferred_sync_updates(bpy.context)
 
 
 def update_sync_cache_from_current_state():
@@ -610,7 +1327,6 @@ def update_sync_cache_from_current_state():
     sync_settings.last_strip_scene_frame_out_of_range = not strip
 
 
-@bpy.app.handlers.persistent
 def on_load_pre(*args):
     sync_settings = get_sync_settings()
     # Reset Timeline Synchronization settings
@@ -622,10 +1338,17 @@ def on_load_pre(*args):
     sync_settings.last_strip_scene_frame = -1
     sync_settings.last_strip_scene_frame_out_of_range = True
     sync_settings.last_gp_mode = ""
+    playback_state.pending_updates.clear()
+    master_strip_cache.clear()
+    window_sync_state.clear()
+    gp_tool_settings.mark_dirty()
+    sync_trace_recorder.stop()
+    scrub_state.cancel()
+    lazy_eval_state.cancel()
 
 
-@bpy.app.handlers.persistent
 def on_load_post(*args):
+    subscribe_to_rna_changes()
     sync_settings = get_sync_settings()
     # Auto-setup the system for the new file if the active screen contains
     # a Sequence Editor area defining a scene with at least 1 scene strip.
@@ -641,7 +1364,6 @@ def on_load_post(*args):
                 break
 
 
-@bpy.app.handlers.persistent
 def on_undo_redo(scene, _):
     """Undo/Redo post handler callback."""
     sync_settings = get_sync_settings()
@@ -666,6 +1388,9 @@ def on_undo_redo(scene, _):
 
 classes = (TimelineSyncSettings,)
 
+# Subscriber of the synchronization to frame changes, set on registration.
+frame_change_subscriber: Optional[EventSubscriber] = None
+
 
 def register():
     register_classes(classes)
@@ -677,23 +1402,43 @@ def register():
         name="Timeline Synchronization Settings",
     )
 
-    # React to scenes current frame changes
-    bpy.app.handlers.frame_change_post.append(on_frame_changed)
+    # React to master scene (and window scenes) current frame changes
+    global frame_change_subscriber
+    frame_change_subscriber = event_router.subscribe(
+        "frame_change_post",
+        on_frame_changed,
+        name="timeline_sync",
+        scene_filter=is_sync_event_scene,
+        coalesce=True,
+    )
     # React to file opening
-    bpy.app.handlers.load_pre.append(on_load_pre)
-    bpy.app.handlers.load_post.append(on_load_post)
+    event_router.subscribe("load_pre", on_load_pre)
+    event_router.subscribe("load_post", on_load_post)
 
-    bpy.app.handlers.undo_post.append(on_undo_redo)
-    bpy.app.handlers.redo_post.append(on_undo_redo)
+    event_router.subscribe("undo_post", on_undo_redo)
+    event_router.subscribe("redo_post", on_undo_redo)
+
+    # React to animation playback start and end
+    event_router.subscribe("animation_playback_pre", on_playback_started)
+    event_router.subscribe("animation_playback_post", on_playback_stopped)
+
+    # React to workspace changes in windows and tool settings edits
+    subscribe_to_rna_changes()
 
 
 def unregister():
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    scrub_state.cancel()
+    lazy_eval_state.cancel()
     unregister_classes(classes)
 
     del bpy.types.WindowManager.timeline_sync_settings
-    bpy.app.handlers.frame_change_post.remove(on_frame_changed)
-    bpy.app.handlers.load_pre.remove(on_load_pre)
-    bpy.app.handlers.load_post.remove(on_load_post)
+    event_router.unsubscribe("frame_change_post", on_frame_changed)
+    event_router.unsubscribe("load_pre", on_load_pre)
+    event_router.unsubscribe("load_post", on_load_post)
+
+    event_router.unsubscribe("undo_post", on_undo_redo)
+    event_router.unsubscribe("redo_post", on_undo_redo)
 
-    bpy.app.handlers.undo_post.remove(on_undo_redo)
-    bpy.app.handlers.redo_post.remove(on_undo_redo)
+    event_router.unsubscribe("animation_playback_pre", on_playback_started)
+    event_router.unsubscribe("animation_playback_post", on_playback_stopped)
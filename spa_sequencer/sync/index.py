@@ -0,0 +1,249 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Interval index over the scene strips of a sequence editor.
+
+The index flattens meta strips and muted channels into a sorted list of
+non-overlapping frame segments, each one resolving to the scene strip that the
+Timeline Synchronization uses for that frame range.
+Looking up the strip at a given frame is then a binary search.
+"""
+
+import bisect
+import heapq
+from typing import Optional, Union
+
+import bpy
+import numpy as np
+
+from ..events import DataCache, updated_sequence_editors
+from ..hierarchy import get_meta_hierarchy
+from ..timeline import TimelineSnapshot, sequencer_fingerprint
+
+
+# A resolved segment: (start, end, strip name), with `end` being exclusive.
+Segment = tuple[int, int, str]
+
+
+def _container_segments(
+    container: Union[bpy.types.SequenceEditor, bpy.types.MetaStrip],
+) -> list[Segment]:
+    """
+    Build the resolved segments of `container`'s strips, recursing into meta strips.
+
+    For each frame range, the strip with the highest channel wins, excluding muted
+    strips and strips in muted channels. This matches the rules applied by
+    `sync.core.get_scene_strip_at_frame`.
+
+    :param container: Sequence editor or meta strip containing the strips.
+    :returns: The sorted list of segments.
+    """
+    muted_channels = [
+        idx for idx, channel in enumerate(container.channels) if channel.mute
+    ]
+    snapshot = TimelineSnapshot(container.strips)
+    indices = snapshot.sorted_by_start(
+        np.flatnonzero(
+            snapshot.mask(
+                (bpy.types.SceneStrip, bpy.types.MetaStrip),
+                skip_muted=True,
+                muted_channels=muted_channels,
+            )
+        )
+    )
+    entries = list(
+        zip(
+            snapshot.left[indices].tolist(),
+            snapshot.right[indices].tolist(),
+            snapshot.channel[indices].tolist(),
+            snapshot.strips(indices),
+        )
+    )
+
+    bounds = sorted({frame for entry in entries for frame in entry[:2]})
+    segments: list[Segment] = []
+    meta_segments: dict[str, list[Segment]] = {}
+    active: list[tuple[int, int, int]] = []
+    entry_idx = 0
+
+    for start, end in zip(bounds, bounds[1:]):
+        # Activate strips starting at this boundary.
+        while entry_idx < len(entries) and entries[entry_idx][0] <= start:
+            _, right, channel, _ = entries[entry_idx]
+            heapq.heappush(active, (-channel, right, entry_idx))
+            entry_idx += 1
+        # Discard ended strips from the top of the heap (lazy deletion).
+        while active and active[0][1] <= start:
+            heapq.heappop(active)
+        if not active:
+            continue
+
+        strip = entries[active[0][2]][3]
+
+        if isinstance(strip, bpy.types.MetaStrip):
+            # Inner meta strip timing matches outer timeline: clip inner segments
+            # to the current range.
+            if strip.name not in meta_segments:
+                meta_segments[strip.name] = _container_segments(strip)
+            inner = meta_segments[strip.name]
+            idx = max(bisect.bisect_right(inner, (start,)) - 1, 0)
+            for inner_start, inner_end, name in inner[idx:]:
+                if inner_start >= end:
+                    break
+                if inner_end > start:
+                    segments.append(
+                        (max(inner_start, start), min(inner_end, end), name)
+                    )
+        # Scene strips without a scene still hide lower channels, but resolve to
+        # nothing.
+        elif strip.scene:
+            segments.append((start, end, strip.name))
+
+    # Merge consecutive segments resolving to the same strip.
+    merged: list[Segment] = []
+    for segment in segments:
+        if merged and merged[-1][1] == segment[0] and merged[-1][2] == segment[2]:
+            merged[-1] = (merged[-1][0], segment[1], segment[2])
+        else:
+            merged.append(segment)
+    return merged
+
+
+class StripIntervalIndex(DataCache):
+    """Persistent interval index resolving a frame to a scene strip in O(log n).
+
+    The generation also changes on rebuilds, so that caches depending on the
+    timeline's strips can use it as a validity key.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.names: list[str] = []
+        self.dirty: bool = True
+        # Indexed sequence editor and its number of strips.
+        self._key: Optional[tuple[int, int]] = None
+        # Digest of the indexed strips state.
+        self._fingerprint: bytes = b""
+
+    def invalidate(self):
+        """Flag the index as outdated: it will be rebuilt on next lookup."""
+        super().invalidate()
+        self.dirty = True
+
+    def rebuild(self, sed: bpy.types.SequenceEditor):
+        """Rebuild the index from `sed`'s strips.
+
+        :param sed: The sequence editor to index.
+        """
+        segments = _container_segments(sed)
+        self.starts = [s[0] for s in segments]
+        self.ends = [s[1] for s in segments]
+        self.names = [s[2] for s in segments]
+        self._key = (sed.as_pointer(), len(sed.strips_all))
+        self._fingerprint = sequencer_fingerprint(sed)
+        self.dirty = False
+        self.build_count += 1
+        self.generation += 1
+
+    def ensure(self, sed: bpy.types.SequenceEditor):
+        """Rebuild the index if it is outdated regarding `sed`.
+
+        :param sed: The sequence editor to index.
+        """
+        # Handlers flag timeline edits. The number of strips catches strips added or
+        # removed by scripts before any depsgraph update, and `lookup` catches
+        # renamed, muted or moved strips.
+        if self.dirty or self._key != (sed.as_pointer(), len(sed.strips_all)):
+            self.rebuild(sed)
+
+    def lookup(
+        self, sed: bpy.types.SequenceEditor, frame: int
+    ) -> Optional[bpy.types.SceneStrip]:
+        """Get the scene strip used by the synchronization at `frame` in `sed`.
+
+        :param sed: The indexed sequence editor.
+        :param frame: The frame value.
+        :returns: The scene strip if any, None otherwise.
+        """
+        self.ensure(sed)
+        for _ in range(2):
+            idx = bisect.bisect_right(self.starts, frame) - 1
+            if idx < 0 or frame >= self.ends[idx]:
+                return None
+            strip = sed.strips_all.get(self.names[idx])
+            if strip and strip.scene and self._is_used_at(sed, strip, frame):
+                return strip
+            # Renamed, replaced, muted or moved strip: the index is stale, rebuild
+            # and retry.
+            self.rebuild(sed)
+        return None
+
+    def _is_used_at(
+        self, sed: bpy.types.SequenceEditor, strip: bpy.types.SceneStrip, frame: int
+    ) -> bool:
+        """Check that `strip` and its parent meta strips still cover `frame`, and are
+        neither muted nor in a muted channel.
+
+        This catches scripted edits of the resolved strip made before any depsgraph
+        update, at the cost of a few attribute reads.
+        """
+        chain = get_meta_hierarchy(strip).parent_chain(strip)
+        for item, container in zip((strip, *chain), (*chain, sed)):
+            if (
+                item.mute
+                or container.channels[item.channel].mute
+                or not item.left_handle <= frame < item.right_handle
+            ):
+                return False
+        return True
+
+    def upcoming(
+        self, sed: bpy.types.SequenceEditor, frame_start: int, frame_end: int
+    ) -> list[tuple[int, bpy.types.SceneStrip]]:
+        """Get the scene strips the synchronization switches to in a frame range.
+
+        :param sed: The indexed sequence editor.
+        :param frame_start: The range start frame.
+        :param frame_end: The range end frame (inclusive).
+        :returns: The (entry frame, scene strip) pairs, sorted by entry frame.
+        """
+        self.ensure(sed)
+        lo = bisect.bisect_left(self.starts, frame_start)
+        hi = bisect.bisect_right(self.starts, frame_end)
+        result = []
+        for start, name in zip(self.starts[lo:hi], self.names[lo:hi]):
+            strip = sed.strips_all.get(name)
+            if strip and strip.scene:
+                result.append((start, strip))
+        return result
+
+
+    def on_depsgraph_update(
+        self, scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph
+    ):
+        """Invalidate the index when the indexed strips changed.
+
+        The synchronization and the prefetcher write to the master scene (active
+        strip, camera) without changing its strips: compare the strips state to the
+        indexed one rather than invalidating on any update of the master scene.
+        """
+        if self.dirty or not self._key:
+            return
+        sed = updated_sequence_editors(depsgraph).get(self._key[0])
+        if sed and sequencer_fingerprint(sed) != self._fingerprint:
+            self.invalidate()
+
+
+# Index over the master scene's sequence editor.
+master_strip_index = StripIntervalIndex()
+
+
+def register():
+    master_strip_index.register()
+
+
+def unregister():
+    master_strip_index.unregister()
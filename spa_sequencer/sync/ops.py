@@ -2,8 +2,12 @@
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
 import bpy
+from bpy_extras.io_utils import ExportHelper
 
 from ..sync.core import get_sync_settings, sync_system_update
+from ..sync.profiler import sync_profiler
+from ..sync.sync_map import compute_sync_map
+from ..sync.trace import sync_trace_recorder
 
 from ..utils import register_classes, unregister_classes
 
@@ -66,9 +70,135 @@ class WM_OT_timeline_sync_play_master(bpy.types.Operator):
         return {"FINISHED"}
 
 
+class WM_OT_timeline_sync_profiler_export(bpy.types.Operator, ExportHelper):
+    bl_idname = "wm.timeline_sync_profiler_export"
+    bl_label = "Export Synchronization Profile"
+    bl_description = "Export recorded Timeline Synchronization timings"
+    bl_options = set()
+
+    filename_ext = ".json"
+
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=(
+            ("JSON", "JSON", "Summary, histogram and records"),
+            ("CHROME_TRACE", "Chrome Trace", "Chrome trace event format"),
+        ),
+    )
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        return len(sync_profiler.records) > 0
+
+    def execute(self, context: bpy.types.Context):
+        sync_profiler.export(self.filepath, self.file_format)
+        self.report({"INFO"}, f"Profile exported to {self.filepath}")
+        return {"FINISHED"}
+
+
+class WM_OT_timeline_sync_profiler_reset(bpy.types.Operator):
+    bl_idname = "wm.timeline_sync_profiler_reset"
+    bl_label = "Reset Synchronization Profile"
+    bl_description = "Clear recorded Timeline Synchronization timings"
+    bl_options = set()
+
+    def execute(self, context: bpy.types.Context):
+        sync_profiler.reset()
+        return {"FINISHED"}
+
+
+class WM_OT_timeline_sync_trace_record(bpy.types.Operator):
+    bl_idname = "wm.timeline_sync_trace_record"
+    bl_label = "Record Synchronization Trace"
+    bl_description = (
+        "Start or stop recording the frame changes handled by the Timeline "
+        "Synchronization, to replay them later"
+    )
+    bl_options = set()
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        return sync_trace_recorder.recording or get_sync_settings().enabled
+
+    def execute(self, context: bpy.types.Context):
+        if sync_trace_recorder.recording:
+            sync_trace_recorder.stop()
+            self.report({"INFO"}, f"Recorded {len(sync_trace_recorder.events)} events")
+        else:
+            sync_trace_recorder.start(get_sync_settings())
+        return {"FINISHED"}
+
+
+class WM_OT_timeline_sync_trace_export(bpy.types.Operator, ExportHelper):
+    bl_idname = "wm.timeline_sync_trace_export"
+    bl_label = "Export Synchronization Trace"
+    bl_description = "Export the recorded Timeline Synchronization trace"
+    bl_options = set()
+
+    filename_ext = ".json"
+
+    filter_glob: bpy.props.StringProperty(default="*.json", options={"HIDDEN"})
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        return len(sync_trace_recorder.events) > 0
+
+    def execute(self, context: bpy.types.Context):
+        sync_trace_recorder.write(self.filepath)
+        self.report({"INFO"}, f"Trace exported to {self.filepath}")
+        return {"FINISHED"}
+
+
+class WM_OT_timeline_sync_map_export(bpy.types.Operator, ExportHelper):
+    bl_idname = "wm.timeline_sync_map_export"
+    bl_label = "Export Sync Map"
+    bl_description = (
+        "Export the strip, scene, frame and camera used by the Timeline "
+        "Synchronization for each frame of the master scene"
+    )
+    bl_options = set()
+
+    filename_ext = ""
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.npy;*.csv;*.json", options={"HIDDEN"}
+    )
+
+    file_format: bpy.props.EnumProperty(
+        name="Format",
+        items=(
+            ("NPY", "NumPy", "Binary NumPy array, with name tables in a JSON file"),
+            ("CSV", "CSV", "Comma-separated values"),
+            ("JSON", "JSON", "JSON columns and name tables"),
+        ),
+        default="JSON",
+    )
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        master_scene = get_sync_settings().master_scene
+        return master_scene is not None and master_scene.sequence_editor is not None
+
+    def execute(self, context: bpy.types.Context):
+        sync_map = compute_sync_map(get_sync_settings().master_scene)
+        filepath = bpy.path.ensure_ext(
+            bpy.path.abspath(self.filepath), f".{self.file_format.lower()}"
+        )
+        sync_map.write(filepath, self.file_format)
+        self.report({"INFO"}, f"Sync map exported to {filepath}")
+        return {"FINISHED"}
+
+
 classes = (
     WM_OT_timeline_sync_toggle,
     WM_OT_timeline_sync_play_master,
+    WM_OT_timeline_sync_profiler_export,
+    WM_OT_timeline_sync_profiler_reset,
+    WM_OT_timeline_sync_trace_record,
+    WM_OT_timeline_sync_trace_export,
+    WM_OT_timeline_sync_map_export,
 )
 
 
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Predictive evaluation of upcoming shot scenes during master playback.
+
+The first evaluation of a scene after it becomes active in a window can cause a
+visible hitch during playback. While the master scene is playing, the prefetcher
+looks ahead on the master timeline for the next scene strips and evaluates their
+scene at its entry frame during idle time, so the synchronization switches to an
+already evaluated scene.
+"""
+
+from typing import Optional
+
+import bpy
+
+from ..events import event_router
+from .core import get_sync_settings, remap_frame_value
+from .index import master_strip_index
+from .profiler import sync_profiler
+
+
+class ScenePrefetcher:
+    """Queue and evaluate upcoming scenes of the master timeline."""
+
+    def __init__(self):
+        # Scenes to evaluate: (scene name, frame).
+        self.queue: list[tuple[str, int]] = []
+        # Scenes evaluated ahead of time and not active yet: scene name -> frame.
+        self.warmed: dict[str, int] = {}
+        # Number of evaluated scenes, exposed for profiling purposes.
+        self.warm_count: int = 0
+        # Master frame of the last scheduling.
+        self.last_frame: Optional[int] = None
+
+    def clear(self):
+        """Forget queued and evaluated scenes."""
+        self.queue.clear()
+        self.warmed.clear()
+        self.last_frame = None
+
+    def schedule(self, context: bpy.types.Context, master_scene: bpy.types.Scene):
+        """Queue the scenes of strips following master scene's current frame.
+
+        :param context: The active context.
+        :param master_scene: The master scene.
+        """
+        settings = get_sync_settings()
+        frame = master_scene.frame_current
+        # Frame change handlers are called for each scene changing time.
+        if frame == self.last_frame:
+            return
+        self.last_frame = frame
+
+        upcoming = master_strip_index.upcoming(
+            master_scene.sequence_editor,
+            frame + 1,
+            frame + settings.prefetch_frames,
+        )
+
+        # Never change the time of scenes displayed in a window.
+        visible_scenes = {window.scene for window in context.window_manager.windows}
+        targets = []
+        for entry_frame, strip in upcoming:
+            if strip.scene in visible_scenes or strip.scene == master_scene:
+                continue
+            targets.append((strip.scene.name, remap_frame_value(entry_frame, strip)))
+
+        # Scenes that became active or are no longer upcoming are not warm anymore.
+        target_names = {name for name, _ in targets}
+        self.warmed = {
+            name: f for name, f in self.warmed.items() if name in target_names
+        }
+
+        budget = settings.prefetch_max_scenes - len(self.warmed)
+        for name, inner_frame in targets:
+            if budget <= 0:
+                break
+            if self.warmed.get(name) == inner_frame:
+                continue
+            if (name, inner_frame) not in self.queue:
+                self.queue.append((name, inner_frame))
+            budget -= 1
+
+        if self.queue and not bpy.app.timers.is_registered(process_prefetch_queue):
+            bpy.app.timers.register(process_prefetch_queue, first_interval=0.0)
+
+    def warm(self, scene: bpy.types.Scene, frame: int):
+        """Evaluate `scene` at `frame`.
+
+        :param scene: The scene to evaluate.
+        :param frame: The frame to evaluate the scene at.
+        """
+        # Setting the frame directly does not trigger frame change handlers, and
+        # matches what the synchronization does before switching to this scene.
+        if scene.frame_current != frame:
+            scene.frame_current = frame
+        scene.view_layers[0].depsgraph.update()
+        self.warmed[scene.name] = frame
+        self.warm_count += 1
+        sync_profiler.count("prefetched_scenes")
+
+
+scene_prefetcher = ScenePrefetcher()
+
+
+def process_prefetch_queue() -> Optional[float]:
+    """Timer callback evaluating queued scenes, one per call."""
+    if not scene_prefetcher.queue:
+        return None
+    name, frame = scene_prefetcher.queue.pop(0)
+    if scene := bpy.data.scenes.get(name):
+        scene_prefetcher.warm(scene, frame)
+    # Give control back to the playback loop between scenes.
+    return 0.0 if scene_prefetcher.queue else None
+
+
+def is_master_scene(scene: bpy.types.Scene) -> bool:
+    """Whether `scene` is the master scene of an enabled synchronization."""
+    settings = get_sync_settings()
+    return settings.enabled and scene == settings.master_scene
+
+
+def on_frame_changed(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    # Early return when context is still a restricted context
+    if not isinstance(bpy.context, bpy.types.Context):
+        return
+
+    context = bpy.context
+    settings = get_sync_settings()
+    master_scene = settings.master_scene
+    if (
+        not settings.enabled
+        or not settings.prefetch_next_scene
+        or not master_scene
+        or not master_scene.sequence_editor
+        or not context.screen
+        or not context.screen.is_animation_playing
+    ):
+        return
+
+    scene_prefetcher.schedule(context, master_scene)
+
+
+def on_reset(*args):
+    """Playback end and file loading handler callback."""
+    scene_prefetcher.clear()
+
+
+def register():
+    event_router.subscribe(
+        "frame_change_post",
+        on_frame_changed,
+        name="scene_prefetch",
+        scene_filter=is_master_scene,
+        coalesce=True,
+    )
+    event_router.subscribe("animation_playback_post", on_reset)
+    event_router.subscribe("load_pre", on_reset)
+
+
+def unregister():
+    if bpy.app.timers.is_registered(process_prefetch_queue):
+        bpy.app.timers.unregister(process_prefetch_queue)
+    event_router.unsubscribe("frame_change_post", on_frame_changed)
+    event_router.unsubscribe("animation_playback_post", on_reset)
+    event_router.unsubscribe("load_pre", on_reset)
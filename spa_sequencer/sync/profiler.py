@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Opt-in instrumentation of the Timeline Synchronization system.
+
+When enabled, the profiler records the wall time of each synchronization update,
+split by phase, into a fixed-size ring buffer, along with event counters.
+Records can be exported as JSON or in the Chrome trace event format
+(viewable in chrome://tracing or https://ui.perfetto.dev).
+"""
+
+import bisect
+import collections
+import contextlib
+import functools
+import json
+import os
+import time
+from typing import Callable, Optional
+
+from ..events import event_router
+
+
+# Upper bounds (in milliseconds) of the update duration histogram bins.
+HISTOGRAM_BINS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, float("inf"))
+
+
+class CallRecord:
+    """Timing of a profiled call, with its phases."""
+
+    __slots__ = ("name", "start", "duration", "phases")
+
+    def __init__(self, name: str, start: float):
+        self.name = name
+        self.start = start
+        self.duration = 0.0
+        # Phases timings: (name, start, duration).
+        self.phases: list[tuple[str, float, float]] = []
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "start": self.start,
+            "duration": self.duration,
+            "phases": [
+                {"name": name, "start": start, "duration": duration}
+                for name, start, duration in self.phases
+            ],
+        }
+
+
+class _PhaseTimer:
+    """Context manager adding its duration as a phase of the current call."""
+
+    __slots__ = ("record", "name", "start")
+
+    def __init__(self, record: CallRecord, name: str):
+        self.record = record
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *args):
+        end = time.perf_counter()
+        self.record.phases.append((self.name, self.start, end - self.start))
+
+
+# Shared no-op context manager, used when profiling is disabled.
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+class SyncProfiler:
+    """Ring buffer of synchronization update timings and event counters."""
+
+    def __init__(self, capacity: int = 2048):
+        """
+        :param capacity: Maximum number of call records kept.
+        """
+        self.enabled: bool = False
+        self.records: collections.deque[CallRecord] = collections.deque(
+            maxlen=capacity
+        )
+        self.counters: collections.Counter[str] = collections.Counter()
+        self._current: Optional[CallRecord] = None
+
+    def reset(self):
+        """Clear records, counters and event subscribers statistics."""
+        self.records.clear()
+        self.counters.clear()
+        event_router.reset_stats()
+
+    def profiled(self, func: Callable) -> Callable:
+        """Decorator recording the calls of `func` while profiling is enabled."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Nested calls are part of the outer call.
+            if not self.enabled or self._current:
+                return func(*args, **kwargs)
+            record = CallRecord(func.__name__, time.perf_counter())
+            self._current = record
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record.duration = time.perf_counter() - record.start
+                self._current = None
+                self.records.append(record)
+
+        return wrapper
+
+    def phase(self, name: str):
+        """Context manager timing the phase `name` of the current profiled call.
+
+        :param name: The phase name.
+        """
+        if not self._current:
+            return _NULL_CONTEXT
+        return _PhaseTimer(self._current, name)
+
+    def count(self, name: str, value: int = 1):
+        """Increment the counter `name` by `value` while profiling is enabled."""
+        if self.enabled:
+            self.counters[name] += value
+
+    def count_cache(self, cache_name: str, hit: bool):
+        """Record a hit or a miss of the cache `cache_name`."""
+        if self.enabled:
+            self.counters[f"{cache_name}_{'hits' if hit else 'misses'}"] += 1
+
+    def cache_hit_rates(self) -> dict[str, float]:
+        """Get the hit rate of each recorded cache."""
+        rates = {}
+        for key, hits in self.counters.items():
+            if not key.endswith("_hits"):
+                continue
+            cache_name = key[: -len("_hits")]
+            total = hits + self.counters[f"{cache_name}_misses"]
+            rates[cache_name] = hits / total if total else 0.0
+        return rates
+
+    def durations_ms(self) -> list[float]:
+        """Get the duration of recorded calls, in milliseconds."""
+        return [record.duration * 1000.0 for record in self.records]
+
+    def histogram(self) -> list[int]:
+        """Get the number of recorded calls per duration bin (see HISTOGRAM_BINS_MS)."""
+        counts = [0] * len(HISTOGRAM_BINS_MS)
+        for duration in self.durations_ms():
+            counts[bisect.bisect_left(HISTOGRAM_BINS_MS, duration)] += 1
+        return counts
+
+    def summary(self) -> dict:
+        """Get aggregated statistics of the recorded calls."""
+        durations = sorted(self.durations_ms())
+        phases = collections.defaultdict(float)
+        for record in self.records:
+            for name, _, duration in record.phases:
+                phases[name] += duration * 1000.0
+        return {
+            "calls": len(durations),
+            "mean_ms": sum(durations) / len(durations) if durations else 0.0,
+            "p95_ms": durations[int(0.95 * (len(durations) - 1))] if durations else 0.0,
+            "max_ms": durations[-1] if durations else 0.0,
+            "phases_total_ms": dict(phases),
+            "counters": dict(self.counters),
+            "cache_hit_rates": self.cache_hit_rates(),
+        }
+
+    def to_json(self) -> dict:
+        """Export recorded data as a JSON serializable dictionary."""
+        return {
+            "summary": self.summary(),
+            "histogram": {
+                "bins_ms": [str(b) for b in HISTOGRAM_BINS_MS],
+                "counts": self.histogram(),
+            },
+            "records": [record.to_dict() for record in self.records],
+            "event_subscribers": event_router.stats(),
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Export recorded calls in the Chrome trace event format."""
+        events = []
+        pid = os.getpid()
+        for record in self.records:
+            events.append(
+                self._trace_event(record.name, record.start, record.duration, pid)
+            )
+            for name, start, duration in record.phases:
+                events.append(self._trace_event(name, start, duration, pid))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    @staticmethod
+    def _trace_event(name: str, start: float, duration: float, pid: int) -> dict:
+        return {
+            "name": name,
+            "cat": "sync",
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": duration * 1e6,
+            "pid": pid,
+            "tid": 0,
+        }
+
+    def export(self, filepath: str, file_format: str = "JSON"):
+        """Write recorded data to `filepath`.
+
+        :param filepath: The output file path.
+        :param file_format: Either "JSON" or "CHROME_TRACE".
+        """
+        if file_format == "CHROME_TRACE":
+            data = self.to_chrome_trace()
+        else:
+            data = self.to_json()
+        with open(filepath, "w") as f:
+            json.dump(data, f, indent=1)
+
+
+sync_profiler = SyncProfiler()
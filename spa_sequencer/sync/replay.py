@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Headless replay of Timeline Synchronization traces.
+
+Replaying a trace applies its settings, then drives `sync_system_update` with the
+recorded frame changes, measuring the latency of each update.
+
+NOTE: Playback and scrubbing states are read-only in Blender, and cannot be
+reproduced when replaying: updates run as if the timeline was stepped through.
+"""
+
+import statistics
+import time
+from dataclasses import dataclass, field
+
+import bpy
+
+from .core import get_sync_settings, sync_system_update
+from .trace import TRACE_COLUMNS, TRACE_SETTINGS
+
+
+@dataclass
+class ReplayResult:
+    """Latencies of a trace replay."""
+
+    # The replayed events, as (time, scene, frame, ...) rows, see TRACE_COLUMNS.
+    events: list[tuple] = field(default_factory=list)
+    # Duration of the synchronization update of each event, in milliseconds.
+    latencies_ms: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        """Get aggregated latency statistics."""
+        latencies = sorted(self.latencies_ms)
+        if not latencies:
+            return {"events": 0}
+        return {
+            "events": len(latencies),
+            "mean_ms": statistics.fmean(latencies),
+            "median_ms": statistics.median(latencies),
+            "p95_ms": latencies[int(0.95 * (len(latencies) - 1))],
+            "max_ms": latencies[-1],
+        }
+
+    def slowest(self, count: int = 10) -> list[dict]:
+        """Get the `count` slowest events, with recorded and replayed latencies."""
+        order = sorted(
+            range(len(self.latencies_ms)),
+            key=lambda idx: self.latencies_ms[idx],
+            reverse=True,
+        )
+        return [
+            dict(
+                zip(TRACE_COLUMNS, self.events[idx]),
+                index=idx,
+                latency_ms=self.latencies_ms[idx],
+            )
+            for idx in order[:count]
+        ]
+
+
+def replay_trace(context: bpy.types.Context, trace: dict) -> ReplayResult:
+    """Replay the frame changes of `trace` in the current file.
+
+    :param context: The current context.
+    :param trace: The trace, as loaded by `trace.load_trace`.
+    :return: The latency of each replayed event.
+    """
+    scenes = [bpy.data.scenes.get(name) for name in trace["scenes"]]
+    master_scene = bpy.data.scenes.get(trace["master_scene"])
+    if not master_scene or not master_scene.sequence_editor:
+        raise ValueError(f"Master scene not found: {trace['master_scene']}")
+
+    sync_settings = get_sync_settings()
+    sync_settings.master_scene = master_scene
+    sync_settings.enabled = True
+    for name in TRACE_SETTINGS:
+        if name in trace["settings"]:
+            setattr(sync_settings, name, trace["settings"][name])
+
+    columns = trace["columns"]
+    events = list(zip(*(columns[name] for name in TRACE_COLUMNS)))
+    result = ReplayResult(events)
+    for _, scene_idx, frame, master_frame, window_scene_idx, *_ in events:
+        # Restore the window's scene at the time of the event, and the frame change.
+        window_scene = scenes[window_scene_idx] if window_scene_idx >= 0 else None
+        if window_scene and context.window.scene != window_scene:
+            context.window.scene = window_scene
+        scene = scenes[scene_idx] if scene_idx >= 0 else None
+        if scene and scene != master_scene:
+            scene.frame_current = frame
+        master_scene.frame_current = master_frame
+
+        start = time.perf_counter()
+        sync_system_update(context)
+        result.latencies_ms.append((time.perf_counter() - start) * 1000.0)
+
+    return result
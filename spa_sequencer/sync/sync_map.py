@@ -0,0 +1,220 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Frame by frame mapping of the master timeline, as resolved by the Timeline
+Synchronization, for external tools.
+
+For each master frame, the sync map stores the scene strip used by the
+synchronization, its scene, the frame in this scene's reference and the camera:
+the strip's camera if set, otherwise the scene camera at that frame, following
+the scene's camera markers.
+"""
+
+import csv
+import json
+from typing import Optional
+
+import bpy
+import numpy as np
+
+from .core import remap_frame_value
+from .index import StripIntervalIndex
+
+
+# Columns of the sync map. Strips, scenes and cameras are stored as indices into
+# name tables, -1 meaning none.
+SYNC_MAP_DTYPE = np.dtype(
+    [
+        ("frame", np.int32),
+        ("strip", np.int32),
+        ("scene", np.int32),
+        ("inner_frame", np.int32),
+        ("camera", np.int32),
+    ]
+)
+
+SYNC_MAP_FORMATS = ("NPY", "CSV", "JSON")
+
+
+def get_camera_markers(
+    scene: bpy.types.Scene,
+) -> tuple[np.ndarray, list[bpy.types.Object]]:
+    """Get the markers of `scene` bound to a camera, sorted by frame.
+
+    Cameras hidden in renders are ignored and, for markers sharing a frame, only
+    the first one is kept, as when Blender switches cameras during playback.
+
+    :param scene: The scene.
+    :return: The marker frames, and the camera of each marker.
+    """
+    cameras: dict[int, bpy.types.Object] = {}
+    for marker in scene.timeline_markers:
+        if marker.camera and not marker.camera.hide_render:
+            cameras.setdefault(marker.frame, marker.camera)
+    frames = sorted(cameras)
+    return np.array(frames, dtype=np.int32), [cameras[frame] for frame in frames]
+
+
+class SyncMap:
+    """Frame by frame mapping of a master timeline."""
+
+    def __init__(
+        self,
+        master_scene: str,
+        data: np.ndarray,
+        strips: list[str],
+        scenes: list[str],
+        cameras: list[str],
+    ):
+        """
+        :param master_scene: The master scene name.
+        :param data: The sync map rows, of type SYNC_MAP_DTYPE.
+        :param strips: Strip names table.
+        :param scenes: Scene names table.
+        :param cameras: Camera names table.
+        """
+        self.master_scene = master_scene
+        self.data = data
+        self.strips = strips
+        self.scenes = scenes
+        self.cameras = cameras
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def row(
+        self, frame: int
+    ) -> tuple[Optional[str], Optional[str], int, Optional[str]]:
+        """Get the strip, scene, inner frame and camera at master `frame`.
+
+        :param frame: The master frame, within the sync map range.
+        :return: The names (None if not set) and inner frame (-1 if not set).
+        """
+        row = self.data[frame - self.data["frame"][0]]
+        return (
+            self.strips[row["strip"]] if row["strip"] >= 0 else None,
+            self.scenes[row["scene"]] if row["scene"] >= 0 else None,
+            int(row["inner_frame"]),
+            self.cameras[row["camera"]] if row["camera"] >= 0 else None,
+        )
+
+    def tables(self) -> dict:
+        """Get the metadata and name tables of the sync map."""
+        return {
+            "master_scene": self.master_scene,
+            "strips": self.strips,
+            "scenes": self.scenes,
+            "cameras": self.cameras,
+        }
+
+    def to_json(self) -> dict:
+        """Export the sync map as a JSON serializable dictionary, with columns."""
+        data = self.tables()
+        data["columns"] = {
+            name: self.data[name].tolist() for name in SYNC_MAP_DTYPE.names
+        }
+        return data
+
+    def write(self, filepath: str, file_format: str):
+        """Write the sync map to `filepath`.
+
+        NPY format writes the structured array of indices to `filepath`, and its
+        name tables next to it, in a JSON file with a `.tables.json` extension.
+
+        :param filepath: The output file path.
+        :param file_format: One of SYNC_MAP_FORMATS.
+        """
+        if file_format == "NPY":
+            np.save(filepath, self.data, allow_pickle=False)
+            tables_filepath = f"{filepath.removesuffix('.npy')}.tables.json"
+            with open(tables_filepath, "w") as f:
+                json.dump(self.tables(), f, indent=1)
+        elif file_format == "CSV":
+            with open(filepath, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(SYNC_MAP_DTYPE.names)
+                for frame in self.data["frame"].tolist():
+                    strip, scene, inner_frame, camera = self.row(frame)
+                    writer.writerow(
+                        (frame, strip or "", scene or "", inner_frame, camera or "")
+                    )
+        elif file_format == "JSON":
+            with open(filepath, "w") as f:
+                json.dump(self.to_json(), f)
+        else:
+            raise ValueError(f"Unsupported sync map format: {file_format}")
+
+
+def compute_sync_map(
+    master_scene: bpy.types.Scene,
+    frame_start: Optional[int] = None,
+    frame_end: Optional[int] = None,
+) -> SyncMap:
+    """Compute the sync map of `master_scene` between two frames.
+
+    Frames are resolved per timeline segment using a strip interval index, which
+    applies the same rules as `core.get_scene_strip_at_frame`.
+
+    :param master_scene: The master scene.
+    :param frame_start: First frame (master scene's start frame by default).
+    :param frame_end: Last frame, inclusive (master scene's end frame by default).
+    :return: The sync map.
+    """
+    if frame_start is None:
+        frame_start = master_scene.frame_start
+    if frame_end is None:
+        frame_end = master_scene.frame_end
+
+    frames = np.arange(frame_start, max(frame_end + 1, frame_start), dtype=np.int32)
+    data = np.full(len(frames), -1, dtype=SYNC_MAP_DTYPE)
+    data["frame"] = frames
+
+    tables: dict[str, dict[str, int]] = {"strips": {}, "scenes": {}, "cameras": {}}
+
+    def table_index(table: str, name: str) -> int:
+        return tables[table].setdefault(name, len(tables[table]))
+
+    sed = master_scene.sequence_editor
+    if not sed:
+        return SyncMap(master_scene.name, data, [], [], [])
+
+    index = StripIntervalIndex()
+    index.rebuild(sed)
+    for start, end, name in zip(index.starts, index.ends, index.names):
+        lo, hi = max(start, frame_start), min(end, frame_end + 1)
+        if lo >= hi:
+            continue
+        strip = sed.strips_all.get(name)
+        if not strip or not strip.scene:
+            continue
+
+        rows = slice(lo - frame_start, hi - frame_start)
+        data["strip"][rows] = table_index("strips", strip.name)
+        data["scene"][rows] = table_index("scenes", strip.scene.name)
+        # Remapping is a constant offset within a strip.
+        data["inner_frame"][rows] = frames[rows] + (remap_frame_value(lo, strip) - lo)
+        # The synchronization only assigns the strip camera: otherwise, the scene
+        # camera follows the scene's camera markers.
+        marker_frames, marker_cameras = get_camera_markers(strip.scene)
+        if strip.scene_camera or not marker_cameras:
+            if camera := strip.scene_camera or strip.scene.camera:
+                data["camera"][rows] = table_index("cameras", camera.name)
+        else:
+            # Use the last marker at or before each frame, or the first marker for
+            # frames before it.
+            markers = np.searchsorted(marker_frames, data["inner_frame"][rows], "right")
+            markers = np.maximum(markers - 1, 0)
+            # Only add the cameras actually used to the table.
+            cameras = np.full(len(marker_cameras), -1, dtype=np.int32)
+            for marker in np.unique(markers).tolist():
+                cameras[marker] = table_index("cameras", marker_cameras[marker].name)
+            data["camera"][rows] = cameras[markers]
+
+    return SyncMap(
+        master_scene.name,
+        data,
+        list(tables["strips"]),
+        list(tables["scenes"]),
+        list(tables["cameras"]),
+    )
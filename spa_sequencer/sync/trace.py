@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Recording of the frame change events handled by the Timeline Synchronization.
+
+A trace stores, for each frame change reaching the synchronization, the scene
+that fired it and its frame, the master frame, the window's scene before the
+update, playback and scrubbing flags, the event time and the update duration.
+Traces can be replayed headlessly against the same file (see `replay`), to turn
+a performance issue reported on a production file into a reproducible case.
+"""
+
+import contextlib
+import json
+import time
+from typing import Optional
+
+import bpy
+
+
+TRACE_VERSION = 1
+
+# Synchronization settings stored in traces, and applied when replaying them.
+TRACE_SETTINGS = (
+    "bidirectional",
+    "sync_all_windows",
+    "keep_gpencil_tool_settings",
+    "use_preview_range",
+    "active_follows_playhead",
+    "low_latency_playback",
+    "coalesce_scrubbing",
+    "scrub_switch_delay",
+    "lazy_scrub_evaluation",
+    "lazy_scrub_rate",
+)
+
+# Per-event columns of a trace. Scenes are stored as indices into the scenes
+# table, -1 meaning none.
+TRACE_COLUMNS = (
+    "time",
+    "scene",
+    "frame",
+    "master_frame",
+    "window_scene",
+    "playing",
+    "scrubbing",
+    "duration_ms",
+)
+
+
+class SyncTraceRecorder:
+    """Record frame change events handled by the Timeline Synchronization."""
+
+    def __init__(self):
+        self.recording = False
+        self.header: dict = {}
+        self.scenes: dict[str, int] = {}
+        self.events: list[tuple] = []
+        self._start_time = 0.0
+
+    def start(self, settings):
+        """Start a new recording, dropping previously recorded events.
+
+        :param settings: The synchronization settings.
+        """
+        self.clear()
+        master_scene = settings.master_scene
+        self.header = {
+            "version": TRACE_VERSION,
+            "blender": bpy.app.version_string,
+            "blend_file": bpy.data.filepath,
+            "master_scene": master_scene.name if master_scene else "",
+            "settings": {name: getattr(settings, name) for name in TRACE_SETTINGS},
+        }
+        self._start_time = time.perf_counter()
+        self.recording = True
+
+    def stop(self):
+        """Stop recording, keeping recorded events."""
+        self.recording = False
+
+    def clear(self):
+        """Stop recording and drop recorded events."""
+        self.recording = False
+        self.header = {}
+        self.scenes.clear()
+        self.events.clear()
+
+    def _scene_index(self, scene: Optional[bpy.types.Scene]) -> int:
+        if not scene:
+            return -1
+        return self.scenes.setdefault(scene.name, len(self.scenes))
+
+    @contextlib.contextmanager
+    def record(self, context: bpy.types.Context, scene: bpy.types.Scene):
+        """Context manager recording the frame change of `scene`, and the duration
+        of the synchronization update it wraps.
+
+        :param context: The current context.
+        :param scene: The scene that fired the frame change.
+        """
+        screen = context.screen
+        master_scene = context.window_manager.timeline_sync_settings.master_scene
+        start = time.perf_counter()
+        event = [
+            round(start - self._start_time, 6),
+            self._scene_index(scene),
+            scene.frame_current,
+            master_scene.frame_current if master_scene else 0,
+            self._scene_index(context.window.scene if context.window else None),
+            int(bool(screen and screen.is_animation_playing)),
+            int(bool(screen and screen.is_scrubbing)),
+        ]
+        try:
+            yield
+        finally:
+            event.append(round((time.perf_counter() - start) * 1000.0, 4))
+            self.events.append(tuple(event))
+
+    def to_json(self) -> dict:
+        """Export the trace as a JSON serializable dictionary, with columns."""
+        data = dict(self.header)
+        data["scenes"] = list(self.scenes)
+        data["columns"] = {
+            name: [event[idx] for event in self.events]
+            for idx, name in enumerate(TRACE_COLUMNS)
+        }
+        return data
+
+    def write(self, filepath: str):
+        """Write the trace to `filepath`, as JSON."""
+        with open(filepath, "w") as f:
+            json.dump(self.to_json(), f, separators=(",", ":"))
+
+
+def load_trace(filepath: str) -> dict:
+    """Load a trace written by `SyncTraceRecorder.write`.
+
+    :param filepath: The trace file path.
+    :return: The trace, as exported by `SyncTraceRecorder.to_json`.
+    """
+    with open(filepath) as f:
+        trace = json.load(f)
+    if trace.get("version") != TRACE_VERSION:
+        raise ValueError(f"Unsupported trace version: {trace.get('version')}")
+    return trace
+
+
+sync_trace_recorder = SyncTraceRecorder()
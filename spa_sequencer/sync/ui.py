@@ -3,7 +3,10 @@
 
 import bpy
 
-from ..sync.core import get_sync_settings
+from ..events import event_router
+from ..sync.core import get_sync_settings, lazy_eval_state, playback_state
+from ..sync.profiler import HISTOGRAM_BINS_MS, sync_profiler
+from ..sync.trace import sync_trace_recorder
 from ..utils import register_classes, unregister_classes
 
 
@@ -26,6 +29,7 @@ class SEQUENCER_PT_SyncPanel(bpy.types.Panel):
             depress=settings.enabled,
         )
         self.layout.prop(settings, "master_scene")
+        self.layout.operator("wm.timeline_sync_map_export", icon="EXPORT")
 
 
 class SEQUENCER_PT_SyncPanelAdvancedSettings(bpy.types.Panel):
@@ -46,9 +50,131 @@ class SEQUENCER_PT_SyncPanelAdvancedSettings(bpy.types.Panel):
         self.layout.prop(settings, "active_follows_playhead")
 
 
+class SEQUENCER_PT_SyncPanelPerformance(bpy.types.Panel):
+    """Timeline Synchronization performance Panel."""
+
+    bl_label = "Performance"
+    bl_parent_id = "SEQUENCER_PT_SyncPanel"
+    bl_space_type = "SEQUENCE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "SPA.Sequencer"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw(self, context):
+        settings = get_sync_settings()
+        self.layout.prop(settings, "low_latency_playback")
+
+        self.layout.prop(settings, "coalesce_scrubbing")
+        col = self.layout.column()
+        col.enabled = settings.coalesce_scrubbing
+        col.prop(settings, "scrub_switch_delay")
+
+        self.layout.prop(settings, "lazy_scrub_evaluation")
+        col = self.layout.column()
+        col.enabled = settings.lazy_scrub_evaluation
+        col.prop(settings, "lazy_scrub_rate")
+        col.label(text=f"Skipped Evaluations: {lazy_eval_state.skipped_evaluations}")
+
+        self.layout.prop(settings, "prefetch_next_scene")
+        col = self.layout.column()
+        col.enabled = settings.prefetch_next_scene
+        col.prop(settings, "prefetch_frames")
+        col.prop(settings, "prefetch_max_scenes")
+
+        col = self.layout.column(align=True)
+        col.label(text="Last Playback:")
+        col.label(text=f"Frames: {playback_state.frames}")
+        col.label(text=f"Dropped Frames: {playback_state.dropped_frames}")
+
+
+class SEQUENCER_PT_SyncPanelProfiler(bpy.types.Panel):
+    """Timeline Synchronization profiler Panel."""
+
+    bl_label = "Profiler"
+    bl_parent_id = "SEQUENCER_PT_SyncPanelPerformance"
+    bl_space_type = "SEQUENCE_EDITOR"
+    bl_region_type = "UI"
+    bl_category = "SPA.Sequencer"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    def draw_header(self, context):
+        self.layout.prop(get_sync_settings(), "profiling", text="")
+
+    def draw(self, context):
+        self.draw_trace(context)
+
+        summary = sync_profiler.summary()
+        if not summary["calls"]:
+            self.layout.label(text="No recorded updates")
+            return
+
+        col = self.layout.column(align=True)
+        col.label(text=f"Updates: {summary['calls']}")
+        col.label(
+            text=(
+                f"Mean: {summary['mean_ms']:.2f} ms  "
+                f"P95: {summary['p95_ms']:.2f} ms  "
+                f"Max: {summary['max_ms']:.2f} ms"
+            )
+        )
+
+        # Duration histogram
+        col = self.layout.column(align=True)
+        counts = sync_profiler.histogram()
+        lower = 0.0
+        for upper, count in zip(HISTOGRAM_BINS_MS, counts):
+            row = col.row(align=True)
+            label = f"< {upper:g} ms" if upper != float("inf") else f">= {lower:g} ms"
+            row.label(text=label)
+            row.progress(factor=count / summary["calls"], text=str(count))
+            lower = upper
+
+        # Phases, counters and cache statistics
+        col = self.layout.column(align=True)
+        for name, total in sorted(summary["phases_total_ms"].items()):
+            col.label(text=f"{name}: {total:.1f} ms")
+        for name, value in sorted(summary["counters"].items()):
+            col.label(text=f"{name}: {value}")
+        for name, rate in sorted(summary["cache_hit_rates"].items()):
+            col.label(text=f"{name} hit rate: {rate:.0%}")
+
+        # Time spent in application handlers
+        col = self.layout.column(align=True)
+        col.label(text="Event Subscribers")
+        for stats in event_router.stats():
+            if not stats["calls"]:
+                continue
+            col.label(
+                text=(
+                    f"{stats['event']} > {stats['name']}: {stats['calls']} calls, "
+                    f"{stats['mean_ms']:.2f} ms avg, {stats['filtered']} filtered, "
+                    f"{stats['coalesced']} coalesced"
+                )
+            )
+
+        row = self.layout.row(align=True)
+        row.operator("wm.timeline_sync_profiler_export", icon="EXPORT")
+        row.operator("wm.timeline_sync_profiler_reset", text="", icon="TRASH")
+
+    def draw_trace(self, context):
+        row = self.layout.row(align=True)
+        recording = sync_trace_recorder.recording
+        row.operator(
+            "wm.timeline_sync_trace_record",
+            text="Stop Trace" if recording else "Record Trace",
+            icon="PAUSE" if recording else "REC",
+            depress=recording,
+        )
+        row.operator("wm.timeline_sync_trace_export", text="", icon="EXPORT")
+        if sync_trace_recorder.events:
+            self.layout.label(text=f"Trace: {len(sync_trace_recorder.events)} events")
+
+
 classes = (
     SEQUENCER_PT_SyncPanel,
     SEQUENCER_PT_SyncPanelAdvancedSettings,
+    SEQUENCER_PT_SyncPanelPerformance,
+    SEQUENCER_PT_SyncPanelProfiler,
 )
 
 
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Vectorised snapshots of strip attributes.
+
+Reading strip attributes one RNA access at a time is slow on large timelines.
+`TimelineSnapshot` reads each attribute of a strip collection with a single
+`foreach_get` call into a NumPy array, and exposes vectorised queries returning
+indices that map back to the strips.
+"""
+
+from typing import Iterable, Optional, Type, Union
+
+import bpy
+import numpy as np
+
+
+StripType = Type[bpy.types.Strip]
+StripTypeFilter = Optional[Union[StripType, tuple[StripType, ...]]]
+StripsSource = Union[bpy.types.bpy_prop_collection, list[bpy.types.Strip]]
+
+
+class TimelineSnapshot:
+    """Columnar snapshot of strips timing, channel and mute attributes.
+
+    Queries return NumPy arrays of indices into the snapshot; use `strips` to map
+    them back to strip objects.
+    """
+
+    def __init__(self, strips: StripsSource):
+        """
+        :param strips: A strip collection (e.g. `SequenceEditor.strips_all`), read with
+            `foreach_get`, or a plain list of strips, read attribute by attribute.
+        """
+        self._source = strips
+        self._items: Optional[list[bpy.types.Strip]] = (
+            None if isinstance(strips, bpy.types.bpy_prop_collection) else list(strips)
+        )
+        self._columns: dict[str, np.ndarray] = {}
+        self._type_masks: dict[object, np.ndarray] = {}
+        self._types: Optional[np.ndarray] = None
+
+        self.count: int = len(strips)
+        self.left: np.ndarray = self.column("left_handle", np.int32)
+        self.right: np.ndarray = self.column("right_handle", np.int32)
+        self.channel: np.ndarray = self.column("channel", np.int32)
+        self.mute: np.ndarray = self.column("mute", bool)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def items(self) -> list[bpy.types.Strip]:
+        """The snapshot strips, in snapshot order."""
+        # Only build Python objects for strips when mapping back is needed.
+        if self._items is None:
+            self._items = self._source[:]
+        return self._items
+
+    def column(self, attr: str, dtype=np.int32) -> np.ndarray:
+        """Get the values of the int/float/bool attribute `attr` for all strips.
+
+        :param attr: The strip attribute name.
+        :param dtype: The NumPy type of the column.
+        :return: The column values.
+        """
+        if attr not in self._columns:
+            if self._items is None:
+                values = np.empty(self.count, dtype=dtype)
+                self._source.foreach_get(attr, values)
+            else:
+                values = np.fromiter(
+                    (getattr(s, attr) for s in self._items), dtype, self.count
+                )
+            self._columns[attr] = values
+        return self._columns[attr]
+
+    def fingerprint(self) -> bytes:
+        """Get a compact digest of the timing, channel and mute columns."""
+        columns = (self.left, self.right, self.channel, np.packbits(self.mute))
+        return b"".join(column.tobytes() for column in columns)
+
+    def strips(self, indices: Iterable[int]) -> list[bpy.types.Strip]:
+        """Map snapshot `indices` back to strips.
+
+        :param indices: The indices to consider.
+        :return: The matching strips.
+        """
+        items = self.items
+        return [items[idx] for idx in indices]
+
+    @property
+    def types(self) -> np.ndarray:
+        """The `type` enum of each strip: values, or identifiers for strip lists."""
+        if self._types is None:
+            if self._items is None:
+                self._types = self.column("type", np.int32)
+            else:
+                self._types = np.array([s.type for s in self._items], dtype=object)
+        return self._types
+
+    def type_mask(self, type_filter: StripTypeFilter) -> np.ndarray:
+        """Get the mask of strips that are instances of `type_filter`."""
+        if not type_filter:
+            return np.ones(self.count, dtype=bool)
+        if type_filter not in self._type_masks:
+            # Strips sharing a `type` are instances of the same Python type: only
+            # check the first strip of each type.
+            types, first = np.unique(self.types, return_index=True)
+            matching = [
+                strip_type
+                for strip_type, idx in zip(types, first.tolist())
+                if isinstance(self._strip(idx), type_filter)
+            ]
+            self._type_masks[type_filter] = np.isin(self.types, matching)
+        return self._type_masks[type_filter]
+
+    def _strip(self, idx: int) -> bpy.types.Strip:
+        if self._items is None:
+            return self._source[idx]
+        return self._items[idx]
+
+    def mask(
+        self,
+        type_filter: StripTypeFilter = None,
+        skip_muted: bool = False,
+        muted_channels: Optional[Iterable[int]] = None,
+    ) -> np.ndarray:
+        """Build a filtering mask over the snapshot strips.
+
+        :param type_filter: Only keep strips that are instances of the given type(s)
+        :param skip_muted: Whether to exclude muted strips
+        :param muted_channels: Channels whose strips should be excluded
+        :return: The boolean mask
+        """
+        mask = self.type_mask(type_filter).copy()
+        if skip_muted:
+            mask &= ~self.mute
+        if muted_channels is not None:
+            mask &= ~np.isin(self.channel, np.fromiter(muted_channels, np.int32))
+        return mask
+
+    def at_frame(
+        self,
+        frame: int,
+        type_filter: StripTypeFilter = None,
+        skip_muted: bool = True,
+        muted_channels: Optional[Iterable[int]] = None,
+    ) -> np.ndarray:
+        """Get the indices of strips containing `frame` within their final range.
+
+        :param frame: The frame value
+        :param type_filter: Only consider strips that are instances of the given type(s)
+        :param skip_muted: Whether to skip muted strips
+        :param muted_channels: Channels whose strips should be skipped
+        :return: The matching indices, in snapshot order
+        """
+        mask = self.mask(type_filter, skip_muted, muted_channels)
+        mask &= (self.left <= frame) & (frame < self.right)
+        return np.flatnonzero(mask)
+
+    def in_range(
+        self,
+        frame_start: int,
+        frame_end: int,
+        type_filter: StripTypeFilter = None,
+        skip_muted: bool = True,
+    ) -> np.ndarray:
+        """Get the indices of strips intersecting [`frame_start`, `frame_end`).
+
+        :param frame_start: The range start frame
+        :param frame_end: The range end frame (exclusive)
+        :param type_filter: Only consider strips that are instances of the given type(s)
+        :param skip_muted: Whether to skip muted strips
+        :return: The matching indices, in snapshot order
+        """
+        mask = self.mask(type_filter, skip_muted)
+        mask &= (self.left < frame_end) & (self.right > frame_start)
+        return np.flatnonzero(mask)
+
+    def sorted_by_start(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sort `indices` (all strips by default) by start frame."""
+        if indices is None:
+            indices = np.arange(self.count)
+        return indices[np.argsort(self.left[indices], kind="stable")]
+
+    def channel_order(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sort `indices` (all strips by default) by channel, then by start frame."""
+        if indices is None:
+            indices = np.arange(self.count)
+        return indices[np.lexsort((self.left[indices], self.channel[indices]))]
+
+    def overlaps(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get all pairs of strips with intersecting frame ranges.
+
+        :param indices: The strips to consider (all strips by default).
+        :return: A (N, 2) array of snapshot indices pairs.
+        """
+        order = self.sorted_by_start(indices)
+        left = self.left[order]
+        right = self.right[order]
+        # For each strip, the strips starting before it ends (and after it starts)
+        # overlap with it.
+        stops = np.searchsorted(left, right, side="left")
+        starts = np.arange(1, len(order) + 1)
+        counts = np.maximum(stops - starts, 0)
+        first = np.repeat(np.arange(len(order)), counts)
+        # Offsets of each pair within its group.
+        group_starts = np.cumsum(counts) - counts
+        offsets = np.arange(counts.sum()) - np.repeat(group_starts, counts)
+        second = np.repeat(starts, counts) + offsets
+        return np.stack((order[first], order[second]), axis=-1)
+
+
+def sequencer_fingerprint(sed: bpy.types.SequenceEditor) -> bytes:
+    """Get a compact digest of the timing, channel and mute state of `sed`'s strips,
+    and of the mute state of its channels and of its meta strips' channels.
+
+    :param sed: The sequence editor.
+    :return: The digest.
+    """
+    snapshot = TimelineSnapshot(sed.strips_all)
+    metas = snapshot.strips(np.flatnonzero(snapshot.type_mask(bpy.types.MetaStrip)))
+    digest = [snapshot.fingerprint()]
+    for container in (sed, *metas):
+        channels_mute = np.empty(len(container.channels), dtype=bool)
+        container.channels.foreach_get("mute", channels_mute)
+        digest.append(np.packbits(channels_mute).tobytes())
+    return b"".join(digest)
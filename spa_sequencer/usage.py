@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+"""
+Cached reverse usage index: objects and collections to the scenes using them, and
+to the scene strips of these scenes.
+
+`bpy.data.user_map` walks all the data of the file, whatever the requested subset.
+The index maps each object and collection to its scene users from a single
+`user_map` pass, both directly (e.g. a collection linked in a scene's collection)
+and through parent collections and collection instances.
+
+The index is cached, and rebuilt after data changes, undo/redo and file loading.
+Datablocks are identified by pointer, as in the meta hierarchy cache.
+"""
+
+from typing import Optional, Union
+
+import bpy
+
+from .events import DataCache
+
+
+class UsageIndex:
+    """Scenes using each object and collection of the file."""
+
+    def __init__(self):
+        user_map = bpy.data.user_map(key_types={"OBJECT", "COLLECTION"})
+        # {datablock pointer: scenes using it directly}
+        self.direct_users: dict[int, list[bpy.types.Scene]] = {}
+        # {datablock pointer: scenes using it directly or not}
+        self.users: dict[int, list[bpy.types.Scene]] = {}
+        # {(sequence editor pointer, nested): (strips count, {scene pointer: strips})}
+        self.strips: dict[
+            tuple[int, bool], tuple[int, dict[int, list[bpy.types.SceneStrip]]]
+        ] = {}
+        for datablock in user_map:
+            self._add_users(datablock, user_map)
+
+    def _add_users(
+        self,
+        datablock: Union[bpy.types.Object, bpy.types.Collection],
+        user_map: dict[bpy.types.ID, set[bpy.types.ID]],
+    ) -> list[bpy.types.Scene]:
+        ptr = datablock.as_pointer()
+        if ptr in self.users:
+            return self.users[ptr]
+        # Guard against dependency cycles.
+        self.users[ptr] = []
+
+        direct_users = {}
+        users = {}
+        for user in user_map.get(datablock, ()):
+            if isinstance(user, bpy.types.Scene):
+                direct_users[user.as_pointer()] = user
+                continue
+            # Follow parent collections, and objects instancing collections.
+            if isinstance(user, bpy.types.Collection) or (
+                isinstance(user, bpy.types.Object)
+                and user.instance_collection == datablock
+            ):
+                for scene in self._add_users(user, user_map):
+                    users[scene.as_pointer()] = scene
+        users.update(direct_users)
+
+        self.direct_users[ptr] = sorted(direct_users.values(), key=lambda x: x.name)
+        self.users[ptr] = sorted(users.values(), key=lambda x: x.name)
+        return self.users[ptr]
+
+    def scene_users(
+        self,
+        datablock: Union[bpy.types.Object, bpy.types.Collection],
+        direct: bool = False,
+    ) -> list[bpy.types.Scene]:
+        """Get the scenes using `datablock`, sorted by name.
+
+        :param datablock: The object or collection.
+        :param direct: Only consider scenes using `datablock` directly, and not
+            through a parent collection or a collection instance.
+        :return: The scenes using `datablock`.
+        """
+        users = self.direct_users if direct else self.users
+        return users.get(datablock.as_pointer(), [])
+
+    def scene_strips(
+        self,
+        scene: bpy.types.Scene,
+        sed: bpy.types.SequenceEditor,
+        nested: bool = True,
+    ) -> list[bpy.types.SceneStrip]:
+        """Get the scene strips of `sed` using `scene`, sorted by start frame.
+
+        :param scene: The scene.
+        :param sed: The sequence editor.
+        :param nested: Whether to include the strips in meta strips.
+        :return: The scene strips.
+        """
+        key = (sed.as_pointer(), nested)
+        strips = sed.strips_all if nested else sed.strips
+        count = len(strips)
+        entry = self.strips.get(key)
+        if not entry or entry[0] != count:
+            scene_strips = {}
+            for strip in strips:
+                if isinstance(strip, bpy.types.SceneStrip) and strip.scene:
+                    scene_strips.setdefault(strip.scene.as_pointer(), []).append(strip)
+            entry = self.strips[key] = (count, scene_strips)
+        # Strips may have moved since they were grouped: sort them on each query.
+        return sorted(
+            entry[1].get(scene.as_pointer(), []), key=lambda x: x.left_handle
+        )
+
+    def strip_users(
+        self,
+        datablock: Union[bpy.types.Object, bpy.types.Collection],
+        sed: bpy.types.SequenceEditor,
+        direct: bool = False,
+        nested: bool = True,
+    ) -> list[bpy.types.SceneStrip]:
+        """Get the scene strips of `sed` whose scene uses `datablock`.
+
+        :param datablock: The object or collection.
+        :param sed: The sequence editor.
+        :param direct: Only consider scenes using `datablock` directly.
+        :param nested: Whether to include the strips in meta strips.
+        :return: The scene strips, sorted by start frame.
+        """
+        strips = []
+        for scene in self.scene_users(datablock, direct):
+            strips.extend(self.scene_strips(scene, sed, nested))
+        return sorted(strips, key=lambda x: x.left_handle)
+
+
+class UsageIndexCache(DataCache):
+    """Cache of the usage index of the file."""
+
+    id_types = ("SCENE", "COLLECTION", "OBJECT")
+
+    def __init__(self):
+        super().__init__()
+        # (validity key, index)
+        self.entry: Optional[tuple[tuple, UsageIndex]] = None
+
+    def get(self) -> UsageIndex:
+        """Get the usage index, rebuilding it if outdated."""
+        key = (
+            self.generation,
+            len(bpy.data.scenes),
+            len(bpy.data.collections),
+            len(bpy.data.objects),
+        )
+        if self.entry and self.entry[0] == key:
+            return self.entry[1]
+        index = UsageIndex()
+        self.entry = (key, index)
+        self.build_count += 1
+        return index
+
+    def invalidate(self):
+        """Flag the cached index as outdated."""
+        super().invalidate()
+        self.entry = None
+
+
+usage_index_cache = UsageIndexCache()
+
+
+def get_usage_index() -> UsageIndex:
+    """Get the cached usage index of the file."""
+    return usage_index_cache.get()
+
+
+def register():
+    usage_index_cache.register()
+
+
+def unregister():
+    usage_index_cache.unregister()
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+import bpy
+
+from spa_sequencer.events import event_router
+
+
+def test_event_router_scene_filter():
+    scene = bpy.context.scene
+    other_scene = bpy.data.scenes.new("OTHER")
+    events = []
+
+    def on_frame_changed(scene, depsgraph):
+        events.append((scene.name, scene.frame_current))
+
+    subscriber = event_router.subscribe(
+        "frame_change_post",
+        on_frame_changed,
+        scene_filter=lambda s: s == scene,
+    )
+    try:
+        # A single dispatcher is registered per event
+        handlers = bpy.app.handlers.frame_change_post
+        assert len([h for h in handlers if h.__name__ == "dispatcher"]) == 1
+        scene.frame_set(10)
+        other_scene.frame_set(20)
+        assert events == [(scene.name, 10)]
+        assert subscriber.calls == 1
+        assert subscriber.filtered == 1
+        assert any(s["name"] == subscriber.name for s in event_router.stats())
+    finally:
+        event_router.unsubscribe("frame_change_post", on_frame_changed)
+
+    scene.frame_set(11)
+    assert len(events) == 1
+
+
+def test_event_router_reentrant_events():
+    scene = bpy.context.scene
+    other_scene = bpy.data.scenes.new("OTHER")
+    events = []
+
+    def on_frame_changed(scene, depsgraph):
+        events.append(scene.name)
+        # Frame change triggered by the subscriber itself
+        other_scene.frame_set(scene.frame_current)
+
+    subscriber = event_router.subscribe(
+        "frame_change_post", on_frame_changed, reentrant=False
+    )
+    try:
+        scene.frame_set(5)
+    finally:
+        event_router.unsubscribe("frame_change_post", on_frame_changed)
+
+    assert events == [scene.name]
+    assert subscriber.filtered == 1
+    assert other_scene.frame_current == 5
+
+
+def test_event_router_tick_reset_on_file_load():
+    def on_frame_changed(scene, depsgraph):
+        pass
+
+    subscriber = event_router.subscribe(
+        "frame_change_post", on_frame_changed, coalesce=True
+    )
+    try:
+        # Simulate a frame change coalesced before the tick reset timer fired
+        subscriber.last_event_key = (bpy.context.scene.session_uid, 1)
+        bpy.ops.wm.read_homefile(app_template="")
+        assert subscriber.last_event_key is None
+    finally:
+        event_router.unsubscribe("frame_change_post", on_frame_changed)
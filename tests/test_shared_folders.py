@@ -6,6 +6,10 @@ import pytest
 import bpy
 
 from spa_sequencer.shared_folders import core
+from spa_sequencer.shot.core import make_meta_strip
+from spa_sequencer.usage import get_usage_index
+
+from utils import create_shot_scene
 
 
 def test_shared_folders_root():
@@ -106,3 +110,44 @@ def test_delete_shared_folder():
 
     with pytest.raises(ValueError):
         core.get_shared_folder_by_name(folder_name)
+
+
+def test_shared_folder_scene_and_strip_users():
+    edit_scene = bpy.context.scene
+    edit_scene.sequence_editor_create()
+    strips = [create_shot_scene(edit_scene, 1, frame) for frame in (1, 101, 201)]
+    col, _ = core.create_and_link_shared_folder(
+        "SharedFolder", [strips[2].scene, strips[0].scene]
+    )
+
+    assert set(core.get_scene_users(col)) == {strips[0].scene, strips[2].scene}
+    assert core.get_scene_sequence_users(col, edit_scene.sequence_editor) == [
+        strips[0],
+        strips[2],
+    ]
+
+    # Strips moved by scripts are sorted by their new start frame
+    strips[2].content_start -= 300
+    assert core.get_scene_sequence_users(col, edit_scene.sequence_editor) == [
+        strips[2],
+        strips[0],
+    ]
+
+    # Only top-level strips are considered
+    make_meta_strip([strips[0]], "META", strips[0].left_handle, 5)
+    assert core.get_scene_sequence_users(col, edit_scene.sequence_editor) == [strips[2]]
+    assert get_usage_index().strip_users(col, edit_scene.sequence_editor) == [
+        strips[2],
+        strips[0],
+    ]
+
+    # Objects of the shared folder are used by scenes through the folder
+    obj = bpy.data.objects.new("Prop", None)
+    col.objects.link(obj)
+    usage = get_usage_index()
+    assert usage.scene_users(obj, direct=True) == []
+    assert set(usage.scene_users(obj)) == {strips[0].scene, strips[2].scene}
+
+    # Unlinking the shared folder updates its users
+    core.unlink_shared_folder(col, [strips[0].scene])
+    assert core.get_scene_users(col) == [strips[2].scene]
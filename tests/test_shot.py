@@ -7,30 +7,54 @@ import bpy
 
 from spa_sequencer.shot.core import (
     adjust_shot_duration,
+    batch_strip_reload,
     delete_scene,
+    delete_scenes,
     duplicate_scene,
+    duplicate_scene_bulk,
     DuplicationManifest,
+    get_audition_strip,
+    get_pointer_properties,
+    get_scene_cameras,
+    get_valid_shot_scenes,
     make_meta_strip,
     new_audition_strip,
     rename_scene,
     set_active_audition,
     slip_shot_content,
+    strip_reload_batches,
 )
 
 
+from spa_sequencer.hierarchy import get_meta_hierarchy, meta_hierarchy_cache
+from spa_sequencer.preferences import get_addon_prefs
+from spa_sequencer.shot.catalogue import shot_catalogue
+from spa_sequencer.shot.ripple import RippleEdit
+from spa_sequencer.sync.core import get_scene_strip_at_frame
+
 from utils import create_shot_scene
 
 
-def test_scene_duplication_same_name():
+@pytest.fixture(params=["operator", "bulk"])
+def duplicate(request):
+    """Scene duplication function, with and without operators."""
+    if request.param == "bulk":
+        return duplicate_scene_bulk
+    return lambda scene, name, manifest=None: duplicate_scene(
+        bpy.context, scene, name, manifest
+    )
+
+
+def test_scene_duplication_same_name(duplicate):
     ref_scene = bpy.context.scene
     with pytest.raises(ValueError):
-        duplicate_scene(bpy.context, ref_scene, ref_scene.name)
+        duplicate(ref_scene, ref_scene.name)
 
 
-def test_scene_duplication():
+def test_scene_duplication(duplicate):
     ref_scene = bpy.context.scene
     # Create a new scene named "SceneCopy"
-    new_scene = duplicate_scene(bpy.context, ref_scene, "SceneCopy")
+    new_scene = duplicate(ref_scene, "SceneCopy")
 
     # Check collection duplication
     assert len(new_scene.collection.children) == len(ref_scene.collection.children)
@@ -46,14 +70,14 @@ def test_scene_duplication():
     )
     new_scene.collection.objects.link(new_obj)
     # Create another scene from "SceneCopy"
-    new_scene2 = duplicate_scene(bpy.context, new_scene, "SceneCopy2")
+    new_scene2 = duplicate(new_scene, "SceneCopy2")
     # Check that this last scene has been created from "SceneCopy"
     assert len(new_scene2.objects) == len(new_scene.objects) != len(ref_scene.objects)
     # Check datablack auto-renaming
     assert obj_name.format(new_scene2.name) in new_scene2.objects
 
 
-def test_scene_duplication_animation_data():
+def test_scene_duplication_animation_data(duplicate):
     ref_scene = bpy.context.scene
 
     # Keyframe active object
@@ -61,7 +85,7 @@ def test_scene_duplication_animation_data():
     ref_obj.keyframe_insert(data_path="location", frame=1)
 
     # Duplicate the scene
-    new_scene = duplicate_scene(bpy.context, ref_scene, "SceneCopy")
+    new_scene = duplicate(ref_scene, "SceneCopy")
 
     # Ensure new scene's active object has animation data
     new_obj = new_scene.view_layers[0].objects.active
@@ -75,7 +99,7 @@ def test_scene_duplication_animation_data():
     assert len(ref_action.layers[0].strips[0].channelbags) == len(new_action.layers[0].strips[0].channelbags)
 
 
-def test_scene_duplication_hierarchy():
+def test_scene_duplication_hierarchy(duplicate):
     ref_scene = bpy.context.scene
 
     # Create a few objects and link them to the active scene collection
@@ -93,14 +117,14 @@ def test_scene_duplication_hierarchy():
 
     # Duplicate the active scene
     manifest = DuplicationManifest()
-    duplicate_scene(bpy.context, ref_scene, "SceneCopy", manifest)
+    duplicate(ref_scene, "SceneCopy", manifest)
 
     # Ensure parenting hierarchy is preserved
     assert manifest[obj2].parent == manifest[obj1]
     assert manifest[obj3].parent == manifest[obj2]
 
 
-def test_scene_duplication_modifier_remapping():
+def test_scene_duplication_modifier_remapping(duplicate):
     ref_scene = bpy.context.scene
 
     # Create a modifier with a reference to an object in the scene
@@ -110,13 +134,13 @@ def test_scene_duplication_modifier_remapping():
 
     # Duplicate the scene
     manifest = DuplicationManifest()
-    duplicate_scene(bpy.context, ref_scene, "SceneCopy", manifest)
+    duplicate(ref_scene, "SceneCopy", manifest)
 
     # Ensure modifier's object reference has been remapped
     assert manifest[obj].modifiers[0].object == manifest[mod.object]
 
 
-def test_scene_duplication_constraint_remapping():
+def test_scene_duplication_constraint_remapping(duplicate):
     ref_scene = bpy.context.scene
 
     # Create a constraint with a reference to an object in the scene
@@ -126,13 +150,13 @@ def test_scene_duplication_constraint_remapping():
 
     # Duplicate the scene
     manifest = DuplicationManifest()
-    duplicate_scene(bpy.context, ref_scene, "SceneCopy", manifest)
+    duplicate(ref_scene, "SceneCopy", manifest)
 
     # Ensure constraint's target has been remapped
     assert manifest[obj].constraints[0].target == manifest[constraint.target]
 
 
-def test_scene_duplication_driver_remapping():
+def test_scene_duplication_driver_remapping(duplicate):
     ref_scene = bpy.context.scene
 
     obj = bpy.context.active_object
@@ -148,7 +172,7 @@ def test_scene_duplication_driver_remapping():
 
     # Duplicate the scene
     manifest = DuplicationManifest()
-    duplicate_scene(bpy.context, ref_scene, "SceneCopy", manifest)
+    duplicate(ref_scene, "SceneCopy", manifest)
 
     # Ensure duplicated driver's targets references have been remapped
     new_driver = manifest[obj].animation_data.drivers[0].driver
@@ -156,7 +180,7 @@ def test_scene_duplication_driver_remapping():
     assert new_driver.variables[1].targets[0].id == manifest[varB.targets[0].id]
 
 
-def test_scene_duplication_gp_modifier_and_effect_remapping():
+def test_scene_duplication_gp_modifier_and_effect_remapping(duplicate):
     ref_scene = bpy.context.scene
 
     # Create a GP object with modifier and FX referencing an object in the scene
@@ -169,13 +193,41 @@ def test_scene_duplication_gp_modifier_and_effect_remapping():
 
     # Duplicate the scene
     manifest = DuplicationManifest()
-    duplicate_scene(bpy.context, ref_scene, "SceneCopy", manifest)
+    duplicate(ref_scene, "SceneCopy", manifest)
 
     # Ensure GP modifier and effect's object references have been remapped
     assert manifest[obj].modifiers[0].object == manifest[mod.object]
     assert manifest[obj].shader_effects[0].object == manifest[fx.object]
 
 
+def test_pointer_properties_cache():
+    obj = bpy.context.active_object
+    constraint = obj.constraints.new(type="TRACK_TO")
+
+    prop_names = get_pointer_properties(constraint)
+    assert "target" in prop_names
+    # Pointer properties are computed once per RNA type
+    other_constraint = obj.constraints.new(type="TRACK_TO")
+    assert get_pointer_properties(other_constraint) is prop_names
+
+
+def test_scene_duplication_bulk_shared_data():
+    ref_scene = bpy.context.scene
+    # Instance the active object's data in another object
+    obj = bpy.context.active_object
+    instance = bpy.data.objects.new(name="Instance", object_data=obj.data)
+    ref_scene.collection.objects.link(instance)
+
+    manifest = DuplicationManifest()
+    new_scene = duplicate_scene_bulk(ref_scene, "SceneCopy", manifest)
+
+    # The window's scene is left untouched
+    assert bpy.context.window.scene == ref_scene
+    assert new_scene.camera == manifest[ref_scene.camera]
+    # Shared data is copied once, and shared between the duplicated objects
+    assert manifest[instance].data == manifest[obj].data != obj.data
+
+
 def test_scene_rename_empty_object():
     scene = bpy.context.scene
     # Create an object without data and add scene name to its name
@@ -228,10 +280,10 @@ def test_scene_rename_invalid_name():
         rename_scene(bpy.context.scene, ref_scene_name)
 
 
-def test_scene_delete_scene_duplicate():
+def test_scene_delete_scene_duplicate(duplicate):
     # Duplicate the default scene
     manifest = DuplicationManifest()
-    sceneA = duplicate_scene(bpy.context, bpy.context.scene, "SceneA", manifest)
+    sceneA = duplicate(bpy.context.scene, "SceneA", manifest)
 
     # Delete this new scene
     del_count = delete_scene(sceneA, True)
@@ -245,10 +297,10 @@ def test_scene_delete_scene_duplicate():
             getattr(datablock, "bl_rna")
 
 
-def test_scene_delete_scene_duplicate_with_shared_collection():
+def test_scene_delete_scene_duplicate_with_shared_collection(duplicate):
     # Duplicate default scene
     manifest = DuplicationManifest()
-    sceneA = duplicate_scene(bpy.context, bpy.context.scene, "SceneA", manifest)
+    sceneA = duplicate(bpy.context.scene, "SceneA", manifest)
     # Link a collection from the default scene into the new scene
     shared_col = bpy.context.scene.collection.children[0]
     sceneA.collection.children.link(shared_col)
@@ -266,6 +318,23 @@ def test_scene_delete_scene_duplicate_with_shared_collection():
     assert shared_col.bl_rna
 
 
+def test_scene_delete_multiple_scenes():
+    # Duplicate the default scene twice
+    manifestA = DuplicationManifest()
+    sceneA = duplicate_scene_bulk(bpy.context.scene, "SceneA", manifestA)
+    manifestB = DuplicationManifest()
+    sceneB = duplicate_scene_bulk(bpy.context.scene, "SceneB", manifestB)
+
+    # Delete both scenes at once
+    del_count = delete_scenes([sceneA, sceneB], True)
+
+    # Ensure by count that all created datablocks were deleted
+    assert del_count == len(manifestA) + len(manifestB)
+    for datablock in [*manifestA.values(), *manifestB.values()]:
+        with pytest.raises(ReferenceError):
+            getattr(datablock, "bl_rna")
+
+
 def test_shot_duration_adjust_positive_offset():
     # Create a shot
     sh1 = create_shot_scene(bpy.context.scene, 1, 1)
@@ -381,6 +450,56 @@ def test_shot_duration_adjust_with_multiple_shots():
     assert sh3.left_handle == sh2.right_handle
 
 
+def test_shot_duration_adjust_batch_reload():
+    scene = bpy.context.scene
+    sh1 = create_shot_scene(scene, 1, scene.frame_start)
+    sh2 = create_shot_scene(scene, 1, sh1.right_handle)
+    sh1.select = False
+    sh2.select = True
+
+    with batch_strip_reload():
+        # Extending shots beyond their scene range defers their reload
+        adjust_shot_duration(sh1, 10)
+        adjust_shot_duration(sh2, 10)
+        assert set(strip_reload_batches[-1].values()) == {sh1, sh2}
+        with batch_strip_reload():
+            adjust_shot_duration(sh2, 10)
+        assert len(strip_reload_batches) == 1
+
+    # Strips are reloaded when exiting the outermost block, restoring selection
+    assert not strip_reload_batches
+    assert not sh1.select and sh2.select
+    assert sh2.scene.frame_end == sh2.scene.frame_start + sh2.duration - 1
+    # Reloaded strips' content matches their extended scene range
+    for strip in (sh1, sh2):
+        scene_range = strip.scene.frame_end - strip.scene.frame_start + 1
+        assert strip.content_duration == scene_range
+
+
+def test_shot_ripple_edit():
+    scene = bpy.context.scene
+    sh1 = create_shot_scene(scene, 1, scene.frame_start)
+    sh2 = create_shot_scene(scene, 1, sh1.right_handle)
+    sh3 = create_shot_scene(scene, 1, sh2.right_handle)
+    # Witness strip on another channel
+    sh4 = create_shot_scene(scene, 2, sh2.right_handle)
+    strips = (sh2, sh3, sh4)
+    starts = [s.left_handle for s in strips]
+
+    # Only following strips on the same channel are shifted
+    ripple = RippleEdit(sh1)
+    assert ripple.strips == [sh2, sh3]
+    ripple.shift(10)
+    assert [s.left_handle - start for s, start in zip(strips, starts)] == [10, 10, 0]
+
+    # Shifts are relative to the original position
+    ripple.shift(3)
+    assert [s.left_handle - start for s, start in zip(strips, starts)] == [3, 3, 0]
+    ripple.shift(0)
+    assert [s.left_handle for s in strips] == starts
+    assert [s.channel for s in strips] == [1, 1, 2]
+
+
 def test_shot_slip_content_positive_offset():
     # Test strip
     sh1 = create_shot_scene(bpy.context.scene, 1, bpy.context.scene.frame_start)
@@ -459,3 +578,100 @@ def test_set_active_audition_switches_strip():
 
     assert meta.audition.active == other.name
     assert meta.audition.active != original_active
+
+
+def test_audition_hierarchy():
+    edit_scene = bpy.context.scene
+    sh1 = create_shot_scene(edit_scene, 1, 1)
+    sh2 = create_shot_scene(edit_scene, 2, 1)
+    new_audition_strip(bpy.context, [sh1, sh2])
+    sed = edit_scene.sequence_editor
+    audition = next(s for s in sed.strips if isinstance(s, bpy.types.MetaStrip))
+    # Nest the audition group in another meta strip
+    outer = make_meta_strip([audition], "OUTER", audition.left_handle, 5)
+
+    hierarchy = get_meta_hierarchy(sed)
+    assert hierarchy.parent_chain(sh1) == [audition, outer]
+    assert get_audition_strip(sh2) == audition
+    assert get_audition_strip(audition) == audition
+    assert get_audition_strip(outer) is None
+
+    # Active take is updated in the cached hierarchy, without rebuilding it
+    build_count = meta_hierarchy_cache.build_count
+    for take in (sh1, sh2):
+        set_active_audition(bpy.context, audition, take)
+        assert get_meta_hierarchy(sed).active_take(audition) == take
+        assert get_scene_strip_at_frame(sh1.left_handle, sed)[0] == take
+    assert meta_hierarchy_cache.build_count == build_count
+
+    # Unmuted takes are resolved from channels, as other meta strips
+    sh1.mute = False
+    assert get_scene_strip_at_frame(sh1.left_handle, sed)[0] == max(
+        (sh1, sh2), key=lambda s: s.channel
+    )
+
+
+def test_meta_hierarchy_ignores_unrelated_updates():
+    edit_scene = bpy.context.scene
+    sh1 = create_shot_scene(edit_scene, 1, 1)
+    sh2 = create_shot_scene(edit_scene, 1, sh1.right_handle)
+    sed = edit_scene.sequence_editor
+    get_meta_hierarchy(sed)
+    build_count = meta_hierarchy_cache.build_count
+
+    # Updates leaving the strips unchanged keep the cached hierarchy
+    sed.active_strip = sh2
+    sh1.scene.frame_current += 1
+    edit_scene.view_layers[0].depsgraph.update()
+    sh1.scene.view_layers[0].depsgraph.update()
+    get_meta_hierarchy(sed)
+    assert meta_hierarchy_cache.build_count == build_count
+
+    # Strip edits do not
+    sh2.mute = True
+    edit_scene.view_layers[0].depsgraph.update()
+    get_meta_hierarchy(sed)
+    assert meta_hierarchy_cache.build_count == build_count + 1
+
+
+def test_shot_catalogue():
+    shot_scene = bpy.data.scenes.new("SH0010")
+    for name in ("CAM_B", "CAM_A"):
+        camera = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+        shot_scene.collection.objects.link(camera)
+    empty_scene = bpy.data.scenes.new("EMPTY")
+
+    assert shot_scene in get_valid_shot_scenes()
+    assert empty_scene not in get_valid_shot_scenes()
+    assert [cam.name for cam in get_scene_cameras(shot_scene)] == ["CAM_A", "CAM_B"]
+
+    # Catalogues are served from the cache
+    build_count = shot_catalogue.build_count
+    get_valid_shot_scenes()
+    get_scene_cameras(shot_scene)
+    assert shot_catalogue.build_count == build_count
+
+    # Catalogues are rebuilt when scenes or their objects are added or removed
+    shot_scene.collection.objects.unlink(bpy.data.objects["CAM_B"])
+    assert [cam.name for cam in get_scene_cameras(shot_scene)] == ["CAM_A"]
+    new_scene = bpy.data.scenes.new("SH0020")
+    new_scene.collection.objects.link(bpy.data.objects["CAM_B"])
+    assert new_scene in get_valid_shot_scenes()
+
+    # Catalogues are rebuilt when scenes are renamed in or out of templates
+    prefix = get_addon_prefs().shot_template_prefix
+    new_scene.name = f"{prefix}SH0020"
+    assert new_scene not in get_valid_shot_scenes()
+    new_scene.name = "SH0020"
+    assert new_scene in get_valid_shot_scenes()
+
+    # Catalogues are rebuilt when objects are linked to scenes not being evaluated
+    empty_scene.collection.objects.link(bpy.data.objects["CAM_A"])
+    assert empty_scene in get_valid_shot_scenes()
+
+    # Catalogues do not keep references to deleted scenes replaced by new ones
+    bpy.data.scenes.remove(new_scene)
+    other_scene = bpy.data.scenes.new("SH0030")
+    other_scene.collection.objects.link(bpy.data.objects["CAM_B"])
+    names = [s.name for s in get_valid_shot_scenes()]
+    assert "SH0030" in names and "SH0020" not in names
@@ -5,7 +5,12 @@ import pytest
 
 import bpy
 
-from spa_sequencer.shot.naming import ShotNaming, ShotPrefix
+from spa_sequencer.shot.naming import (
+    ShotNameAllocator,
+    ShotNameData,
+    ShotNaming,
+    ShotPrefix,
+)
 from spa_sequencer.shot.core import duplicate_scene
 
 
@@ -93,6 +98,30 @@ def test_get_new_shot_name_alt_naming():
     assert naming.default_shot_name() == "SHOT_000"
 
 
+def test_shot_regex_follows_configuration():
+    naming = ShotNaming()
+    naming.prefixes = ["SH"]
+    assert naming.match_name("SH0010")
+
+    # The compiled regex is rebuilt when the configuration changes
+    naming.separator = "_"
+    assert not naming.match_name("SH0010")
+    assert naming.match_name("SH_0010")
+    naming.prefixes.append("SHOT")
+    assert naming.match_name("SHOT_0010")
+
+
+def test_parse_many_shot_names():
+    names = ["SH0010", "PSH0020A", "SH10", "SHOT"]
+    assert shot_naming.parse_many(names) == [
+        ShotNameData("SH", 10, ""),
+        ShotNameData("PSH", 20, "A"),
+        None,
+        None,
+    ]
+    assert shot_naming.validate_many(names) == [True, True, False, False]
+
+
 def test_get_new_shot_name_no_shot_scene():
     # Rename scene to something that is not a shot
     bpy.context.scene.name = "TEST"
@@ -125,3 +154,25 @@ def test_get_new_shot_name_increment_highest_shot_number():
     new_shot_name = shot_naming.next_shot_name_from_scenes()
     # Next shot should add spacing.
     assert new_shot_name == "SH0030"
+
+
+def test_shot_name_allocator():
+    scene = bpy.context.scene
+    sed = scene.sequence_editor_create()
+    shot_scene = bpy.data.scenes.new("SHOT")
+    for name in ("SH0010", "SH0025", "PSH0100", "NOT_A_SHOT"):
+        sed.strips.new_scene(name, shot_scene, 1, len(sed.strips) * 10 + 1)
+
+    allocator = ShotNameAllocator(shot_naming, sed)
+    names = []
+    for _ in range(3):
+        # Allocated names match the next names from the sequence editor
+        name = allocator.next_name()
+        assert name == shot_naming.next_shot_name_from_sequences(sed)
+        sed.strips.new_scene(name, shot_scene, 2, len(sed.strips) * 10 + 1)
+        names.append(name)
+    assert names == ["SH0030", "SH0040", "SH0050"]
+
+    # Shots created by other means are taken into account
+    allocator.add("SH0100")
+    assert allocator.next_name() == "SH0110"
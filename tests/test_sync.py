@@ -2,10 +2,34 @@
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
 import bpy
+import json
+import os
+import tempfile
 
 from pytest import fixture
 
-from spa_sequencer.sync.core import remap_frame_value, get_sync_settings, set_grease_pencil_brush
+from spa_sequencer.sync.core import (
+    flush_coalesced_scrub,
+    flush_deferred_sync_updates,
+    flush_lazy_evaluation,
+    get_master_scene_strip_at_frame,
+    get_scene_strip_at_frame,
+    get_sync_master_strip,
+    get_sync_settings,
+    gp_tool_settings,
+    lazy_eval_state,
+    playback_state,
+    remap_frame_value,
+    scrub_state,
+    set_grease_pencil_brush,
+    window_sync_state,
+)
+from spa_sequencer.sync.index import master_strip_index
+from spa_sequencer.sync.prefetch import process_prefetch_queue, scene_prefetcher
+from spa_sequencer.sync.profiler import sync_profiler
+from spa_sequencer.sync.replay import replay_trace
+from spa_sequencer.sync.sync_map import compute_sync_map
+from spa_sequencer.sync.trace import load_trace, sync_trace_recorder
 from spa_sequencer.shot.core import make_meta_strip
 
 from utils import create_shot_scene
@@ -216,6 +240,43 @@ def test_keep_gp_toolsettings_interaction_mode(basic_synced_setup):
     assert gpencil_shot_1.mode == gpencil_shot_3.mode == interaction_mode
 
 
+def test_gp_tool_settings_snapshot(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    get_sync_settings().keep_gpencil_tool_settings = True
+
+    # Both shots have an active GP object in paint mode
+    for strip in (shot_strip_1, shot_strip_2):
+        bpy.context.window.scene = strip.scene
+        bpy.ops.object.grease_pencil_add(type="MONKEY")
+        bpy.ops.object.mode_set(mode="PAINT_GREASE_PENCIL")
+    pencil = bpy.data.brushes["Pencil"]
+    bpy.context.window.scene = shot_strip_1.scene
+    set_grease_pencil_brush(bpy.context, pencil)
+
+    bpy.context.window.scene = edit_scene
+    edit_scene.frame_set(shot_strip_1.left_handle)
+
+    sync_settings = get_sync_settings()
+    sync_profiler.reset()
+    sync_settings.profiling = True
+    try:
+        edit_scene.frame_set(shot_strip_2.left_handle)
+    finally:
+        sync_settings.profiling = False
+
+    # Settings are captured from shot 1, then only changed values are applied
+    counters = sync_profiler.counters
+    assert counters["gp_snapshot_captures"] == 1
+    assert gp_tool_settings.paint_settings["brush"] == pencil
+    assert gp_tool_settings.scene_uid == shot_strip_2.scene.session_uid
+    assert shot_strip_2.scene.tool_settings.gpencil_paint.brush == pencil
+    assert counters["gp_settings_writes_skipped"] > 0
+    # Shot 2's object is already in paint mode
+    assert counters["gp_mode_sets_skipped"] == 1
+    assert not counters["gp_mode_sets"]
+
+
 def test_bidirectional_within_shot_range(basic_synced_setup):
     edit_scene, shot_strip_1 = basic_synced_setup
 
@@ -385,4 +446,390 @@ def test_strip_jump_previous(basic_synced_setup):
     shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.frame_final_start)
     
     edit_scene.frame_set(shot_strip_2.frame_final_start)
-    assert edit_scene.sequence_editor.active_strip == shot_strip_2
\ No newline at end of file
+    assert edit_scene.sequence_editor.active_strip == shot_strip_2
+
+def test_master_index_matches_linear_lookup(complex_synced_setup):
+    """Ensure the master timeline index resolves the same strips as a linear scan."""
+    edit_scene, shots = complex_synced_setup
+    sed = edit_scene.sequence_editor
+
+    # Shorten upper strips to create staggered overlaps
+    shots[3].duration = 20
+    shots[2].duration = 60
+    # Add a strip after a gap, nested in a meta strip
+    shot_5 = create_shot_scene(edit_scene, 1, shots[0].right_handle + 10)
+    make_meta_strip([shot_5], "META", shot_5.left_handle, 5)
+    # Mute a channel and a strip
+    sed.channels[2].mute = True
+    shots[2].mute = True
+
+    for frame in range(-5, shot_5.right_handle + 5):
+        assert get_master_scene_strip_at_frame(
+            frame, edit_scene
+        ) == get_scene_strip_at_frame(frame, sed)
+
+
+def test_master_index_rebuilds_on_strip_changes(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    frame = shot_strip_1.right_handle + 1
+
+    assert get_master_scene_strip_at_frame(frame, edit_scene)[0] is None
+    build_count = master_strip_index.build_count
+
+    # Lookups on an unchanged timeline do not rebuild the index
+    get_master_scene_strip_at_frame(frame, edit_scene)
+    assert master_strip_index.build_count == build_count
+
+    # Extending the strip makes it available at that frame, once the depsgraph
+    # update handler flagged the edit
+    shot_strip_1.duration += 10
+    edit_scene.view_layers[0].depsgraph.update()
+    assert get_master_scene_strip_at_frame(frame, edit_scene)[0] == shot_strip_1
+    assert master_strip_index.build_count == build_count + 1
+
+
+def test_master_index_ignores_unrelated_updates(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    edit_scene.frame_set(shot_strip_1.left_handle)
+    edit_scene.view_layers[0].depsgraph.update()
+    generation = master_strip_index.generation
+
+    # Updates of other scenes do not invalidate the index
+    shot_strip_1.scene.frame_current += 1
+    shot_strip_1.scene.view_layers[0].depsgraph.update()
+    assert master_strip_index.generation == generation
+
+    # Neither do the writes of the synchronization to the master scene, flushed
+    # after the frame change handler returned
+    edit_scene.frame_set(shot_strip_2.left_handle)
+    edit_scene.sequence_editor.active_strip = shot_strip_2
+    edit_scene.view_layers[0].depsgraph.update()
+    assert master_strip_index.generation == generation
+
+    # Timing edits of the master scene's strips do
+    shot_strip_2.duration += 10
+    edit_scene.view_layers[0].depsgraph.update()
+    assert master_strip_index.generation > generation
+
+
+def test_flush_deferred_sync_updates(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    edit_scene.frame_set(shot_strip_2.left_handle)
+
+    # Simulate updates deferred during playback
+    edit_scene.sequence_editor.active_strip = shot_strip_1
+    shot_strip_2.scene.use_preview_range = False
+    playback_state.pending_updates.update(("active_strip", "preview_range"))
+
+    flush_deferred_sync_updates(bpy.context)
+    assert not playback_state.pending_updates
+    assert edit_scene.sequence_editor.active_strip == shot_strip_2
+    assert shot_strip_2.scene.use_preview_range
+    assert shot_strip_2.scene.frame_preview_start == shot_strip_2.scene.frame_start
+
+
+def test_workspace_time_sync_disabled_once(basic_synced_setup):
+    edit_scene, shot_strip = basic_synced_setup
+    windows = bpy.context.window_manager.windows
+    # Enabling the system disables time synchronization in workspaces
+    assert not any(window.workspace.use_scene_time_sync for window in windows)
+
+    # Synchronization updates do not write workspace settings anymore
+    for window in windows:
+        window.workspace.use_scene_time_sync = True
+    for frame in range(shot_strip.left_handle, shot_strip.left_handle + 5):
+        edit_scene.frame_set(frame)
+    assert all(window.workspace.use_scene_time_sync for window in windows)
+
+    # Re-enabling the system applies the setting again
+    sync_settings = get_sync_settings()
+    sync_settings.enabled = False
+    sync_settings.enabled = True
+    assert not any(window.workspace.use_scene_time_sync for window in windows)
+
+
+def test_playback_dropped_frames_stats():
+    playback_state.reset_stats()
+    for offset in (1, 1, 3, 1, -100, 2):
+        playback_state.record_frame(offset)
+    assert playback_state.frames == 6
+    assert playback_state.dropped_frames == 3
+
+
+def test_prefetch_upcoming_scenes(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    shot_strip_2.duration = 5
+    shot_strip_3 = create_shot_scene(edit_scene, 1, shot_strip_2.right_handle)
+    shot_strip_2.scene.frame_current = 100
+    shot_strip_3.scene.frame_current = 100
+
+    sync_settings = get_sync_settings()
+    sync_settings.prefetch_frames = 10
+    sync_settings.prefetch_max_scenes = 1
+    frame = shot_strip_2.left_handle - 5
+    edit_scene.frame_set(frame)
+
+    assert master_strip_index.upcoming(
+        edit_scene.sequence_editor, frame + 1, frame + 10
+    ) == [
+        (shot_strip_2.left_handle, shot_strip_2),
+        (shot_strip_3.left_handle, shot_strip_3),
+    ]
+
+    # Only the next scene is evaluated, within the warm scenes limit
+    scene_prefetcher.clear()
+    scene_prefetcher.schedule(bpy.context, edit_scene)
+    while process_prefetch_queue() is not None:
+        pass
+    assert shot_strip_2.scene.frame_current == shot_strip_2.scene.frame_start
+    assert shot_strip_3.scene.frame_current == 100
+    assert list(scene_prefetcher.warmed) == [shot_strip_2.scene.name]
+
+    # Switching to the prefetched scene does not change its time anymore
+    edit_scene.frame_set(shot_strip_2.left_handle)
+    assert bpy.context.window.scene == shot_strip_2.scene
+    assert shot_strip_2.scene.frame_current == shot_strip_2.scene.frame_start
+
+
+def test_profiler_records_sync_updates(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+
+    sync_settings = get_sync_settings()
+    sync_profiler.reset()
+    sync_settings.profiling = True
+    try:
+        edit_scene.frame_set(shot_strip_1.left_handle + 1)
+        edit_scene.frame_set(shot_strip_2.left_handle)
+    finally:
+        sync_settings.profiling = False
+
+    record_count = len(sync_profiler.records)
+    assert record_count >= 2
+    assert all(r.name == "sync_system_update" for r in sync_profiler.records)
+    phases = {name for r in sync_profiler.records for name, _, _ in r.phases}
+    assert {"strip_lookup", "scene_switch"} <= phases
+    # Switches from the edit scene to the first shot, then to the second shot
+    assert sync_profiler.counters["scene_switches"] == 2
+    assert sum(sync_profiler.histogram()) == record_count
+
+    # Disabled profiler does not record anything
+    edit_scene.frame_set(shot_strip_1.left_handle)
+    assert len(sync_profiler.records) == record_count
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for file_format in ("JSON", "CHROME_TRACE"):
+            filepath = os.path.join(tmpdir, f"{file_format}.json")
+            sync_profiler.export(filepath, file_format)
+            with open(filepath) as f:
+                data = json.load(f)
+            if file_format == "JSON":
+                assert data["summary"]["calls"] == record_count
+            else:
+                assert len(data["traceEvents"]) == record_count + len(
+                    [p for r in sync_profiler.records for p in r.phases]
+                )
+
+
+def test_flush_coalesced_scrub(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    edit_scene.frame_set(shot_strip_1.left_handle)
+    assert bpy.context.window.scene == shot_strip_1.scene
+
+    # Simulate a scene switch coalesced while scrubbing: master time and cached
+    # values are updated, but the window still displays the previous scene.
+    edit_scene.frame_current = shot_strip_2.left_handle + 2
+    get_sync_settings().last_master_frame = edit_scene.frame_current
+    scrub_state.window = bpy.context.window
+
+    flush_coalesced_scrub()
+    assert scrub_state.window is None
+    assert bpy.context.window.scene == shot_strip_2.scene
+    assert shot_strip_2.scene.frame_current == shot_strip_2.scene.frame_start + 2
+
+
+def test_lazy_evaluation_state(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+
+    # Consecutive events raise the event rate
+    lazy_eval_state.reset()
+    assert lazy_eval_state.record_event() == 0.0
+    assert lazy_eval_state.record_event() > 0.0
+    lazy_eval_state.reset()
+    assert lazy_eval_state.rate == 0.0
+
+    # Deferred evaluations leave the scene untouched until they are flushed
+    shot_scene = shot_strip_1.scene
+    evaluations = []
+
+    def on_frame_change(scene, depsgraph):
+        if scene == shot_scene:
+            evaluations.append(scene.frame_current)
+
+    bpy.app.handlers.frame_change_post.append(on_frame_change)
+    try:
+        skipped = lazy_eval_state.skipped_evaluations
+        frame = shot_scene.frame_current + 10
+        lazy_eval_state.defer_evaluation(shot_scene, frame, 24.0)
+        assert lazy_eval_state.skipped_evaluations == skipped + 1
+        assert shot_scene.frame_current == frame - 10
+        assert evaluations == []
+
+        flush_lazy_evaluation()
+        lazy_eval_state.cancel()
+        assert lazy_eval_state.pending_scene == ""
+        assert shot_scene.frame_current == frame
+        assert evaluations == [frame]
+    finally:
+        bpy.app.handlers.frame_change_post.remove(on_frame_change)
+
+
+def test_master_strip_cache(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    edit_scene.frame_set(shot_strip_1.left_handle)
+
+    sync_settings = get_sync_settings()
+    sync_profiler.reset()
+    sync_settings.profiling = True
+    try:
+        assert get_sync_master_strip(use_cache=True)[0] == shot_strip_1
+        assert get_sync_master_strip(use_cache=True)[0] == shot_strip_1
+        assert sync_profiler.counters["master_strip_hits"] == 1
+        assert sync_profiler.counters["master_strip_misses"] == 1
+
+        # Timeline changes invalidate the cache
+        master_strip_index.invalidate()
+        assert get_sync_master_strip(use_cache=True)[0] == shot_strip_1
+        assert sync_profiler.counters["master_strip_misses"] == 2
+
+        # So do synchronization updates to another strip
+        edit_scene.frame_set(shot_strip_2.left_handle)
+        assert get_sync_master_strip(use_cache=True)[0] == shot_strip_2
+    finally:
+        sync_settings.profiling = False
+
+
+def test_window_sync_state(basic_synced_setup):
+    edit_scene, shot_strip = basic_synced_setup
+    window = bpy.context.window
+    sync_settings = get_sync_settings()
+
+    sync_profiler.reset()
+    sync_settings.profiling = True
+    try:
+        edit_scene.frame_set(shot_strip.left_handle)
+        assert window.scene == shot_strip.scene
+        assert window_sync_state.is_synced(
+            window, window.scene, window_sync_state.make_state(shot_strip)
+        )
+        # Window already shows the strip's scene: it is skipped
+        edit_scene.frame_set(shot_strip.left_handle + 1)
+        assert sync_profiler.counters["skipped_windows"] == 1
+        assert sync_profiler.counters["scene_switches"] == 1
+
+        # Window showing another scene is synchronized again
+        window.scene = edit_scene
+        edit_scene.frame_set(shot_strip.left_handle + 2)
+        assert window.scene == shot_strip.scene
+        assert sync_profiler.counters["scene_switches"] == 2
+    finally:
+        sync_settings.profiling = False
+
+
+def test_record_and_replay_trace(basic_synced_setup):
+    edit_scene, shot_strip_1 = basic_synced_setup
+    shot_strip_2 = create_shot_scene(edit_scene, 1, shot_strip_1.right_handle)
+    frames = (shot_strip_1.left_handle, shot_strip_2.left_handle + 2, 1000)
+
+    sync_trace_recorder.start(get_sync_settings())
+    try:
+        for frame in frames:
+            edit_scene.frame_set(frame)
+    finally:
+        sync_trace_recorder.stop()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, "trace.json")
+        sync_trace_recorder.write(filepath)
+        trace = load_trace(filepath)
+
+    assert trace["master_scene"] == edit_scene.name
+    assert trace["columns"]["master_frame"] == list(frames)
+    assert trace["columns"]["playing"] == [0, 0, 0]
+
+    # Replay from another state of the file
+    bpy.context.window.scene = edit_scene
+    edit_scene.frame_current = 0
+    result = replay_trace(bpy.context, trace)
+    assert len(result.latencies_ms) == len(frames)
+    assert result.summary()["events"] == len(frames)
+    assert bpy.context.window.scene == shot_strip_2.scene
+    assert shot_strip_2.scene.frame_current == remap_frame_value(
+        shot_strip_2.left_handle + 2, shot_strip_2
+    )
+
+
+def test_sync_map_matches_strip_lookup(complex_synced_setup):
+    edit_scene, shots = complex_synced_setup
+    sed = edit_scene.sequence_editor
+    shots[3].duration = 20
+    shots[2].mute = True
+    shot_5 = create_shot_scene(edit_scene, 1, shots[0].right_handle + 10)
+    make_meta_strip([shot_5], "META", shot_5.left_handle, 5)
+
+    frame_start, frame_end = -5, shot_5.right_handle + 5
+    sync_map = compute_sync_map(edit_scene, frame_start, frame_end)
+    assert len(sync_map) == frame_end - frame_start + 1
+
+    for frame in range(frame_start, frame_end + 1):
+        strip, inner_frame = get_scene_strip_at_frame(frame, sed)
+        if strip:
+            camera = strip.scene_camera or strip.scene.camera
+            assert sync_map.row(frame) == (
+                strip.name,
+                strip.scene.name,
+                inner_frame,
+                camera.name if camera else None,
+            )
+        else:
+            assert sync_map.row(frame) == (None, None, -1, None)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for file_format in ("NPY", "CSV", "JSON"):
+            filepath = os.path.join(tmpdir, f"sync_map.{file_format.lower()}")
+            sync_map.write(filepath, file_format)
+            assert os.path.exists(filepath)
+        assert os.path.exists(os.path.join(tmpdir, "sync_map.tables.json"))
+
+
+def test_sync_map_camera_markers(basic_synced_setup):
+    edit_scene, shot_strip = basic_synced_setup
+    shot_scene = shot_strip.scene
+    cameras = []
+    for name in ("CAM_A", "CAM_B"):
+        camera = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+        shot_scene.collection.objects.link(camera)
+        cameras.append(camera)
+    shot_scene.camera = cameras[0]
+    # Switch to CAM_B 10 frames after the start of the shot, and back to CAM_A
+    for offset, camera in ((10, cameras[1]), (20, cameras[0])):
+        marker = shot_scene.timeline_markers.new(camera.name, frame=0)
+        marker.frame = remap_frame_value(shot_strip.left_handle + offset, shot_strip)
+        marker.camera = camera
+
+    start = shot_strip.left_handle
+    sync_map = compute_sync_map(edit_scene, start, start + 30)
+    # Frames before the first marker use its camera
+    offsets = (0, 9, 10, 19, 20)
+    expected = ["CAM_B"] * 4 + ["CAM_A"]
+    assert [sync_map.row(start + offset)[3] for offset in offsets] == expected
+
+    # The strip camera overrides camera markers
+    shot_strip.scene_camera = cameras[0]
+    sync_map = compute_sync_map(edit_scene, start, start + 30)
+    assert {sync_map.row(start + offset)[3] for offset in range(31)} == {"CAM_A"}
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2023, The SPA Studios. All rights reserved.
+
+import bpy
+
+from pytest import fixture
+
+from spa_sequencer.timeline import TimelineSnapshot
+
+from utils import create_shot_scene
+
+
+@fixture
+def edit_scene() -> bpy.types.Scene:
+    """
+    Generate an edit scene with overlapping shot strips on several channels,
+    one of them muted, and a color strip.
+    """
+    edit_scene = bpy.context.scene
+    edit_scene.name = "EDIT"
+    edit_scene.sequence_editor_create()
+
+    for idx in range(6):
+        strip = create_shot_scene(edit_scene, 1 + idx % 3, 1 + idx * 40)
+        strip.duration = 60
+    edit_scene.sequence_editor.strips_all[2].mute = True
+    edit_scene.sequence_editor.strips.new_effect(
+        name="COLOR", type="COLOR", channel=5, frame_start=10, length=20
+    )
+    return edit_scene
+
+
+def test_snapshot_columns_match_strips(edit_scene):
+    strips = edit_scene.sequence_editor.strips_all
+    snapshot = TimelineSnapshot(strips)
+
+    assert len(snapshot) == len(strips)
+    assert snapshot.left.tolist() == [s.left_handle for s in strips]
+    assert snapshot.right.tolist() == [s.right_handle for s in strips]
+    assert snapshot.channel.tolist() == [s.channel for s in strips]
+    assert snapshot.mute.tolist() == [s.mute for s in strips]
+    assert snapshot.column("select", bool).tolist() == [s.select for s in strips]
+    # Snapshots built from a list of strips hold the same values.
+    assert TimelineSnapshot(list(strips)).fingerprint() == snapshot.fingerprint()
+
+
+def test_snapshot_type_mask(edit_scene):
+    strips = edit_scene.sequence_editor.strips_all
+    type_filters = (
+        bpy.types.SceneStrip,
+        bpy.types.EffectStrip,
+        (bpy.types.MetaStrip, bpy.types.ColorStrip),
+    )
+    # Strip collections are read by type enum values, lists by type identifiers.
+    for snapshot in (TimelineSnapshot(strips), TimelineSnapshot(list(strips))):
+        for type_filter in type_filters:
+            assert snapshot.type_mask(type_filter).tolist() == [
+                isinstance(s, type_filter) for s in strips
+            ]
+
+
+def test_snapshot_at_frame(edit_scene):
+    strips = edit_scene.sequence_editor.strips_all
+    snapshot = TimelineSnapshot(strips)
+
+    for frame in range(0, 260):
+        for skip_muted in (True, False):
+            expected = [
+                s
+                for s in strips
+                if isinstance(s, bpy.types.SceneStrip)
+                and (not skip_muted or not s.mute)
+                and s.left_handle <= frame < s.right_handle
+            ]
+            indices = snapshot.at_frame(frame, bpy.types.SceneStrip, skip_muted)
+            assert snapshot.strips(indices) == expected
+
+
+def test_snapshot_orders_and_overlaps(edit_scene):
+    strips = edit_scene.sequence_editor.strips_all
+    snapshot = TimelineSnapshot(strips)
+
+    assert snapshot.strips(snapshot.sorted_by_start()) == sorted(
+        strips, key=lambda s: s.left_handle
+    )
+    assert snapshot.strips(snapshot.channel_order()) == sorted(
+        strips, key=lambda s: (s.channel, s.left_handle)
+    )
+
+    expected = {
+        frozenset((a.name, b.name))
+        for a in strips
+        for b in strips
+        if a != b and a.left_handle < b.right_handle and b.left_handle < a.right_handle
+    }
+    pairs = {
+        frozenset(s.name for s in snapshot.strips(pair))
+        for pair in snapshot.overlaps()
+    }
+    assert pairs == expected
+    assert len(snapshot.overlaps()) == len(expected)